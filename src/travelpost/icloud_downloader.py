@@ -12,6 +12,7 @@ import pathlib
 import sys
 import threading
 import time
+from typing import Any, Literal
 
 import click
 from pyicloud import PyiCloudService
@@ -62,6 +63,46 @@ class Checkpoint:
                 json.dump(self._records, f, indent=2)
 
 
+class MetadataDataset:
+    def __init__(
+        self,
+        path: pathlib.Path | str,
+        filename: str = "metadata.jsonl",
+        flush_size: int = 1000,
+    ) -> None:
+        self._lock = threading.Lock()
+
+        self._path = pathlib.Path(path)
+        self._path.mkdir(exist_ok=True, parents=True)
+        self._dataset = self._path / filename
+        self._flush_size = flush_size
+        self._buffer: list[dict[str, Any]] = []
+
+    @property
+    def path(self) -> pathlib.Path:
+        return self._dataset
+
+    def _flush(self) -> None:
+        if len(self._buffer) == 0:
+            return
+        with open(self._dataset, mode="a", encoding="utf-8") as f:
+            f.writelines(
+                json.dumps(r, default=str, sort_keys=True) + "\n"
+                for r in self._buffer
+            )
+        self._buffer.clear()
+
+    def add(self, record: dict[str, Any]) -> None:
+        with self._lock:
+            self._buffer.append(record)
+            if len(self._buffer) >= self._flush_size:
+                self._flush()
+
+    def flush(self) -> None:
+        with self._lock:
+            self._flush()
+
+
 class ProgressBar:
     WIDTH: int = 40
     _i = -1
@@ -389,7 +430,22 @@ class ICloudDownloader(ICloudIterable):
         keys: set[str] | None = None,
         start_date: datetime.datetime | None = None,
         end_date: datetime.datetime | None = None,
+        # "json" writes one file per photo/video into its date folder, "jsonl"
+        # appends all records to one dataset (see `MetadataDataset`).
+        output: Literal["json", "jsonl"] = "json",
+        flush_size: int = 1000,
     ) -> None:
+        if output not in {"json", "jsonl"}:
+            msg = f"invalid output: {output!r:s}"
+            raise ValueError(msg)
+        dataset = (
+            MetadataDataset(self._path, flush_size=flush_size)
+            if output == "jsonl"
+            else None
+        )
+        # Checkpoint per output, records of one output are missing in the other
+        version = "metadata" if dataset is None else "metadata_jsonl"
+
         if keys is None:
             keys = {
                 "id",
@@ -420,7 +476,7 @@ class ICloudDownloader(ICloudIterable):
             if self._stop_event.is_set():
                 return
 
-            path = self._checkpoint.get("metadata", photo.id)
+            path = self._checkpoint.get(version, photo.id)
             downloaded = path.exists() if path else False
             if downloaded:
                 return
@@ -433,7 +489,14 @@ class ICloudDownloader(ICloudIterable):
                 if v:
                     metadata[k] = v
 
-            if metadata:
+            if not metadata:
+                return
+
+            if dataset is not None:
+                metadata["id"] = photo.id
+                dataset.add(metadata)
+                self._checkpoint.add(version, photo.id, dataset.path)
+            else:
                 created = photo.created.strftime("%Y-%m-%d")
                 if created == "1970-01-01":
                     created = "no-date"
@@ -445,7 +508,7 @@ class ICloudDownloader(ICloudIterable):
                     json.dump(
                         metadata, f, indent=2, default=str, sort_keys=True
                     )
-                self._checkpoint.add("metadata", photo.id, path)
+                self._checkpoint.add(version, photo.id, filename)
 
         photo_iter = self.iter(
             album=album,
@@ -489,6 +552,8 @@ class ICloudDownloader(ICloudIterable):
                 msg = "Aborted"
             else:
                 msg = "Downloaded metadata of all photos and videos."
+            if dataset is not None:
+                dataset.flush()
             self._checkpoint.save()
             logger.info(msg)
 
@@ -546,6 +611,16 @@ def main() -> None:
         required=False,
         help="Whether to just download the metadata",
     )
+    parser.add_argument(
+        "--metadata-output",
+        choices=["json", "jsonl"],
+        default="json",
+        required=False,
+        help=(
+            "Metadata output: one json file per photo/video or one "
+            "'metadata.jsonl' dataset (defaults to 'json')"
+        ),
+    )
     parser.add_argument(
         "--log-level",
         default="INFO",
@@ -564,12 +639,19 @@ def main() -> None:
         password=args.password,
         path=args.download_folder or "data/iCloud",
     )
-    meth = getattr(downloader, "sync_metadata" if args.metadata else "sync")
-    meth(
-        album=args.album or "all",
-        start_date=args.start_date,
-        end_date=args.end_date,
-    )
+    if args.metadata:
+        downloader.sync_metadata(
+            album=args.album or "all",
+            start_date=args.start_date,
+            end_date=args.end_date,
+            output=args.metadata_output,
+        )
+    else:
+        downloader.sync(
+            album=args.album or "all",
+            start_date=args.start_date,
+            end_date=args.end_date,
+        )
 
 
 if __name__ == "__main__":
@@ -15,8 +15,10 @@ from travelpost.readers.fp.types_ import URL
 from travelpost.readers.fp.utils import requests
 from travelpost.utils.dataclass_json_mixin import DataclassJsonMixin
 from travelpost.utils.dataclass_tz_mixin import DataclassTzMixin
-from travelpost.utils.thumbnails import image_thumbnail
-from travelpost.utils.thumbnails import video_thumbnail
+from travelpost.utils.thumbnails import ThumbnailFit
+from travelpost.utils.thumbnails import ThumbnailSpec
+from travelpost.utils.thumbnails import is_supported
+from travelpost.utils.thumbnails import thumbnail_cache
 
 THUMBNAIL_SIZE: int = 128
 logger = logging.getLogger(__name__)
@@ -125,26 +127,19 @@ class Medium(DataclassJsonMixin):
 
     @property
     def thumbnail_path(self) -> pathlib.Path | None:
-        if self.path.suffix.lower() not in (".jpeg", ".jpg", ".mp4", ".png"):
+        return self.thumbnail()
+
+    def thumbnail(
+        self,
+        size: int = THUMBNAIL_SIZE,
+        fit: ThumbnailFit = "cover",
+    ) -> pathlib.Path | None:
+        """Returns the thumbnail path of the (loaded) medium, see
+        `thumbnail_cache`.
+        """
+        if self.path is None or not is_supported(self.path):
             return None
-        thumbnail_path = self.path.with_name(f"{self.path.stem:s}-thumb.jpg")
-        if not thumbnail_path.exists():
-            if self.path.suffix.lower() in (".jpeg", ".jpg", ".png"):
-                image_thumbnail(
-                    self.path,
-                    thumbnail_path,
-                    THUMBNAIL_SIZE,
-                    fit="cover",
-                )
-            else:
-                video_thumbnail(
-                    self.path,
-                    thumbnail_path,
-                    THUMBNAIL_SIZE,
-                    fit="cover",
-                    frame="middle",
-                )
-        return thumbnail_path
+        return thumbnail_cache.get(self.path, size, fit=fit)
 
 
 @dataclasses.dataclass(kw_only=True)
@@ -325,6 +320,28 @@ class Blog(DataclassJsonMixin):
             }
         )
 
+    def create_thumbnails(
+        self,
+        specs: Sequence[ThumbnailSpec] = ((THUMBNAIL_SIZE, "cover"),),
+        max_workers: int | None = None,
+    ) -> int:
+        """Creates the thumbnails of the cover photo and all loaded post media
+        in parallel, see `thumbnail_cache`.
+        """
+        media = (
+            self.cover_photo,
+            *(m for p in self.posts for m in p.media.values()),
+        )
+        return thumbnail_cache.generate(
+            (
+                m.path
+                for m in media
+                if m.path is not None and is_supported(m.path)
+            ),
+            specs,
+            max_workers=max_workers,
+        )
+
     def load_cover_photo(self, path: str = ".") -> pathlib.Path:
         name = self.cover_photo.name
         path = pathlib.Path(path) / "cover-photo"
@@ -0,0 +1,5 @@
+"""iCloud Reader."""
+
+from travelpost.readers.icloud.metadata import MetadataReader
+
+__all__ = ("MetadataReader",)
@@ -0,0 +1,31 @@
+"""Metadata Reader."""
+
+import pandas as pd
+
+from travelpost.readers.abc import ReaderABC
+
+
+class MetadataReader(ReaderABC):
+    """Reads the 'metadata.jsonl' dataset of `ICloudDownloader.sync_metadata`
+    in one call.
+    """
+
+    DATE_COLUMNS: tuple[str, ...] = ("asset_date", "live_photo_time")
+
+    def read(self) -> pd.DataFrame:
+        df = pd.read_json(self._path, lines=True, convert_dates=False)
+        if len(df) == 0:
+            return df
+
+        # An aborted sync can append a record again on the next run.
+        df = df.drop_duplicates(subset="id", keep="last")
+        for date_c in self.DATE_COLUMNS:
+            if date_c in df:
+                df[date_c] = pd.to_datetime(df[date_c], format="ISO8601")
+        if "asset_date" in df:
+            df = df.sort_values(by=["asset_date", "id"])
+        return df.reset_index(drop=True)
+
+
+if __name__ == "__main__":
+    print(MetadataReader("data/iCloud/metadata.jsonl").read())
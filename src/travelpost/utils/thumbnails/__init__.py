@@ -1,6 +1,19 @@
 """Thumbnail Utils."""
 
+from travelpost.utils.thumbnails.cache import ThumbnailCache
+from travelpost.utils.thumbnails.cache import ThumbnailFit
+from travelpost.utils.thumbnails.cache import ThumbnailSpec
+from travelpost.utils.thumbnails.cache import is_supported
+from travelpost.utils.thumbnails.cache import thumbnail_cache
 from travelpost.utils.thumbnails.image import image_thumbnail
 from travelpost.utils.thumbnails.video import video_thumbnail
 
-__all__ = ("image_thumbnail", "video_thumbnail")
+__all__ = (
+    "ThumbnailCache",
+    "ThumbnailFit",
+    "ThumbnailSpec",
+    "image_thumbnail",
+    "is_supported",
+    "thumbnail_cache",
+    "video_thumbnail",
+)
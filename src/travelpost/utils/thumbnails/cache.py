@@ -0,0 +1,269 @@
+"""Thumbnail Cache."""
+
+from collections.abc import Iterable, Sequence
+import concurrent.futures
+import hashlib
+import json
+import logging
+import os
+import pathlib
+import threading
+from typing import Any, Literal
+
+from travelpost.utils.thumbnails.image import image_thumbnail
+from travelpost.utils.thumbnails.video import video_thumbnail
+
+type ThumbnailFit = Literal["cover", "contain"]
+type ThumbnailSpec = tuple[int, ThumbnailFit]
+
+IMAGE_SUFFIXES: frozenset[str] = frozenset((".heic", ".jpeg", ".jpg", ".png"))
+VIDEO_SUFFIXES: frozenset[str] = frozenset((".mov", ".mp4"))
+
+logger = logging.getLogger(__name__)
+
+
+def is_supported(path: pathlib.Path) -> bool:
+    """Returns whether a thumbnail can be created of the file."""
+    suffix = path.suffix.lower()
+    return suffix in IMAGE_SUFFIXES or suffix in VIDEO_SUFFIXES
+
+
+def create_thumbnail(
+    in_: pathlib.Path,
+    out: pathlib.Path,
+    size: int,
+    fit: ThumbnailFit = "cover",
+) -> None:
+    """Creates the thumbnail of an image or video (middle frame)."""
+    suffix = in_.suffix.lower()
+    if suffix in IMAGE_SUFFIXES:
+        image_thumbnail(in_, out, size, fit=fit)
+    elif suffix in VIDEO_SUFFIXES:
+        video_thumbnail(in_, out, size, fit=fit, frame="middle")
+    else:
+        msg = f"unsupported file format: {suffix!r:s}"
+        raise TypeError(msg)
+
+
+class ThumbnailCache:
+    """Thumbnail Cache.
+
+    Thumbnails are stored in the cache directory together with a manifest,
+    which records the modification time and size of the source at creation.
+    A thumbnail is recreated as soon as its source changes. Without `path`,
+    the thumbnails are stored in a `.thumbnails` directory next to their
+    source.
+
+    The manifests are written every `flush_size` created thumbnails, after
+    `generate` and on `flush`.
+    """
+
+    DIRNAME: str = ".thumbnails"
+    MANIFEST_NAME: str = "manifest.json"
+
+    def __init__(
+        self,
+        path: pathlib.Path | str | None = None,
+        flush_size: int = 100,
+    ) -> None:
+        self._lock = threading.Lock()
+        self._path = pathlib.Path(path) if path is not None else None
+        self._flush_size = flush_size
+        self._records: dict[pathlib.Path, dict[str, dict[str, Any]]] = {}
+        self._dirty: set[pathlib.Path] = set()
+        self._unsaved = 0
+        # Locks of the thumbnails being created
+        self._creating: dict[str, threading.Lock] = {}
+
+    @property
+    def path(self) -> pathlib.Path | None:
+        return self._path
+
+    @path.setter
+    def path(self, path: pathlib.Path | str | None) -> None:
+        self.flush()
+        with self._lock:
+            self._path = pathlib.Path(path) if path is not None else None
+            self._records.clear()
+
+    def directory(self, src: pathlib.Path) -> pathlib.Path:
+        """Returns the directory of the thumbnails of the source."""
+        if self._path is not None:
+            return self._path
+        return pathlib.Path(src).parent / self.DIRNAME
+
+    def manifest(self, src: pathlib.Path) -> pathlib.Path:
+        """Returns the manifest of the thumbnails of the source."""
+        return self.directory(src) / self.MANIFEST_NAME
+
+    def _load(self, directory: pathlib.Path) -> dict[str, dict[str, Any]]:
+        records = self._records.get(directory)
+        if records is None:
+            records = self._records[directory] = {}
+            manifest = directory / self.MANIFEST_NAME
+            if manifest.exists():
+                with open(manifest, encoding="utf-8") as f:
+                    records.update(json.load(f))
+        return records
+
+    def _save(self) -> None:
+        for directory in self._dirty:
+            directory.mkdir(exist_ok=True, parents=True)
+            manifest = directory / self.MANIFEST_NAME
+            part = manifest.with_suffix(f"{manifest.suffix:s}.part")
+            with open(part, mode="w", encoding="utf-8") as f:
+                json.dump(self._load(directory), f, indent=2, sort_keys=True)
+            part.replace(manifest)
+        self._dirty.clear()
+        self._unsaved = 0
+
+    def flush(self) -> None:
+        """Writes the manifests of all created thumbnails."""
+        with self._lock:
+            self._save()
+
+    @staticmethod
+    def _key(src: pathlib.Path, size: int, fit: ThumbnailFit) -> str:
+        return f"{src.resolve().as_posix():s}|{size:d}|{fit:s}"
+
+    @staticmethod
+    def _stat(src: pathlib.Path) -> dict[str, int]:
+        stat = src.stat()
+        return {"mtime_ns": stat.st_mtime_ns, "size": stat.st_size}
+
+    def _target(self, key: str, src: pathlib.Path) -> pathlib.Path:
+        digest = hashlib.sha1(key.encode("utf-8")).hexdigest()[:16]
+        return self.directory(src) / f"{src.stem:s}-{digest:s}.jpg"
+
+    def _fresh(self, key: str, src: pathlib.Path) -> pathlib.Path | None:
+        directory = self.directory(src)
+        record = self._load(directory).get(key)
+        if record is None or record["source"] != self._stat(src):
+            return None
+        out = directory / record["thumbnail"]
+        return out if out.exists() else None
+
+    def _add(self, key: str, src: pathlib.Path, out: pathlib.Path) -> None:
+        directory = self.directory(src)
+        self._load(directory)[key] = {
+            "source": self._stat(src),
+            "thumbnail": out.name,
+        }
+        self._dirty.add(directory)
+        self._unsaved += 1
+
+    def is_fresh(
+        self,
+        src: pathlib.Path,
+        size: int,
+        fit: ThumbnailFit = "cover",
+    ) -> bool:
+        """Returns whether an up-to-date thumbnail exists."""
+        src = pathlib.Path(src)
+        with self._lock:
+            return self._fresh(self._key(src, size, fit), src) is not None
+
+    def get(
+        self,
+        src: pathlib.Path,
+        size: int,
+        fit: ThumbnailFit = "cover",
+    ) -> pathlib.Path:
+        """Returns the path of the thumbnail, creates it if it is missing or
+        outdated.
+        """
+        src = pathlib.Path(src)
+        key = self._key(src, size, fit)
+        with self._lock:
+            out = self._fresh(key, src)
+            if out is not None:
+                return out
+            creating = self._creating.setdefault(key, threading.Lock())
+
+        # Only the thumbnail is created at once, not the cache
+        with creating:
+            with self._lock:
+                out = self._fresh(key, src)
+            if out is not None:
+                return out
+
+            out = self._target(key, src)
+            out.parent.mkdir(exist_ok=True, parents=True)
+            try:
+                create_thumbnail(src, out, size, fit=fit)
+            except BaseException:
+                with self._lock:
+                    self._creating.pop(key, None)
+                raise
+            # Registered before the lock is released, so a thread arriving
+            # afterwards finds the thumbnail
+            with self._lock:
+                self._add(key, src, out)
+                self._creating.pop(key, None)
+                if self._unsaved >= self._flush_size:
+                    self._save()
+            return out
+
+    def generate(
+        self,
+        sources: Iterable[pathlib.Path],
+        specs: Sequence[ThumbnailSpec],
+        max_workers: int | None = None,
+    ) -> int:
+        """Creates all missing or outdated thumbnails in a process pool.
+
+        Args:
+            sources: The images and videos.
+            specs: The thumbnail sizes and fits to create of every source.
+            max_workers: The number of processes (defaults to the number of
+                CPUs).
+
+        Returns:
+            The number of created thumbnails.
+        """
+        with self._lock:
+            jobs: dict[str, tuple[pathlib.Path, pathlib.Path, int, str]] = {}
+            for src in sources:
+                src = pathlib.Path(src)
+                for size, fit in specs:
+                    key = self._key(src, size, fit)
+                    if key not in jobs and self._fresh(key, src) is None:
+                        jobs[key] = (src, self._target(key, src), size, fit)
+        if len(jobs) == 0:
+            return 0
+
+        logger.info("Creating %d thumbnails", len(jobs))
+        for _, out, _, _ in jobs.values():
+            out.parent.mkdir(exist_ok=True, parents=True)
+
+        failed = []
+        with concurrent.futures.ProcessPoolExecutor(
+            max_workers=max_workers or os.cpu_count()
+        ) as pool:
+            futures = {
+                pool.submit(create_thumbnail, *job): key
+                for key, job in jobs.items()
+            }
+            for future in concurrent.futures.as_completed(futures):
+                key = futures[future]
+                src, out, _, _ = jobs[key]
+                try:
+                    future.result()
+                except Exception as e:
+                    failed.append((src, e))
+                else:
+                    with self._lock:
+                        self._add(key, src, out)
+        self.flush()
+
+        if len(failed) > 0:
+            logger.error(
+                "Failed to create %d thumbnails:\n%s",
+                len(failed),
+                "\n".join(f"  {file!s:s} - {err!r:s}" for file, err in failed),
+            )
+        logger.info("Created %d thumbnails", len(jobs) - len(failed))
+        return len(jobs) - len(failed)
+
+
+thumbnail_cache = ThumbnailCache()
@@ -4,18 +4,42 @@ import pathlib
 from typing import Literal
 
 from PIL import Image
+from pillow_heif import register_heif_opener
+
+register_heif_opener()
+
+REDUCING_GAP: float = 3.0
+"""Default reducing gap, see `Image.Image.resize`."""
 
 
 def pil_image_thumbnail(
     img: Image.Image,
     size: int,
     fit: Literal["cover", "contain"] = "contain",
+    reducing_gap: float | None = REDUCING_GAP,
 ) -> Image.Image:
+    """Returns a thumbnail of the image.
+
+    If `reducing_gap` is set, the image is first downscaled in the JPEG
+    DCT-domain (`Image.Image.draft`, not yet loaded JPEG only) and then by
+    integer factors (`Image.Image.reduce`) before resampling, as long as the
+    intermediate image stays `reducing_gap` times larger than the thumbnail.
+    Set it to `None` to resample the full resolution image.
+    """
     fit = fit.lower()
     if fit == "contain":
-        return img.thumbnail((size, size), resample=Image.Resampling.LANCZOS)
+        img.thumbnail(
+            (size, size),
+            resample=Image.Resampling.LANCZOS,
+            reducing_gap=reducing_gap,
+        )
+        return img
 
     if fit == "cover":
+        if reducing_gap is not None:
+            draft_size = int(size * reducing_gap)
+            img.draft(None, (draft_size, draft_size))
+
         w, h = img.size
         s = min(w, h)
 
@@ -24,8 +48,12 @@ def pil_image_thumbnail(
         right = left + s
         bottom = top + s
 
-        cropped = img.crop((left, top, right, bottom))
-        return cropped.resize((size, size), resample=Image.Resampling.LANCZOS)
+        return img.resize(
+            (size, size),
+            resample=Image.Resampling.LANCZOS,
+            box=(left, top, right, bottom),
+            reducing_gap=reducing_gap,
+        )
 
     msg = f"invalid fit: {fit!r:s}"
     raise ValueError(msg)
@@ -36,7 +64,8 @@ def image_thumbnail(
     out: pathlib.Path,
     size: int,
     fit: Literal["cover", "contain"] = "contain",
+    reducing_gap: float | None = REDUCING_GAP,
 ) -> None:
     with Image.open(in_) as img:
-        img = pil_image_thumbnail(img, size, fit=fit)
+        img = pil_image_thumbnail(img, size, fit=fit, reducing_gap=reducing_gap)
         img.save(out)
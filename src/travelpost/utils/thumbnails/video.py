@@ -1,35 +1,167 @@
 """Video Utils."""
 
+from collections.abc import Iterator
+import io
 import pathlib
-from typing import Literal
+import struct
+from typing import BinaryIO, Literal
 
 from PIL import Image
+import av
 import cv2
 
 from travelpost.utils.thumbnails.image import pil_image_thumbnail
 
+# Path of the cover art in the QuickTime/MP4 atom tree
+_POSTER_ATOM_PATH: tuple[bytes, ...] = (b"moov", b"udta", b"meta", b"ilst")
+_POSTER_ATOM: bytes = b"covr"
 
-def cv2_video_thumbnail(
-    video_path: pathlib.Path,
-    frame: Literal["start", "middle", "end"] = "middle",
-) -> Image:
-    cap = cv2.VideoCapture(str(video_path))
 
-    frame_count = cap.get(cv2.CAP_PROP_FRAME_COUNT)
+def _iter_atoms(
+    f: BinaryIO,
+    start: int,
+    end: int,
+) -> Iterator[tuple[bytes, int, int]]:
+    """Yields `(type, data_start, data_end)` of the atoms in `[start, end)`."""
+    pos = start
+    while pos + 8 <= end:
+        f.seek(pos)
+        size, atom_type = struct.unpack(">I4s", f.read(8))
+        header = 8
+        if size == 1:
+            (size,) = struct.unpack(">Q", f.read(8))
+            header = 16
+        elif size == 0:
+            size = end - pos
+        if size < header or pos + size > end:
+            return
+        yield atom_type, pos + header, pos + size
+        pos += size
+
+
+def quicktime_poster(video_path: pathlib.Path) -> Image.Image | None:
+    """Returns the poster frame embedded as cover art ('covr' atom) in a
+    QuickTime/MP4 video, if present.
+
+    Only the atom headers are read, the media data is skipped.
+    """
+    with open(video_path, mode="rb") as f:
+        start, end = 0, f.seek(0, io.SEEK_END)
+        for atom_path in (*_POSTER_ATOM_PATH, _POSTER_ATOM):
+            for atom_type, data_start, data_end in _iter_atoms(f, start, end):
+                if atom_type == atom_path:
+                    start, end = data_start, data_end
+                    break
+            else:
+                return None
+
+            if atom_path == b"meta":
+                # MP4 'meta' is a full atom (version & flags), QuickTime not
+                f.seek(start + 4)
+                if f.read(4) != b"hdlr":
+                    start += 4
+
+        for atom_type, data_start, data_end in _iter_atoms(f, start, end):
+            # 'data' atom: type indicator (4) & locale (4) before the image
+            if atom_type == b"data" and data_end - data_start > 8:
+                f.seek(data_start + 8)
+                data = f.read(data_end - data_start - 8)
+                with Image.open(io.BytesIO(data)) as img:
+                    return img.convert("RGB")
+    return None
+
+
+def _frame_index(
+    frame_count: int,
+    frame: Literal["start", "middle", "end"],
+) -> int:
     match frame.lower():
         case "start":
-            i = 0
+            return 0
         case "middle":
-            i = int(frame_count // 2)
+            return frame_count // 2
         case "end":
-            i = frame_count - 1
+            return max(frame_count - 1, 0)
         case _:
             msg = f"invalid frame mode: {frame!r:s}"
             raise ValueError(msg)
 
-    cap.set(cv2.CAP_PROP_POS_FRAMES, i)
-    ok, fr = cap.read()
-    cap.release()
+
+def _av_seek_target(
+    container: av.container.InputContainer,
+    stream: av.VideoStream,
+    frame: Literal["start", "middle", "end"],
+) -> int:
+    # Timestamp [stream.time_base] of the frame, from the duration if known
+    # (the frame count is 0 for many containers, e.g. MKV/WebM)
+    start = stream.start_time or 0
+    if stream.duration:
+        duration = stream.duration
+    elif container.duration:
+        duration = int(container.duration / av.time_base / stream.time_base)
+    elif stream.frames and stream.average_rate:
+        i = _frame_index(stream.frames, frame)
+        return start + int(i / stream.average_rate / stream.time_base)
+    else:
+        return start
+    return start + _frame_index(duration, frame)
+
+
+def av_keyframe(
+    video_path: pathlib.Path,
+    frame: Literal["start", "middle", "end"] = "middle",
+) -> Image.Image:
+    """Returns the nearest keyframe at or before the frame of the video.
+
+    Only the keyframe is decoded: the container seeks to the keyframe and the
+    decoder skips all other frames.
+    """
+    with av.open(str(video_path)) as container:
+        stream = container.streams.video[0]
+        stream.codec_context.skip_frame = "NONKEY"
+        target = _av_seek_target(container, stream, frame)
+        if stream.time_base and target > (stream.start_time or 0):
+            container.seek(
+                target,
+                stream=stream,
+                backward=True,
+                any_frame=False,
+            )
+        for fr in container.decode(stream):
+            return fr.to_image()
+
+    msg = f"could not read frame of {video_path.as_posix()!r:s}"
+    raise RuntimeError(msg)
+
+
+def cv2_video_thumbnail(
+    video_path: pathlib.Path,
+    frame: Literal["start", "middle", "end"] = "middle",
+    seek: Literal["exact", "keyframe"] = "keyframe",
+) -> Image:
+    """Returns a frame of the video.
+
+    `seek="exact"` returns the frame itself, which decodes all frames since the
+    previous keyframe (slow for long H.264/HEVC videos). `seek="keyframe"`
+    returns the nearest keyframe at or before the frame instead, see
+    `av_keyframe`.
+    """
+    match seek.lower():
+        case "exact":
+            pass
+        case "keyframe":
+            return av_keyframe(video_path, frame=frame)
+        case _:
+            msg = f"invalid seek mode: {seek!r:s}"
+            raise ValueError(msg)
+
+    cap = cv2.VideoCapture(str(video_path))
+    try:
+        i = _frame_index(int(cap.get(cv2.CAP_PROP_FRAME_COUNT)), frame)
+        cap.set(cv2.CAP_PROP_POS_FRAMES, i)
+        ok, fr = cap.read()
+    finally:
+        cap.release()
 
     if not ok:
         msg = f"could not read frame of {video_path.as_posix()!r:s}"
@@ -45,7 +177,14 @@ def video_thumbnail(
     size: int,
     fit: Literal["cover", "contain"] = "contain",
     frame: Literal["start", "middle", "end"] = "middle",
+    seek: Literal["exact", "keyframe"] = "keyframe",
+    poster: bool = True,
 ) -> None:
-    img = cv2_video_thumbnail(in_, frame=frame)
+    """Creates a thumbnail of the embedded poster frame (if `poster` is set
+    and present) or of the `frame` of the video.
+    """
+    img = quicktime_poster(in_) if poster else None
+    if img is None:
+        img = cv2_video_thumbnail(in_, frame=frame, seek=seek)
     img = pil_image_thumbnail(img, size, fit=fit)
     img.save(out)
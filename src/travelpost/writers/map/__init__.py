@@ -5,21 +5,37 @@ Coordinate order: latitude, longitude
 """
 
 from travelpost.writers.map import units
+from travelpost.writers.map.browser_pool import BrowserPool
 from travelpost.writers.map.interface import Bounds
 from travelpost.writers.map.interface import Point
+from travelpost.writers.map.interface import Points
 from travelpost.writers.map.interface import Post
 from travelpost.writers.map.map import Map
 from travelpost.writers.map.map import Style
 from travelpost.writers.map.map import Styles
 from travelpost.writers.map.map_print import PrintMap
+from travelpost.writers.map.mini_map import MiniMap
+from travelpost.writers.map.mini_map import MiniMapSpec
+from travelpost.writers.map.mini_map import render_mini_maps
+from travelpost.writers.map.raster import RasterRenderer
+from travelpost.writers.map.tile_cache import TileCache
+from travelpost.writers.map.tile_server import TileServer
 
 __all__ = (
     "Bounds",
+    "BrowserPool",
     "Map",
+    "MiniMap",
+    "MiniMapSpec",
     "Point",
+    "Points",
     "Post",
     "PrintMap",
+    "RasterRenderer",
     "Style",
     "Styles",
+    "TileCache",
+    "TileServer",
+    "render_mini_maps",
     "units",
 )
@@ -1,16 +1,22 @@
 """Main."""
 
 import argparse
+import contextlib
 import logging
 import pathlib
 
+import numpy as np
+
 from travelpost.readers.fp import load_blog
 from travelpost.readers.fp.utils import requests
+from travelpost.utils.thumbnails import thumbnail_cache
 from travelpost.writers.map import Bounds
 from travelpost.writers.map import Map
-from travelpost.writers.map import Point
+from travelpost.writers.map import Points
 from travelpost.writers.map import Post
 from travelpost.writers.map import PrintMap
+from travelpost.writers.map import TileCache
+from travelpost.writers.map import TileServer
 from travelpost.writers.map.units import mm
 
 BOUNDING_BOX: Bounds = Bounds(
@@ -52,6 +58,43 @@ def main() -> None:
         default=False,
         help="Reset cache.",
     )
+    parser.add_argument(
+        "--tile-cache",
+        type=pathlib.Path,
+        help="Tile cache path (serves the map tiles locally).",
+    )
+    parser.add_argument(
+        "--prefetch-zoom",
+        nargs=2,
+        type=int,
+        metavar=("MIN", "MAX"),
+        help="Prefetch the tiles of the trip for the zoom range into the tile "
+        "cache.",
+    )
+    parser.add_argument(
+        "--offline",
+        action=argparse.BooleanOptionalAction,
+        default=False,
+        help="Use only cached tiles.",
+    )
+    parser.add_argument(
+        "--raster",
+        action=argparse.BooleanOptionalAction,
+        default=False,
+        help="Render the print map without browser from the tile cache.",
+    )
+    parser.add_argument(
+        "--icon-font",
+        type=pathlib.Path,
+        help="Font Awesome (solid) font file for the icons of the raster map.",
+    )
+    parser.add_argument(
+        "--simplify",
+        type=float,
+        metavar="TOLERANCE",
+        help="Simplify the route with a tolerance [px] (per zoom level in the "
+        "shown map).",
+    )
     parser.add_argument(
         "--show",
         action=argparse.BooleanOptionalAction,
@@ -87,14 +130,19 @@ def main() -> None:
     requests.cache_name = args.out / ".cache"
     if args.reset_cache:
         requests.clear_cache()
+    thumbnail_cache.path = args.out / ".thumbnails"
 
     blog = load_blog(args.out, args.url, load_media=args.media)
+    if SHOW_POST_IMAGES:
+        blog.create_thumbnails()
 
-    points = [
-        Point(lat=loc.lat, lon=loc.lon, transport=transport)
-        for transport, loc in blog.route.iter()
-        if BOUNDING_BOX.contains(loc.lat, loc.lon)
-    ]
+    points = Points(
+        lat_lon=[(loc.lat, loc.lon) for seg in blog.route for loc in seg],
+        transport=np.repeat(
+            [seg.transport.value for seg in blog.route],
+            [len(seg) for seg in blog.route],
+        ),
+    ).clip(BOUNDING_BOX)
 
     posts = [
         Post(
@@ -107,26 +155,53 @@ def main() -> None:
         )
         for p in blog.posts
     ]
+    thumbnail_cache.flush()
 
-    if args.print:
-        map = PrintMap(
-            points,
-            [],
-            bounds=BOUNDING_BOX,
-        )
-        map.to_png(
-            args.out / "map.png",
-            width_pt=297 * mm,
-            height_pt=210 * mm,
-            rotate=True,
-        )
+    if args.raster and args.tile_cache is None:
+        parser.error("--raster requires --tile-cache")
 
-    if args.show:
-        map = Map(
-            points,
-            posts,
-        )
-        map.show_in_browser()
+    with contextlib.ExitStack() as stack:
+        tiles = None
+        tile_cache = None
+        if args.tile_cache is not None:
+            tile_cache = TileCache(args.tile_cache, Map.TILES, args.offline)
+            if args.prefetch_zoom is not None:
+                tile_cache.prefetch(
+                    BOUNDING_BOX if args.print else Map(points, posts).bounds,
+                    *args.prefetch_zoom,
+                )
+            tiles = stack.enter_context(TileServer(tile_cache)).url
+
+        if args.print:
+            map = PrintMap(
+                points,
+                [],
+                bounds=BOUNDING_BOX,
+                tiles=tiles,
+                simplify_tolerance=args.simplify,
+                encode_segments=True,
+            )
+            map.to_png(
+                args.out / "map.png",
+                width_pt=297 * mm,
+                height_pt=210 * mm,
+                rotate=True,
+                tile_cache=tile_cache if args.raster else None,
+                icon_font=args.icon_font,
+            )
+
+        if args.show:
+            map = Map(
+                points,
+                posts,
+                tiles=tiles,
+                simplify_tolerance=args.simplify,
+                lod=args.simplify is not None,
+                encode_segments=True,
+            )
+            map.show_in_browser()
+            if tiles is not None:
+                input("Press Enter to stop the tile server ...")
 
 
 if __name__ == "__main__":
@@ -0,0 +1,144 @@
+"""Browser Pool."""
+
+from collections.abc import Callable, Iterable, Iterator
+import concurrent.futures
+import contextlib
+import logging
+import pathlib
+import queue
+import threading
+from typing import Any, IO, Self
+
+from selenium.common.exceptions import TimeoutException
+from selenium.common.exceptions import WebDriverException
+
+from travelpost.writers.map.png import firefox_driver
+
+logger = logging.getLogger(__name__)
+
+
+class BrowserPool:
+    """Pool of warm headless webdrivers for rendering maps.
+
+    Up to `size` webdrivers are started lazily on first use and kept open
+    until the pool is closed, so that every render reuses a running browser
+    (and its tab) instead of starting a new one.
+
+    Examples
+    --------
+    >>> with BrowserPool(size=2) as pool:
+    ...     overview_map.to_png("overview.png", pool=pool)
+    ...     pool.render([(m, f"map_{i:d}.png") for i, m in enumerate(maps)])
+
+    """
+
+    def __init__(
+        self,
+        size: int = 1,
+        driver_factory: Callable[[], Any] = firefox_driver,
+    ) -> None:
+        if size < 1:
+            msg = f"invalid size: {size:d}"
+            raise ValueError(msg)
+
+        self._driver_factory = driver_factory
+        self._size = size
+
+        self._lock = threading.Lock()
+        self._closed = False
+        self._drivers: list[Any] = []
+        # Idle webdrivers, `None` is a free slot to start a new one
+        self._idle: queue.LifoQueue[Any | None] = queue.LifoQueue()
+        for _ in range(size):
+            self._idle.put(None)
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(self, *args: object) -> None:
+        self.close()
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__:s}(size={self._size:d})"
+
+    @property
+    def size(self) -> int:
+        return self._size
+
+    def _acquire(self) -> Any:
+        with self._lock:
+            if self._closed:
+                msg = "browser pool is closed"
+                raise RuntimeError(msg)
+
+        driver = self._idle.get()
+        if driver is not None:
+            return driver
+
+        logger.info("Starting webdriver (pool size: %d)", self._size)
+        try:
+            driver = self._driver_factory()
+        except BaseException:
+            self._idle.put(None)
+            raise
+        with self._lock:
+            self._drivers.append(driver)
+        return driver
+
+    def _discard(self, driver: Any) -> None:
+        with self._lock:
+            if driver in self._drivers:
+                self._drivers.remove(driver)
+        with contextlib.suppress(Exception):
+            driver.quit()
+        self._idle.put(None)
+
+    @contextlib.contextmanager
+    def driver(self) -> Iterator[Any]:
+        """Lends a webdriver of the pool (blocks if all are in use)."""
+        driver = self._acquire()
+        try:
+            yield driver
+        except TimeoutException:
+            self._idle.put(driver)
+            raise
+        except WebDriverException:
+            # The browser may be in an unknown state, do not reuse it.
+            self._discard(driver)
+            raise
+        except BaseException:
+            self._idle.put(driver)
+            raise
+        else:
+            self._idle.put(driver)
+
+    def close(self) -> None:
+        """Quits all webdrivers."""
+        with self._lock:
+            self._closed = True
+            drivers, self._drivers = self._drivers, []
+        for driver in drivers:
+            with contextlib.suppress(Exception):
+                driver.quit()
+
+    def render(
+        self,
+        maps: Iterable[tuple[Any, str | pathlib.Path | IO[bytes]]],
+        **kwargs: Any,
+    ) -> None:
+        """Renders a batch of `(map, png_out)` concurrently with up to `size`
+        webdrivers.
+
+        Args:
+            maps: The maps (`Map` or `PrintMap`) and their outputs.
+            **kwargs: The keyword arguments of `to_png` of the maps.
+        """
+        with concurrent.futures.ThreadPoolExecutor(
+            max_workers=self._size
+        ) as executor:
+            futures = [
+                executor.submit(m.to_png, png_out, pool=self, **kwargs)
+                for m, png_out in maps
+            ]
+            for future in futures:
+                future.result()
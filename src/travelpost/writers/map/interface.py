@@ -1,7 +1,11 @@
 """Interface."""
 
+from collections.abc import Sequence
 import dataclasses
 import pathlib
+from typing import Any, Self
+
+import numpy as np
 
 
 @dataclasses.dataclass(frozen=True, kw_only=True)
@@ -29,6 +33,32 @@ class Bounds:
             and self.lon_min <= lon <= self.lon_max
         )
 
+    def contains_all(self, lat_lon: np.ndarray) -> np.ndarray:
+        """Returns whether the bounds contain the latitude-longitude coordinate
+        pairs (`(n, 2)` array) as boolean mask."""
+        lat, lon = lat_lon[:, 0], lat_lon[:, 1]
+        return (
+            (self.lat_min <= lat)
+            & (lat <= self.lat_max)
+            & (self.lon_min <= lon)
+            & (lon <= self.lon_max)
+        )
+
+    @classmethod
+    def from_array(cls, lat_lon: np.ndarray) -> Self:
+        """Returns the bounds of the latitude-longitude coordinate pairs
+        (`(n, 2)` array, `n > 0`)."""
+        (lat_min, lon_min), (lat_max, lon_max) = (
+            lat_lon.min(axis=0).tolist(),
+            lat_lon.max(axis=0).tolist(),
+        )
+        return cls(
+            lat_min=lat_min,
+            lon_min=lon_min,
+            lat_max=lat_max,
+            lon_max=lon_max,
+        )
+
 
 @dataclasses.dataclass(frozen=True, kw_only=True)
 class Point:
@@ -44,6 +74,110 @@ class Point:
         return (self.lat, self.lon)
 
 
+@dataclasses.dataclass(frozen=True, kw_only=True)
+class Points(Sequence[Point]):
+    """Points (columnar, e.g. of a route with millions of points)."""
+
+    lat_lon: np.ndarray
+    """`(n, 2)` float array of `(lat, lon)`."""
+    transport: np.ndarray
+    """`(n,)` str array."""
+
+    def __post_init__(self) -> None:
+        lat_lon = np.asarray(self.lat_lon, dtype=float).reshape(-1, 2)
+        transport = np.asarray(self.transport, dtype=str)
+        if transport.ndim == 0:
+            transport = np.full(len(lat_lon), transport)
+        if transport.shape != (len(lat_lon),):
+            msg = (
+                f"expected {len(lat_lon):d} transports, got "
+                f"{transport.shape!r:s}"
+            )
+            raise ValueError(msg)
+        object.__setattr__(self, "lat_lon", lat_lon)
+        object.__setattr__(self, "transport", transport)
+
+    def __len__(self) -> int:
+        return len(self.lat_lon)
+
+    def __getitem__(self, i: int) -> Point:
+        lat, lon = self.lat_lon[i].tolist()
+        return Point(lat=lat, lon=lon, transport=str(self.transport[i]))
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__:s}([... {len(self):d} points])"
+
+    @property
+    def bounds(self) -> Bounds | None:
+        """The bounds of the points (`None` if empty)."""
+        if len(self) == 0:
+            return None
+        return Bounds.from_array(self.lat_lon)
+
+    def clip(self, bounds: Bounds) -> Self:
+        """Returns the points within the bounds."""
+        mask = bounds.contains_all(self.lat_lon)
+        return type(self)(
+            lat_lon=self.lat_lon[mask], transport=self.transport[mask]
+        )
+
+    def split(self) -> list[tuple[str, np.ndarray]]:
+        """Splits the points into segments of the same transport. Consecutive
+        segments share the point where the transport changes.
+
+        Returns:
+            The `(transport, lat_lon)` segments with at least 2 points.
+        """
+        n = len(self)
+        if n < 2:
+            return []
+        starts = np.flatnonzero(self.transport[1:] != self.transport[:-1]) + 1
+        starts = np.concatenate(([0], starts))
+        ends = np.append(starts[1:], n - 1)
+        return [
+            (str(self.transport[start]), self.lat_lon[start : end + 1])
+            for start, end in zip(starts.tolist(), ends.tolist(), strict=True)
+            if start < end
+        ]
+
+    @classmethod
+    def from_points(cls, points: Sequence[Point]) -> Self:
+        """Returns the columnar points of `Point`s."""
+        return cls(
+            lat_lon=np.array([p.lat_lon for p in points], dtype=float),
+            transport=np.array([p.transport for p in points], dtype=str),
+        )
+
+    @classmethod
+    def from_geodataframe(cls, gdf: Any) -> Self:
+        """Returns the points of a (route) `GeoDataFrame` with point geometries
+        (longitude, latitude) and an optional `transport` column (missing
+        transports are `"unknown"`).
+        """
+        lat_lon = np.column_stack(
+            (gdf.geometry.y.to_numpy(), gdf.geometry.x.to_numpy())
+        )
+        if "transport" in gdf:
+            transport = gdf["transport"].fillna("unknown").to_numpy(dtype=str)
+        else:
+            transport = "unknown"
+        return cls(lat_lon=lat_lon, transport=transport)
+
+    @classmethod
+    def of(cls, points: Any) -> Self:
+        """Returns the columnar points of `Points`, a sequence of `Point`s, a
+        (route) `GeoDataFrame` or a `(n, 2)` array of `(lat, lon)` (with
+        unknown transport).
+        """
+        if isinstance(points, cls):
+            return points
+        if isinstance(points, np.ndarray):
+            return cls(lat_lon=points, transport="unknown")
+        if hasattr(points, "geometry"):
+            return cls.from_geodataframe(points)
+        return cls.from_points(points)
+
+
 @dataclasses.dataclass(frozen=True, kw_only=True)
 class Post:
     """Post."""
@@ -0,0 +1,42 @@
+if (typeof L.Travel === "undefined") {
+  L.Travel = {};
+}
+
+L.Travel.LevelOfDetail = L.Layer.extend({
+  // levels: [{ minZoom: number, maxZoom: number, layer: L.Layer }, ...]
+  initialize: function (levels, options) {
+    L.Util.setOptions(this, options);
+    this._levels = levels;
+  },
+
+  onAdd: function (map) {
+    map.on("zoomend", this._update, this);
+    this._update();
+  },
+
+  onRemove: function (map) {
+    map.off("zoomend", this._update, this);
+    this._levels.forEach(function (level) {
+      if (map.hasLayer(level.layer)) {
+        map.removeLayer(level.layer);
+      }
+    });
+  },
+
+  _update: function () {
+    const zoom = this._map.getZoom();
+    this._levels.forEach(function (level) {
+      const show = level.minZoom <= zoom && zoom < level.maxZoom,
+        shown = this._map.hasLayer(level.layer);
+      if (show && !shown) {
+        this._map.addLayer(level.layer);
+      } else if (!show && shown) {
+        this._map.removeLayer(level.layer);
+      }
+    }, this);
+  },
+});
+
+L.Travel.levelOfDetail = function (levels, options) {
+  return new L.Travel.LevelOfDetail(levels, options);
+};
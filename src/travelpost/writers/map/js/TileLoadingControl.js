@@ -2,24 +2,56 @@ if (typeof L.Travel === "undefined") {
   L.Travel = {};
 }
 
+L.Travel.tileLoadingControls = [];
+
 L.Travel.TileLoadingControl = L.Control.extend({
   initialize: function (options) {
     L.Control.prototype.initialize.call(this, options);
     this._counter = 0;
+    this._div = null;
+    this._isReady = true;
+    this._setReady(false);
   },
 
   onAdd: function (map) {
     map.eachLayer(this._attach, this);
     map.on("layeradd", this._attach_event, this);
+    L.Travel.tileLoadingControls.push(this);
 
     this._div = L.DomUtil.create("div", "tile-loading-control");
-    this._div.dataset.ready = false;
+    this._div.dataset.ready = this._isReady;
     return this._div;
   },
 
   onRemove: function (map) {
     map.eachLayer(this._detach, this);
     map.off("layeradd", this._attach_event, this);
+    const i = L.Travel.tileLoadingControls.indexOf(this);
+    if (i >= 0) {
+      L.Travel.tileLoadingControls.splice(i, 1);
+    }
+  },
+
+  // Returns a promise, which resolves as soon as all tiles are loaded and
+  // faded in.
+  ready: function () {
+    return this._ready;
+  },
+
+  _setReady: function (ready) {
+    if (!ready && this._isReady) {
+      this._ready = new Promise(
+        function (resolve) {
+          this._resolve = resolve;
+        }.bind(this),
+      );
+    } else if (ready && !this._isReady) {
+      this._resolve();
+    }
+    this._isReady = ready;
+    if (this._div) {
+      this._div.dataset.ready = ready;
+    }
   },
 
   _attach: function (layer) {
@@ -42,19 +74,47 @@ L.Travel.TileLoadingControl = L.Control.extend({
 
   _onLoading: function () {
     this._counter += 1;
-    if (this._div.dataset.ready) {
-      this._div.dataset.ready = false;
-    }
+    this._setReady(false);
   },
 
-  _onLoad: function () {
+  _onLoad: function (e) {
     this._counter -= 1;
     if (this._counter <= 0) {
-      this._div.dataset.ready = true;
+      this._whenFaded(e.target, function () {
+        if (this._counter <= 0) {
+          this._setReady(true);
+        }
+      });
     }
   },
+
+  // NOTE: Tiles are active once their fade animation has finished, see
+  //       `GridLayer._updateOpacity` and `GridLayer._tileReady` of Leaflet.
+  _whenFaded: function (layer, callback) {
+    const check = function () {
+      const faded = Object.values(layer._tiles || {}).every(function (tile) {
+        return tile.active || !tile.current;
+      });
+      if (faded) {
+        callback.call(this);
+      } else {
+        L.Util.requestAnimFrame(check, this);
+      }
+    };
+    check.call(this);
+  },
 });
 
 L.Travel.tileLoadingControl = function (options) {
   return new L.Travel.TileLoadingControl(options);
 };
+
+// Returns a promise, which resolves as soon as the tiles of all maps are
+// loaded and faded in.
+L.Travel.whenTilesReady = function () {
+  return Promise.all(
+    L.Travel.tileLoadingControls.map(function (control) {
+      return control.ready();
+    }),
+  );
+};
@@ -129,3 +129,49 @@ L.Travel.Segment = L.Polyline.extend({
 L.Travel.segment = function (latlngs, transport, options) {
   return new L.Travel.Segment(latlngs, transport, options);
 };
+
+L.Travel.decodePolyline = function (encoded, precision) {
+  const factor = Math.pow(10, precision ?? 5),
+    latlngs = [];
+  let index = 0,
+    lat = 0,
+    lng = 0;
+
+  const next = function () {
+    let result = 0,
+      shift = 0,
+      byte;
+    do {
+      byte = encoded.charCodeAt(index++) - 63;
+      result |= (byte & 0x1f) << shift;
+      shift += 5;
+    } while (byte >= 0x20);
+    return result & 1 ? ~(result >> 1) : result >> 1;
+  };
+
+  while (index < encoded.length) {
+    lat += next();
+    lng += next();
+    latlngs.push([lat / factor, lng / factor]);
+  }
+  return latlngs;
+};
+
+// encoded: all locations as encoded polyline
+// runs: [[transport, number of locations], ...]
+// transportOptions: { transport: options, ... } (override `options`)
+L.Travel.segments = function (encoded, runs, options, transportOptions) {
+  const latlngs = L.Travel.decodePolyline(encoded),
+    group = L.featureGroup();
+  let start = 0;
+  runs.forEach(function ([transport, count]) {
+    const key = String(transport ?? "unknown").toLowerCase();
+    L.Travel.segment(
+      latlngs.slice(start, start + count),
+      transport,
+      L.Util.extend({}, options, (transportOptions || {})[key]),
+    ).addTo(group);
+    start += count;
+  });
+  return group;
+};
@@ -0,0 +1,34 @@
+"""Level Of Detail."""
+
+from collections.abc import Sequence
+
+import folium
+from folium.template import Template
+
+
+class LevelOfDetail(folium.MacroElement):
+    """Level Of Detail (shows only the layer of the current zoom range)."""
+
+    _template = Template(
+        """
+        {% macro script(this, kwargs) %}
+            var {{ this.get_name() }} = L.Travel.levelOfDetail([
+                {%- for min_zoom, max_zoom, layer in this.levels %}
+                {
+                    minZoom: {{ min_zoom|tojson }},
+                    maxZoom: {{ max_zoom|tojson }},
+                    layer: {{ layer.get_name() }}
+                },
+                {%- endfor %}
+            ]).addTo({{this._parent.get_name()}});
+        {% endmacro %}
+        """
+    )
+
+    def __init__(
+        self,
+        levels: Sequence[tuple[float, float, folium.FeatureGroup]],
+    ) -> None:
+        super().__init__()
+        self._name = "LevelOfDetail"
+        self.levels = levels
@@ -1,29 +1,43 @@
 """Map."""
 
-from collections.abc import Iterator
+from collections.abc import Iterator, Sequence
 import contextlib
 import io
+import math
 import pathlib
-from typing import Any, IO
+from typing import Any, IO, TYPE_CHECKING
 
 from PIL import Image
 import folium
-import folium.utilities
+import numpy as np
 
+from travelpost.writers.map.browser_pool import BrowserPool
 from travelpost.writers.map.fa_icon import FAIcon
 from travelpost.writers.map.interface import Bounds
 from travelpost.writers.map.interface import Point
+from travelpost.writers.map.interface import Points
 from travelpost.writers.map.interface import Post
+from travelpost.writers.map.level_of_detail import LevelOfDetail
 from travelpost.writers.map.patch import patch
 from travelpost.writers.map.png import to_png
 from travelpost.writers.map.post_icon import PostIcon
+from travelpost.writers.map.raster import RasterRenderer
+from travelpost.writers.map.simplify import fit_zoom
+from travelpost.writers.map.simplify import simplify
+from travelpost.writers.map.tile_cache import TileCache
 from travelpost.writers.map.tile_loading_control import TileLoadingControl
 from travelpost.writers.map.travel_segment import TravelSegment
+from travelpost.writers.map.travel_segment import TravelSegments
 from travelpost.writers.map.utils import dedent
 from travelpost.writers.map.utils import merge_dict
 
+if TYPE_CHECKING:
+    import geopandas as gpd
+
 type Style = dict[str, int | float | str | "Style"]
 type Styles = dict[str, Style]
+type Segment = tuple[str, list[tuple[float, float]]]
+type PointsLike = Sequence[Point] | Points | np.ndarray | gpd.GeoDataFrame
 
 
 class Map:
@@ -42,6 +56,11 @@ class Map:
     ZOOM_MIN: int = 2
     ZOOM_MAX: int = 17
     ZOOM_STEP: float | int = 0.25
+    LOD_ZOOM_STEP: int = 2
+    VIEWPORT: tuple[int, int] = (1920, 1080)
+    """Expected map size (width, height) [px] to simplify the route for."""
+    ENDPOINT_ICONS: bool = True
+    """Whether to mark the start & final point."""
 
     STYLES: Styles = {
         "final_icon": {
@@ -90,21 +109,35 @@ class Map:
 
     def __init__(
         self,
-        points: list[Point],
+        points: PointsLike,
         posts: list[Post],
         bounds: Bounds | None = None,
         padding: float | None = None,
         show_only_flight_icons: bool = False,
         styles: Styles | None = None,
+        tiles: str | None = None,
+        simplify_tolerance: float | None = None,
+        lod: bool = False,
+        encode_segments: bool = False,
         **kwargs: Any,
     ) -> None:
         self._bounds = bounds
         self._bounds_set = bounds is not None
         self._map_kwargs = kwargs
         self._padding = padding
-        self._points = points
+        self._points = Points.of(points)
         self._posts = posts
         self._show_only_flight_icons = show_only_flight_icons
+        # Maximum deviation [px] of the simplified route (`None`: no
+        # simplification), `lod` simplifies per zoom range.
+        self._simplify_tolerance = simplify_tolerance
+        self._lod = lod
+        # Size [px] the route is simplified for (without `lod`)
+        self._viewport = self.VIEWPORT
+        # All segments as one encoded payload (`TravelSegments`)
+        self._encode_segments = encode_segments
+        # e.g. `TileServer.url` of a local tile cache
+        self._tiles = tiles or self.TILES
         self._styles = self.STYLES.copy()
         if styles is not None:
             self._styles = merge_dict(self._styles, styles)
@@ -132,7 +165,7 @@ class Map:
         kwargs.update(
             dict(
                 location=(0.0, 0.0),
-                tiles=self.TILES,
+                tiles=self._tiles,
                 attr=self.ATTRIBUTION,
                 min_zoom=self.ZOOM_MIN,
                 max_zoom=self.ZOOM_MAX,
@@ -178,34 +211,95 @@ class Map:
                     z_index_offset=1000 if p.image_path else 500,
                 ).add_to(map)
 
+    def _split_segments(self) -> list[Segment]:
+        return [
+            (transport, [(lat, lon) for lat, lon in lat_lon.tolist()])
+            for transport, lat_lon in self._points.split()
+        ]
+
+    def _simplify_segments(
+        self,
+        segments: list[Segment],
+        zoom: float,
+    ) -> list[Segment]:
+        return [
+            (transport, simplify(locs, zoom, self._simplify_tolerance))
+            for transport, locs in segments
+        ]
+
+    def _add_segments(
+        self,
+        parent: folium.Map | folium.FeatureGroup,
+        segments: list[Segment],
+    ) -> None:
+        if self._encode_segments:
+            TravelSegments(
+                [
+                    (self._segment_kwargs(transport)["transport"], segment)
+                    for transport, segment in segments
+                ],
+                transport_options={
+                    "flight": dict(
+                        dash_array=self._dash_array,
+                        dash_offset=self._dash_offset,
+                    )
+                },
+                **self._styles["travel_segment"],
+            ).add_to(parent)
+            return
+
+        for transport, segment in segments:
+            TravelSegment(segment, **self._segment_kwargs(transport)).add_to(
+                parent
+            )
+
+    def _segment_kwargs(self, transport: str) -> dict[str, Any]:
+        return dict(
+            transport=(
+                transport
+                if not self._show_only_flight_icons or transport == "flight"
+                else None
+            ),
+            dash_array=self._dash_array if transport == "flight" else None,
+            dash_offset=self._dash_offset if transport == "flight" else None,
+            **self._styles["travel_segment"],
+        )
+
     def _create_segments(self, map: folium.Map) -> None:
-        if len(self._points) > 1:
-            segment = [self._points[0].lat_lon]
-            transport = self._points[0].transport
-            for p in self._points[1:]:
-                segment.append(p.lat_lon)
-                if p.transport != transport or p is self._points[-1]:
-                    TravelSegment(
-                        segment,
-                        (
-                            transport
-                            if not self._show_only_flight_icons
-                            or transport == "flight"
-                            else None
-                        ),
-                        dash_array=(
-                            self._dash_array if transport == "flight" else None
-                        ),
-                        dash_offset=(
-                            self._dash_offset if transport == "flight" else None
-                        ),
-                        **self._styles["travel_segment"],
-                    ).add_to(map)
-                    transport = p.transport
-                    segment = [p.lat_lon]
+        segments = self._split_segments()
+        if self._simplify_tolerance is None:
+            self._add_segments(map, segments)
+        elif not self._lod:
+            zoom = min(
+                math.ceil(fit_zoom(self.bounds, self._viewport)),
+                self.ZOOM_MAX,
+            )
+            self._add_segments(map, self._simplify_segments(segments, zoom))
+        else:
+            levels = []
+            for min_zoom in range(
+                self.ZOOM_MIN, self.ZOOM_MAX + 1, self.LOD_ZOOM_STEP
+            ):
+                max_zoom = min_zoom + self.LOD_ZOOM_STEP
+                group = folium.FeatureGroup(control=False, show=False)
+                self._add_segments(
+                    group,
+                    self._simplify_segments(
+                        segments, min(max_zoom, self.ZOOM_MAX)
+                    ),
+                )
+                group.add_to(map)
+                levels.append(
+                    (
+                        min_zoom,
+                        max_zoom if max_zoom <= self.ZOOM_MAX else math.inf,
+                        group,
+                    )
+                )
+            LevelOfDetail(levels).add_to(map)
 
     def _create_start_icon(self, map: folium.Map) -> None:
-        if len(self._points) > 0:
+        if self.ENDPOINT_ICONS and len(self._points) > 0:
             folium.Marker(
                 self._points[0].lat_lon,
                 icon=FAIcon("house", **self._styles["start_icon"]),
@@ -214,7 +308,7 @@ class Map:
             ).add_to(map)
 
     def _create_final_icon(self, map: folium.Map) -> None:
-        if len(self._points) > 1:
+        if self.ENDPOINT_ICONS and len(self._points) > 1:
             folium.Marker(
                 self._points[-1].lat_lon,
                 icon=FAIcon("flag-checkered", **self._styles["final_icon"]),
@@ -231,18 +325,20 @@ class Map:
         limited to the bounds.
         """
         if self._bounds is None:
-            bounds = folium.utilities.get_bounds(
+            lat_lon = np.concatenate(
                 (
-                    *((p.lat, p.lon) for p in self._points),
-                    *((p.lat, p.lon) for p in self._posts),
+                    self._points.lat_lon,
+                    np.array(
+                        [p.lat_lon for p in self._posts], dtype=float
+                    ).reshape(-1, 2),
                 )
             )
-            self._bounds = Bounds(
-                lat_min=bounds[0][0],
-                lon_min=bounds[0][1],
-                lat_max=bounds[1][0],
-                lon_max=bounds[1][1],
-            )
+            if len(lat_lon) == 0:
+                # Unset like `folium.utilities.get_bounds`
+                return Bounds(
+                    lat_min=None, lon_min=None, lat_max=None, lon_max=None
+                )
+            self._bounds = Bounds.from_array(lat_lon)
         return self._bounds
 
     @bounds.setter
@@ -250,6 +346,21 @@ class Map:
         self._bounds = bounds
         self._bounds_set = bounds is not None
 
+    @property
+    def viewport(self) -> tuple[int, int]:
+        """The map size `(width, height)` [px] to simplify the route for
+        (defaults to `VIEWPORT`), the map is rebuilt if it changes.
+        """
+        return self._viewport
+
+    @viewport.setter
+    def viewport(self, viewport: tuple[int, int]) -> None:
+        viewport = tuple(viewport)
+        if viewport != self._viewport:
+            self._viewport = viewport
+            if self._simplify_tolerance is not None and not self._lod:
+                self._map = None
+
     @property
     def map(self) -> folium.Map:
         if self._map is None:
@@ -274,7 +385,13 @@ class Map:
         height: int = 1080,
         dpi: int = 300,
         rotate: bool = False,
+        pool: BrowserPool | None = None,
+        tile_cache: TileCache | None = None,
+        icon_font: pathlib.Path | str | None = None,
     ) -> None:
+        """Renders the map to a PNG in a browser, or without browser from the
+        tiles of `tile_cache` if set (see `to_image`).
+        """
         if isinstance(png_out, str):
             png_out = pathlib.Path(png_out)
         if isinstance(png_out, pathlib.Path) and png_out.suffix != ".png":
@@ -283,12 +400,88 @@ class Map:
             msg = f"invalid type: {type(png_out).__name__:s}"
             raise TypeError(msg)
 
-        png_tmp = to_png(
-            self.map,
-            max_delay=delay,
-            size=(height, width) if rotate else (width, height),
+        size = (height, width) if rotate else (width, height)
+        if tile_cache is not None:
+            img = self.to_image(tile_cache, *size, icon_font=icon_font)
+        else:
+            self.viewport = size
+            if pool is None:
+                png_tmp = to_png(self.map, max_delay=delay, size=size)
+            else:
+                with pool.driver() as driver:
+                    png_tmp = to_png(
+                        self.map, max_delay=delay, driver=driver, size=size
+                    )
+            with io.BytesIO(png_tmp) as png_io, Image.open(png_io) as img:
+                img.load()
+        if rotate:
+            img = img.rotate(90, expand=True)
+        img.save(png_out, dpi=(dpi, dpi))
+
+    def to_image(
+        self,
+        tile_cache: TileCache,
+        width: int = 1920,
+        height: int = 1080,
+        icon_font: pathlib.Path | str | None = None,
+    ) -> Image.Image:
+        """Renders the map without browser from the tiles of the cache (see
+        `renderer`).
+        """
+        return self.renderer(tile_cache, width, height, icon_font).render()
+
+    def renderer(
+        self,
+        tile_cache: TileCache,
+        width: int = 1920,
+        height: int = 1080,
+        icon_font: pathlib.Path | str | None = None,
+    ) -> RasterRenderer:
+        """Returns the renderer of the map, which draws the map without
+        browser from the tiles of the cache.
+
+        Args:
+            tile_cache: The tiles (missing tiles are left blank if the cache is
+                offline).
+            width: The image width [px].
+            height: The image height [px].
+            icon_font: The Font Awesome (solid) font file to draw the icon
+                glyphs, icons are drawn without glyph if it is not set.
+        """
+        renderer = RasterRenderer(tile_cache, (width, height), icon_font)
+        renderer.fit_bounds(
+            self.bounds,
+            padding=self._padding or 0.0,
+            zoom_min=self.ZOOM_MIN,
+            zoom_max=self.ZOOM_MAX,
+            zoom_snap=self.ZOOM_STEP,
         )
-        with io.BytesIO(png_tmp) as png_io, Image.open(png_io) as img:
-            if rotate:
-                img = img.rotate(90, expand=True)
-            img.save(png_out, dpi=(dpi, dpi))
+
+        segments = self._split_segments()
+        if self._simplify_tolerance is not None:
+            segments = self._simplify_segments(segments, renderer.zoom)
+        for transport, segment in segments:
+            renderer.segment(segment, **self._segment_kwargs(transport))
+
+        if self.ENDPOINT_ICONS and len(self._points) > 0:
+            renderer.fa_icon(
+                self._points[0].lat_lon,
+                "house",
+                z_index_offset=1500,
+                **self._styles["start_icon"],
+            )
+        if self.ENDPOINT_ICONS and len(self._points) > 1:
+            renderer.fa_icon(
+                self._points[-1].lat_lon,
+                "flag-checkered",
+                z_index_offset=1500,
+                **self._styles["final_icon"],
+            )
+        for p in self._posts:
+            renderer.post_icon(
+                p.lat_lon,
+                p.image_path,
+                z_index_offset=1000 if p.image_path else 500,
+                **self._styles["post_icon"],
+            )
+        return renderer
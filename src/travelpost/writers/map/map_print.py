@@ -2,11 +2,13 @@
 
 import pathlib
 
+from travelpost.writers.map.browser_pool import BrowserPool
 from travelpost.writers.map.interface import Bounds
-from travelpost.writers.map.interface import Point
 from travelpost.writers.map.interface import Post
 from travelpost.writers.map.map import Map
+from travelpost.writers.map.map import PointsLike
 from travelpost.writers.map.map import Styles
+from travelpost.writers.map.tile_cache import TileCache
 from travelpost.writers.map.units import mm
 from travelpost.writers.map.units import to_px
 
@@ -16,6 +18,7 @@ class PrintMap(Map):
 
     DPI: int = 300
     PADDING: float = to_px(6 * mm, DPI)
+    VIEWPORT: tuple[int, int] = (to_px(297 * mm, DPI), to_px(210 * mm, DPI))
     PRINT_STYLES: Styles = {
         "final_icon": {
             # circle
@@ -46,9 +49,12 @@ class PrintMap(Map):
 
     def __init__(
         self,
-        points: list[Point],
+        points: PointsLike,
         posts: list[Post],
         bounds: Bounds | None = None,
+        tiles: str | None = None,
+        simplify_tolerance: float | None = None,
+        encode_segments: bool = False,
     ) -> None:
         super().__init__(
             points,
@@ -58,6 +64,9 @@ class PrintMap(Map):
             padding=self.PADDING,
             show_only_flight_icons=True,
             styles=self.PRINT_STYLES,
+            tiles=tiles,
+            simplify_tolerance=simplify_tolerance,
+            encode_segments=encode_segments,
         )
 
     def to_png(
@@ -68,6 +77,9 @@ class PrintMap(Map):
         width_pt: float = 297 * mm,
         height_pt: float = 210 * mm,
         rotate: bool = False,
+        pool: BrowserPool | None = None,
+        tile_cache: TileCache | None = None,
+        icon_font: pathlib.Path | str | None = None,
     ) -> None:
         return super().to_png(
             png_out,
@@ -76,4 +88,7 @@ class PrintMap(Map):
             height=to_px(height_pt, self.DPI),
             dpi=self.DPI,
             rotate=rotate,
+            pool=pool,
+            tile_cache=tile_cache,
+            icon_font=icon_font,
         )
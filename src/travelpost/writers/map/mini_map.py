@@ -0,0 +1,138 @@
+"""Mini Map."""
+
+from collections.abc import Sequence
+import concurrent.futures
+import contextlib
+import dataclasses
+import logging
+import pathlib
+
+from travelpost.writers.map.browser_pool import BrowserPool
+from travelpost.writers.map.interface import Bounds
+from travelpost.writers.map.interface import Point
+from travelpost.writers.map.interface import Points
+from travelpost.writers.map.interface import Post
+from travelpost.writers.map.map import Styles
+from travelpost.writers.map.map_print import PrintMap
+from travelpost.writers.map.tile_cache import TileCache
+from travelpost.writers.map.units import mm
+from travelpost.writers.map.units import to_px
+
+logger = logging.getLogger(__name__)
+
+
+@dataclasses.dataclass(frozen=True, kw_only=True)
+class MiniMapSpec:
+    """Mini Map Specification."""
+
+    out: pathlib.Path
+    post: Post
+    points: Sequence[Point] | Points = ()
+    """The highlighted route segment (e.g. the travel to the post)."""
+    bounds: Bounds | None = None
+    """Defaults to the bounds of the points and the post."""
+
+
+class MiniMap(PrintMap):
+    """Mini Map (inset map of a post)."""
+
+    ZOOM_MAX: int = 12
+    PADDING: float = to_px(3 * mm, PrintMap.DPI)
+    PRINT_STYLES: Styles = {
+        "final_icon": {
+            "icon_size": to_px(3 * mm, PrintMap.DPI),
+            "font_size": 20,
+        },
+        "post_icon": {
+            "icon_size": to_px(4 * mm, PrintMap.DPI),
+            "empty_size": to_px(3 * mm, PrintMap.DPI),
+            "border_width": to_px(0.4 * mm, PrintMap.DPI),
+        },
+        "start_icon": {
+            "icon_size": to_px(3 * mm, PrintMap.DPI),
+            "font_size": 20,
+        },
+        "travel_segment": {
+            "icon_options": {
+                "icon_size": to_px(3 * mm, PrintMap.DPI),
+                "background_color": "goldenrod",
+                "font_size": 25,
+            },
+            "smooth_factor": to_px(0.5 / 2 * mm, PrintMap.DPI),
+            "weight": to_px(0.5 * mm, PrintMap.DPI),
+        },
+    }
+
+    ENDPOINT_ICONS: bool = False
+
+    WIDTH: float = 80 * mm
+    """Default width [pt]."""
+    HEIGHT: float = 50 * mm
+    """Default height [pt]."""
+
+    @classmethod
+    def from_spec(cls, spec: MiniMapSpec) -> "MiniMap":
+        return cls(
+            spec.points,
+            [spec.post],
+            bounds=spec.bounds,
+            encode_segments=True,
+        )
+
+
+def render_mini_maps(
+    specs: Sequence[MiniMapSpec],
+    *,
+    width_pt: float = MiniMap.WIDTH,
+    height_pt: float = MiniMap.HEIGHT,
+    tile_cache: TileCache | None = None,
+    icon_font: pathlib.Path | str | None = None,
+    pool: BrowserPool | None = None,
+    max_workers: int = 4,
+) -> list[pathlib.Path]:
+    """Renders the mini maps of many posts at once.
+
+    The maps are rendered without browser from the tiles of `tile_cache` if set
+    (every tile is downloaded once and shared by all maps), else in the warm
+    webdrivers of `pool` (a pool of `max_workers` webdrivers if not set).
+
+    Returns:
+        The paths of the rendered maps, failures are logged and skipped.
+    """
+    if len(specs) == 0:
+        return []
+    logger.info("Rendering %d mini maps", len(specs))
+
+    with contextlib.ExitStack() as stack:
+        if tile_cache is None and pool is None:
+            pool = stack.enter_context(BrowserPool(size=max_workers))
+        executor = stack.enter_context(
+            concurrent.futures.ThreadPoolExecutor(
+                max_workers=max_workers if tile_cache is not None else pool.size
+            )
+        )
+        futures = {
+            executor.submit(
+                MiniMap.from_spec(spec).to_png,
+                spec.out,
+                width_pt=width_pt,
+                height_pt=height_pt,
+                pool=pool,
+                tile_cache=tile_cache,
+                icon_font=icon_font,
+            ): spec
+            for spec in specs
+        }
+        failed = []
+        for future in concurrent.futures.as_completed(futures):
+            if (e := future.exception()) is not None:
+                failed.append((futures[future].out, e))
+
+    if len(failed) > 0:
+        logger.error(
+            "Failed to render %d mini maps:\n%s",
+            len(failed),
+            "\n".join(f"  {file!s:s} - {err!r:s}" for file, err in failed),
+        )
+    failed_files = {file for file, _ in failed}
+    return [spec.out for spec in specs if spec.out not in failed_files]
@@ -2,80 +2,118 @@
 
 from collections.abc import Sequence
 import logging
-import time
 import timeit
 from typing import Any
+import warnings
 
 import folium
 from folium.utilities import temp_html_filepath
-from selenium.webdriver.support.ui import WebDriverWait
 
-POLL_FREQUENCY: float = 0.1
+READY_SCRIPT: str = """
+const done = arguments[arguments.length - 1];
+L.Travel.whenTilesReady().then(() => done(true));
+"""
+"""Waits for the tiles of the map (async script)."""
+
 logger = logging.getLogger(__name__)
 
 
+def firefox_driver() -> Any:
+    """Returns a new headless Firefox webdriver."""
+    from selenium import webdriver
+
+    options = webdriver.firefox.options.Options()
+    options.add_argument("--headless")
+    return webdriver.Firefox(options=options)
+
+
 def to_png(
     map: folium.Map,
-    poll_frequency: float = 0.5,
+    poll_frequency: float | None = None,
     max_delay: float = 3.0,
     driver: Any = None,
     size: Sequence[int] | None = None,
 ) -> bytes:
     """Export the HTML to byte representation of a PNG image.
 
-    Uses selenium to render the HTML and record a PNG. You may need to adjust
-    the `poll_frequency` and `max_delay` keyword argument if maps render without
-    data or tiles.
+    Uses selenium to render the HTML and record a PNG as soon as all tiles are
+    loaded and faded in (`L.Travel.whenTilesReady` of the tile loading
+    control). You may need to adjust the `max_delay` keyword argument if maps
+    render without tiles.
+
+    Uses a new headless Firefox webdriver by default, which is quit
+    afterwards, though you can provide your own (e.g. of a `BrowserPool`),
+    which is kept open.
+
+    The durations of the render steps are logged (`extra={"timings": ...}`).
 
-    Uses a headless Firefox webdriver by default, though you can provide your
-    own.
+    `poll_frequency` is deprecated and ignored, since the tiles are not polled
+    anymore.
 
     Examples
     --------
     >>> m._to_png()
-    >>> m._to_png(time=10)  # Wait 10 seconds between render and snapshot.
+    >>> m._to_png(max_delay=10)  # Wait at most 10 seconds for the tiles.
 
     """
+    if poll_frequency is not None:
+        msg = "'poll_frequency' is deprecated and ignored"
+        warnings.warn(msg, DeprecationWarning, stacklevel=2)
+
     logger.info("Printing map ...")
-    start = timeit.default_timer()
+    timings = {}
+    start = last = timeit.default_timer()
+
+    def lap(name: str) -> None:
+        nonlocal last
+        now = timeit.default_timer()
+        timings[name] = now - last
+        last = now
 
+    quit_driver = driver is None
     if driver is None:
-        from selenium import webdriver
-
-        options = webdriver.firefox.options.Options()
-        options.add_argument("--headless")
-        driver = webdriver.Firefox(options=options)
-
-    if size is None:
-        driver.fullscreen_window()
-    else:
-        window_size = driver.execute_script(
-            """
-            return [window.outerWidth - window.innerWidth + arguments[0],
-                window.outerHeight - window.innerHeight + arguments[1]];
-            """,
-            *size,
-        )
-        driver.set_window_size(*window_size)
-
-    html = map.get_root().render()
-    with temp_html_filepath(html) as fname:
-        # We need the tempfile to avoid JS security issues.
-        driver.get(f"file:///{fname:s}")
-        WebDriverWait(driver, max_delay, poll_frequency=poll_frequency).until(
-            lambda d: d.find_element(
-                "class name", "tile-loading-control"
-            ).get_attribute("data-ready")
-            == "true"
-        )
-        # NOTE: See source code of Leaflet GridLayer at:
-        #       https://github.com/Leaflet/Leaflet/blob/d15112c9e8ac339f0f74f563959d0423d291308d/src/layer/tile/GridLayer.js#L885C1-L886C29
-        if map.options.get("fade_animation", True):
-            time.sleep(0.25)
-        div = driver.find_element("class name", "folium-map")
-        png = div.screenshot_as_png
-        driver.quit()
-
-    end = timeit.default_timer()
-    logger.info("Printed map in %.2f s", end - start)
+        driver = firefox_driver()
+        lap("driver")
+
+    try:
+        if size is None:
+            driver.fullscreen_window()
+        else:
+            window_size = driver.execute_script(
+                """
+                return [window.outerWidth - window.innerWidth + arguments[0],
+                    window.outerHeight - window.innerHeight + arguments[1]];
+                """,
+                *size,
+            )
+            driver.set_window_size(*window_size)
+
+        html = map.get_root().render()
+        lap("render_html")
+        with temp_html_filepath(html) as fname:
+            # We need the tempfile to avoid JS security issues.
+            driver.get(f"file:///{fname:s}")
+            lap("page_load")
+            # Lent webdrivers keep their script timeout
+            script_timeout = None if quit_driver else driver.timeouts.script
+            driver.set_script_timeout(max_delay)
+            try:
+                driver.execute_async_script(READY_SCRIPT)
+            finally:
+                if script_timeout is not None:
+                    driver.set_script_timeout(script_timeout)
+            lap("tile_wait")
+            div = driver.find_element("class name", "folium-map")
+            png = div.screenshot_as_png
+            lap("screenshot")
+    finally:
+        if quit_driver:
+            driver.quit()
+
+    logger.info(
+        "Printed map in %.2f s (%s)",
+        timeit.default_timer() - start,
+        ", ".join(f"{k:s}: {v:.2f} s" for k, v in timings.items()),
+        extra={"timings": timings},
+    )
     return png
@@ -0,0 +1,54 @@
+"""Encoded Polyline.
+
+Google's Encoded Polyline Algorithm Format, see
+https://developers.google.com/maps/documentation/utilities/polylinealgorithm
+"""
+
+from collections.abc import Sequence
+
+import numpy as np
+
+PRECISION: int = 5
+"""Number of decimals of the coordinates (5: ~1 m)."""
+
+
+def encode(
+    locations: Sequence[tuple[float, float]],
+    precision: int = PRECISION,
+) -> str:
+    """Encodes `(lat, lon)` pairs."""
+    if len(locations) == 0:
+        return ""
+    values = np.round(np.asarray(locations, dtype=float) * 10**precision)
+    deltas = np.diff(values, axis=0, prepend=0.0).astype(np.int64).ravel()
+
+    chunks = []
+    for delta in deltas.tolist():
+        value = ~(delta << 1) if delta < 0 else delta << 1
+        while value >= 0x20:
+            chunks.append(chr((0x20 | (value & 0x1F)) + 63))
+            value >>= 5
+        chunks.append(chr(value + 63))
+    return "".join(chunks)
+
+
+def decode(
+    encoded: str,
+    precision: int = PRECISION,
+) -> list[tuple[float, float]]:
+    """Decodes `(lat, lon)` pairs."""
+    values = []
+    value = shift = 0
+    for char in encoded:
+        byte = ord(char) - 63
+        value |= (byte & 0x1F) << shift
+        shift += 5
+        if byte < 0x20:
+            values.append(~(value >> 1) if value & 1 else value >> 1)
+            value = shift = 0
+
+    if len(values) % 2 != 0:
+        msg = f"invalid encoded polyline: {encoded!r:s}"
+        raise ValueError(msg)
+    coords = np.cumsum(np.array(values, dtype=np.int64).reshape(-1, 2), axis=0)
+    return [(lat, lon) for lat, lon in (coords / 10**precision).tolist()]
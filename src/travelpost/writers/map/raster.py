@@ -0,0 +1,518 @@
+"""Raster Map.
+
+Renders maps without a browser: the tiles of a `TileCache` are composed and the
+route and icons are drawn with Pillow, following the layout of the Leaflet map
+(fit bounds with padding, zoom snap, icon anchors and z-order).
+"""
+
+from collections.abc import Sequence
+import concurrent.futures
+import dataclasses
+import io
+import logging
+import math
+import pathlib
+from typing import Any
+
+from PIL import Image
+from PIL import ImageColor
+from PIL import ImageDraw
+from PIL import ImageFont
+import numpy as np
+
+from travelpost.utils.thumbnails.image import pil_image_thumbnail
+from travelpost.writers.map.interface import Bounds
+from travelpost.writers.map.simplify import TILE_SIZE
+from travelpost.writers.map.simplify import fit_zoom
+from travelpost.writers.map.simplify import simplify
+from travelpost.writers.map.simplify import to_web_mercator
+from travelpost.writers.map.tile_cache import TileCache
+
+BACKGROUND_COLOR: str = "#dddddd"
+"""Color of missing tiles (background of the Leaflet container)."""
+
+SIZE_FACTOR: float = 2.0
+"""Minimum size of a segment (relative to the icon size) to show its transport
+icon, see `L.Travel.Segment`."""
+
+TRANSPORT_ICONS: dict[str, str] = {
+    "barefoot": "shoe-prints",
+    "walking": "person-walking",
+    "hiking": "person-hiking",
+    "running": "person-running",
+    "bicycle": "person-biking",
+    "flight": "plane",
+    "car": "car-side",
+    "bus": "bus-simple",
+    "taxi": "taxi",
+    "train": "train",
+    "tram": "train-tram",
+    "motorbike": "motorcycle",
+    "4x4": "truck-pickup",
+    "tuk_tuk": "car",
+    "hitchhiking": "thumbs-up",
+    "cable_car": "cable-car",
+    "ferry": "ferry",
+    "motorboat": "ship",
+    "sailing": "sailboat",
+}
+"""Font Awesome icons of the transports, see `L.Travel.TRANSPORT_ICON_MAP`."""
+
+FA_ICON_OPTIONS: dict[str, Any] = {
+    "icon_shape": "circle",
+    "icon_size": 32,
+    "background_color": "#3388ff",
+    "border_color": "white",
+    "border_width": 2,
+    "color": "white",
+    "font_size": 18,
+}
+"""Default options of Font Awesome icons, see `L.Travel.FAIcon`."""
+
+POST_ICON_OPTIONS: dict[str, Any] = {
+    "icon_shape": "circle",
+    "icon_size": 32,
+    "empty_size": 16,
+    "background_color": "#3388ff",
+    "border_color": "white",
+    "border_width": 2,
+}
+"""Default options of post icons, see `L.Travel.PostIcon`."""
+
+logger = logging.getLogger(__name__)
+
+type Color = tuple[int, ...]
+
+
+def rgba(color: str | None, opacity: float = 1.0) -> Color | None:
+    """Returns the `(r, g, b, a)` of a CSS color (`None` if unset)."""
+    if color is None or color in ("unset", "none", "transparent"):
+        return None
+    r, g, b, *a = ImageColor.getrgb(color)
+    return r, g, b, int(round((a[0] if a else 255) * opacity))
+
+
+def _dash(
+    xy: np.ndarray,
+    dash_array: tuple[float, float],
+    dash_offset: float = 0.0,
+) -> list[np.ndarray]:
+    """Splits a polyline into dashes (SVG `stroke-dasharray` and
+    `stroke-dashoffset`)."""
+    on, off = dash_array
+    period = on + off
+    lengths = np.hypot(*np.diff(xy, axis=0).T)
+    cum = np.concatenate(((0.0,), np.cumsum(lengths)))
+    dashes = []
+    start = -(dash_offset % period)
+    while start < cum[-1]:
+        a, b = max(start, 0.0), min(start + on, cum[-1])
+        if b > a:
+            inner = (cum > a) & (cum < b)
+            dashes.append(
+                np.vstack(
+                    (
+                        [
+                            np.interp(a, cum, xy[:, 0]),
+                            np.interp(a, cum, xy[:, 1]),
+                        ],
+                        xy[inner],
+                        [
+                            np.interp(b, cum, xy[:, 0]),
+                            np.interp(b, cum, xy[:, 1]),
+                        ],
+                    )
+                )
+            )
+        start += period
+    return dashes
+
+
+def _center(xy: np.ndarray) -> np.ndarray:
+    """Returns the point halfway along the polyline (`Polyline.getCenter`)."""
+    lengths = np.hypot(*np.diff(xy, axis=0).T)
+    cum = np.concatenate(((0.0,), np.cumsum(lengths)))
+    half = cum[-1] / 2
+    return np.array(
+        (np.interp(half, cum, xy[:, 0]), np.interp(half, cum, xy[:, 1]))
+    )
+
+
+@dataclasses.dataclass(frozen=True, kw_only=True)
+class Line:
+    """Line (coordinates in image pixels)."""
+
+    xy: np.ndarray
+    color: Color | None
+    width: float
+    dash_array: tuple[float, float] | None = None
+    dash_offset: float = 0.0
+
+    def dashes(self) -> list[np.ndarray]:
+        """Returns the drawn parts of the line."""
+        if self.dash_array is None:
+            return [self.xy]
+        return _dash(self.xy, self.dash_array, self.dash_offset)
+
+
+@dataclasses.dataclass(frozen=True, kw_only=True)
+class Marker:
+    """Marker (coordinates in image pixels).
+
+    A Font Awesome icon if `icon` is set, else a post icon (with the image
+    at `image_path`, if set).
+    """
+
+    xy: np.ndarray
+    z_index: float
+    icon: str | None = None
+    image_path: pathlib.Path | None = None
+    options: dict[str, Any] = dataclasses.field(default_factory=dict)
+
+    @property
+    def size(self) -> int:
+        if self.icon is None and self.image_path is None:
+            return self.options["empty_size"]
+        return self.options["icon_size"]
+
+    @property
+    def box(self) -> tuple[int, int, int, int]:
+        """Returns `(left, top, right, bottom)` (inclusive)."""
+        # Leaflet anchor: `(size / 2, size / 2 - 1)`
+        size = self.size
+        left = int(round(self.xy[0] - size / 2))
+        top = int(round(self.xy[1] - size / 2 + 1))
+        return left, top, left + size - 1, top + size - 1
+
+
+class RasterRenderer:
+    """Raster Renderer.
+
+    Segments and icons are collected first and drawn by `render` in the order
+    of the Leaflet panes: tiles, paths and markers (sorted by z-index).
+
+    Args:
+        tile_cache: The tiles.
+        size: The image size `(width, height)` [px].
+        icon_font: The Font Awesome (solid) font file to draw the icon
+            glyphs, icons are drawn without glyph if it is not set.
+    """
+
+    def __init__(
+        self,
+        tile_cache: TileCache,
+        size: tuple[int, int],
+        icon_font: pathlib.Path | str | None = None,
+    ) -> None:
+        self._tile_cache = tile_cache
+        self._size = size
+        self._icon_font = icon_font
+
+        self._zoom = 0.0
+        self._origin = np.zeros(2)
+        self._lines: list[Line] = []
+        self._markers: list[Marker] = []
+        self._fonts: dict[int, ImageFont.FreeTypeFont] = {}
+        self._glyphs: dict[str, str | None] = {}
+
+    @property
+    def size(self) -> tuple[int, int]:
+        return self._size
+
+    @property
+    def zoom(self) -> float:
+        return self._zoom
+
+    @property
+    def lines(self) -> tuple[Line, ...]:
+        return tuple(self._lines)
+
+    @property
+    def markers(self) -> tuple[Marker, ...]:
+        """The markers in drawing order (z-index)."""
+        return tuple(sorted(self._markers, key=lambda m: m.z_index))
+
+    def fit_bounds(
+        self,
+        bounds: Bounds,
+        padding: float = 0.0,
+        zoom_min: int = 0,
+        zoom_max: int = 18,
+        zoom_snap: float = 1.0,
+    ) -> None:
+        """Sets the view, that fits the bounds (`Map.fitBounds`)."""
+        zoom = fit_zoom(
+            bounds, (self._size[0] - 2 * padding, self._size[1] - 2 * padding)
+        )
+        if math.isinf(zoom):
+            zoom = zoom_max
+        elif zoom_snap:
+            zoom = math.floor(round(zoom / zoom_snap, 2)) * zoom_snap
+        self._zoom = max(zoom_min, min(zoom_max, zoom))
+
+        corners = to_web_mercator(np.array(bounds.to_tuple()))
+        center = corners.mean(axis=0) * self._scale
+        self._origin = center - np.array(self._size) / 2
+
+    @property
+    def _scale(self) -> float:
+        return TILE_SIZE * 2**self._zoom
+
+    def project(self, lat_lon: Sequence[tuple[float, float]]) -> np.ndarray:
+        """Returns the image pixel coordinates of `(lat, lon)` pairs."""
+        xy = to_web_mercator(np.asarray(lat_lon, dtype=float).reshape(-1, 2))
+        return xy * self._scale - self._origin
+
+    def _font(self, size: int) -> ImageFont.FreeTypeFont:
+        if size not in self._fonts:
+            self._fonts[size] = ImageFont.truetype(self._icon_font, size)
+        return self._fonts[size]
+
+    def glyph(self, icon: str) -> str | None:
+        """Returns the Font Awesome glyph of the icon (`None` without icon
+        font or if the icon is unknown)."""
+        if self._icon_font is None:
+            return None
+        if icon not in self._glyphs:
+            from travelpost.writers.pdf.libs.fontawesome import fa_icon
+
+            try:
+                self._glyphs[icon] = fa_icon(icon).unicode
+            except (KeyError, ValueError) as e:
+                logger.warning("No glyph of icon %r: %s", icon, e)
+                self._glyphs[icon] = None
+        return self._glyphs[icon]
+
+    def segment(
+        self,
+        locations: Sequence[tuple[float, float]],
+        transport: str | None,
+        *,
+        color: str = "white",
+        dash_array: str | None = None,
+        dash_offset: str | None = None,
+        icon_options: dict | None = None,
+        opacity: float = 1.0,
+        smooth_factor: float = 1.0,
+        transport_marker_z_index_offset: int = 0,
+        weight: int = 3,
+        **kwargs: object,
+    ) -> None:
+        """Adds a travel segment (`L.Travel.Segment`)."""
+        locations = simplify(locations, self._zoom, smooth_factor)
+        xy = self.project(locations)
+        self._lines.append(
+            Line(
+                xy=xy,
+                color=rgba(color, opacity),
+                width=weight,
+                dash_array=(
+                    tuple(float(v) for v in dash_array.split())
+                    if dash_array
+                    else None
+                ),
+                dash_offset=float(dash_offset or 0),
+            )
+        )
+
+        icon = TRANSPORT_ICONS.get((transport or "unknown").lower())
+        if icon is None or len(xy) < 2:
+            return
+        options = {**FA_ICON_OPTIONS, **(icon_options or {})}
+        size = np.ptp(xy, axis=0)
+        lim = SIZE_FACTOR * options["icon_size"]
+        if size[0] > lim or size[1] > lim:
+            center = _center(xy)
+            self._markers.append(
+                Marker(
+                    xy=center,
+                    z_index=center[1] + transport_marker_z_index_offset,
+                    icon=icon,
+                    options=options,
+                )
+            )
+
+    def fa_icon(
+        self,
+        location: tuple[float, float],
+        icon: str,
+        z_index_offset: int = 0,
+        **kwargs: object,
+    ) -> None:
+        """Adds a marker with a Font Awesome icon (`L.Travel.FAIcon`)."""
+        (xy,) = self.project([location])
+        self._markers.append(
+            Marker(
+                xy=xy,
+                z_index=xy[1] + z_index_offset,
+                icon=icon,
+                options={**FA_ICON_OPTIONS, **kwargs},
+            )
+        )
+
+    def post_icon(
+        self,
+        location: tuple[float, float],
+        image_path: pathlib.Path | None,
+        z_index_offset: int = 0,
+        **kwargs: object,
+    ) -> None:
+        """Adds a marker with the post image (`L.Travel.PostIcon`)."""
+        (xy,) = self.project([location])
+        self._markers.append(
+            Marker(
+                xy=xy,
+                z_index=xy[1] + z_index_offset,
+                image_path=image_path,
+                options={**POST_ICON_OPTIONS, **kwargs},
+            )
+        )
+
+    @staticmethod
+    def _draw_shape(
+        draw: ImageDraw.ImageDraw,
+        box: tuple[int, int, int, int],
+        shape: str,
+        **kwargs: object,
+    ) -> None:
+        match shape:
+            case "circle":
+                draw.ellipse(box, **kwargs)
+            case "rounded-square":
+                radius = (box[2] - box[0] + 1) // 4
+                draw.rounded_rectangle(box, radius, **kwargs)
+            case "square":
+                draw.rectangle(box, **kwargs)
+            case _:
+                msg = f"invalid icon shape: {shape!r:s}"
+                raise ValueError(msg)
+
+    @staticmethod
+    def _draw_line(draw: ImageDraw.ImageDraw, line: Line) -> None:
+        r = line.width / 2
+        for dash in line.dashes():
+            pts = [tuple(p) for p in dash.tolist()]
+            draw.line(
+                pts, fill=line.color, width=int(line.width), joint="curve"
+            )
+            # round line caps
+            for x, y in (pts[0], pts[-1]):
+                draw.ellipse((x - r, y - r, x + r, y + r), fill=line.color)
+
+    def _draw_marker(self, img: Image.Image, marker: Marker) -> None:
+        options = marker.options
+        box = marker.box
+        if marker.image_path is not None:
+            size = marker.size
+            # Reduced while decoded (JPEG draft), converted afterwards
+            with Image.open(marker.image_path) as post_img:
+                thumbnail = pil_image_thumbnail(
+                    post_img, size, fit="cover"
+                ).convert("RGB")
+            mask = Image.new("L", (size, size), 0)
+            self._draw_shape(
+                ImageDraw.Draw(mask),
+                (0, 0, size - 1, size - 1),
+                options["icon_shape"],
+                fill=255,
+            )
+            img.paste(thumbnail, box[:2], mask)
+
+        draw = ImageDraw.Draw(img)
+        self._draw_shape(
+            draw,
+            box,
+            options["icon_shape"],
+            fill=(
+                None
+                if marker.image_path is not None
+                else rgba(options["background_color"])
+            ),
+            outline=(
+                rgba(options["border_color"])
+                if options["border_width"]
+                else None
+            ),
+            width=options["border_width"],
+        )
+
+        glyph = self.glyph(marker.icon) if marker.icon is not None else None
+        if glyph is not None:
+            draw.text(
+                ((box[0] + box[2]) / 2, (box[1] + box[3]) / 2),
+                glyph,
+                fill=rgba(options["color"]),
+                font=self._font(options["font_size"]),
+                anchor="mm",
+            )
+
+    def render_tiles(self) -> Image.Image:
+        """Returns the map image of the tiles only (background)."""
+        w, h = self._size
+        tile_zoom = int(round(self._zoom))
+        n = 2**tile_zoom
+        # scale of the tile pixels
+        s = 2 ** (self._zoom - tile_zoom)
+        x0, y0 = self._origin / s
+        x1, y1 = x0 + w / s, y0 + h / s
+        tx0, ty0 = math.floor(x0 / TILE_SIZE), math.floor(y0 / TILE_SIZE)
+        tx1, ty1 = math.floor(x1 / TILE_SIZE), math.floor(y1 / TILE_SIZE)
+
+        canvas = Image.new(
+            "RGB",
+            ((tx1 - tx0 + 1) * TILE_SIZE, (ty1 - ty0 + 1) * TILE_SIZE),
+            BACKGROUND_COLOR,
+        )
+        tiles = [
+            (tx, ty)
+            for tx in range(tx0, tx1 + 1)
+            for ty in range(ty0, ty1 + 1)
+            if 0 <= ty < n
+        ]
+
+        def get(tile: tuple[int, int]) -> bytes | None:
+            tx, ty = tile
+            try:
+                return self._tile_cache.get(tile_zoom, tx % n, ty)
+            except KeyError:
+                return None
+
+        missing = 0
+        with concurrent.futures.ThreadPoolExecutor(max_workers=8) as pool:
+            for (tx, ty), data in zip(tiles, pool.map(get, tiles), strict=True):
+                if data is None:
+                    missing += 1
+                    continue
+                with Image.open(io.BytesIO(data)) as tile:
+                    canvas.paste(
+                        tile.convert("RGB"),
+                        ((tx - tx0) * TILE_SIZE, (ty - ty0) * TILE_SIZE),
+                    )
+        if missing > 0:
+            logger.warning(
+                "Missing %d of %d tiles (zoom %d)",
+                missing,
+                len(tiles),
+                tile_zoom,
+            )
+
+        ox, oy = tx0 * TILE_SIZE, ty0 * TILE_SIZE
+        return canvas.resize(
+            (w, h),
+            resample=Image.Resampling.LANCZOS,
+            box=(x0 - ox, y0 - oy, x1 - ox, y1 - oy),
+        )
+
+    def render(self) -> Image.Image:
+        """Returns the map image."""
+        img = self.render_tiles().convert("RGBA")
+
+        paths = Image.new("RGBA", img.size, (0, 0, 0, 0))
+        draw = ImageDraw.Draw(paths)
+        for line in self._lines:
+            self._draw_line(draw, line)
+        img.alpha_composite(paths)
+
+        for marker in self.markers:
+            self._draw_marker(img, marker)
+        return img.convert("RGB")
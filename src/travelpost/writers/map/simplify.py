@@ -0,0 +1,79 @@
+"""Simplify.
+
+Zoom-aware simplification of polylines (Douglas-Peucker) in Web Mercator
+pixels, so that the number of vertices scales with the map pixels instead of
+the number of GPS fixes.
+"""
+
+from collections.abc import Sequence
+import math
+
+import numpy as np
+import shapely
+
+from travelpost.writers.map.interface import Bounds
+from travelpost.writers.map.tile_cache import MAX_LAT
+
+TILE_SIZE: int = 256
+"""Tile size [px]."""
+
+
+def to_web_mercator(lat_lon: np.ndarray) -> np.ndarray:
+    """Projects `(lat, lon)` pairs to normalized Web Mercator `(x, y)` in
+    `[0, 1]`."""
+    lat = np.radians(np.clip(lat_lon[:, 0], -MAX_LAT, MAX_LAT))
+    x = (lat_lon[:, 1] + 180.0) / 360.0
+    y = (1.0 - np.arcsinh(np.tan(lat)) / np.pi) / 2.0
+    return np.column_stack((x, y))
+
+
+def from_web_mercator(xy: np.ndarray) -> np.ndarray:
+    """Unprojects normalized Web Mercator `(x, y)` to `(lat, lon)` pairs."""
+    lon = xy[:, 0] * 360.0 - 180.0
+    lat = np.degrees(np.arctan(np.sinh(np.pi * (1.0 - 2.0 * xy[:, 1]))))
+    return np.column_stack((lat, lon))
+
+
+def fit_zoom(bounds: Bounds, size: tuple[int, int]) -> float:
+    """Returns the (fractional) zoom, at which the bounds fit into `size`
+    (`(width, height)` in px)."""
+    (x0, y0), (x1, y1) = to_web_mercator(
+        np.array(
+            ((bounds.lat_max, bounds.lon_min), (bounds.lat_min, bounds.lon_max))
+        )
+    )
+    scales = [
+        px / (TILE_SIZE * d)
+        for px, d in zip(size, (x1 - x0, y1 - y0), strict=True)
+        if d > 0
+    ]
+    if len(scales) == 0:
+        return math.inf
+    return math.log2(min(scales))
+
+
+def simplify(
+    locations: Sequence[tuple[float, float]],
+    zoom: float,
+    tolerance: float = 0.5,
+) -> list[tuple[float, float]]:
+    """Simplifies a polyline of `(lat, lon)` pairs.
+
+    Args:
+        locations: The polyline.
+        zoom: The zoom the polyline is drawn at (or the maximum one).
+        tolerance: The maximum deviation [px] of the simplified polyline.
+
+    Returns:
+        The simplified polyline, including the first and last location.
+    """
+    if len(locations) <= 2 or math.isinf(zoom):
+        return list(locations)
+
+    scale = TILE_SIZE * 2**zoom
+    xy = to_web_mercator(np.asarray(locations, dtype=float)) * scale
+    line = shapely.simplify(
+        shapely.LineString(xy), tolerance, preserve_topology=False
+    )
+    lat_lon = from_web_mercator(shapely.get_coordinates(line) / scale)
+    return [(lat, lon) for lat, lon in lat_lon.tolist()]
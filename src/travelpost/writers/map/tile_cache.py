@@ -0,0 +1,214 @@
+"""Tile Cache."""
+
+from collections.abc import Iterator
+import concurrent.futures
+import logging
+import math
+import pathlib
+import threading
+
+import requests
+
+from travelpost.writers.map.interface import Bounds
+
+MAX_LAT: float = 85.0511287798
+"""Maximum latitude of the Web Mercator projection."""
+
+MAX_PREFETCH_TILES: int = 100_000
+"""Maximum number of tiles to prefetch at once."""
+
+logger = logging.getLogger(__name__)
+
+
+def tile_xy(lat: float, lon: float, zoom: int) -> tuple[int, int]:
+    """Returns the XYZ tile `(x, y)` containing the coordinate."""
+    n = 2**zoom
+    lat = math.radians(max(-MAX_LAT, min(MAX_LAT, lat)))
+    x = int((lon + 180.0) / 360.0 * n)
+    y = int((1.0 - math.asinh(math.tan(lat)) / math.pi) / 2.0 * n)
+    return min(max(x, 0), n - 1), min(max(y, 0), n - 1)
+
+
+def tile_range(bounds: Bounds, zoom: int) -> tuple[range, range]:
+    """Returns the ranges of `x` and `y` of the tiles covering the bounds."""
+    x_min, y_min = tile_xy(bounds.lat_max, bounds.lon_min, zoom)
+    x_max, y_max = tile_xy(bounds.lat_min, bounds.lon_max, zoom)
+    return range(x_min, x_max + 1), range(y_min, y_max + 1)
+
+
+def iter_tiles(
+    bounds: Bounds,
+    zoom_min: int,
+    zoom_max: int,
+) -> Iterator[tuple[int, int, int]]:
+    """Yields the tiles `(z, x, y)` covering the bounds at every zoom."""
+    for z in range(zoom_min, zoom_max + 1):
+        xs, ys = tile_range(bounds, z)
+        for x in xs:
+            for y in ys:
+                yield z, x, y
+
+
+def count_tiles(bounds: Bounds, zoom_min: int, zoom_max: int) -> int:
+    """Returns the number of tiles covering the bounds at every zoom."""
+    count = 0
+    for z in range(zoom_min, zoom_max + 1):
+        xs, ys = tile_range(bounds, z)
+        count += len(xs) * len(ys)
+    return count
+
+
+class TileCache:
+    """Disk cache of XYZ tiles (`<path>/<z>/<x>/<y>`).
+
+    Missing tiles are downloaded from `url` on first access, unless the cache
+    is `offline`.
+    """
+
+    def __init__(
+        self,
+        path: pathlib.Path | str,
+        url: str,
+        offline: bool = False,
+        timeout: float = 10.0,
+    ) -> None:
+        self._path = pathlib.Path(path)
+        self._url = url
+        self._offline = offline
+        self._timeout = timeout
+
+        self._local = threading.local()
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__:s}(path={self._path.as_posix()!r:s})"
+
+    @property
+    def offline(self) -> bool:
+        return self._offline
+
+    @property
+    def path(self) -> pathlib.Path:
+        return self._path
+
+    @property
+    def url(self) -> str:
+        return self._url
+
+    @property
+    def _session(self) -> requests.Session:
+        # One session per thread, since sessions are not thread-safe
+        session = getattr(self._local, "session", None)
+        if session is None:
+            session = requests.Session()
+            session.headers["User-Agent"] = "TravelPost"
+            self._local.session = session
+        return session
+
+    def tile_path(self, z: int, x: int, y: int) -> pathlib.Path:
+        return self._path / str(z) / str(x) / str(y)
+
+    def contains(self, z: int, x: int, y: int) -> bool:
+        return self.tile_path(z, x, y).exists()
+
+    def _download(self, z: int, x: int, y: int) -> bytes:
+        file = self.tile_path(z, x, y)
+        file.parent.mkdir(exist_ok=True, parents=True)
+        part = file.with_name(f"{file.name:s}.{threading.get_ident():d}.part")
+        try:
+            resp = self._session.get(
+                self._url.format(z=z, x=x, y=y), timeout=self._timeout
+            )
+            resp.raise_for_status()
+            part.write_bytes(resp.content)
+            part.replace(file)
+        except (Exception, KeyboardInterrupt):
+            part.unlink(missing_ok=True)
+            raise
+        return resp.content
+
+    def get(self, z: int, x: int, y: int) -> bytes:
+        """Returns the tile, downloads it if it is missing.
+
+        Raises:
+            KeyError: If the tile is missing and the cache is offline.
+        """
+        file = self.tile_path(z, x, y)
+        if file.exists():
+            return file.read_bytes()
+        if self._offline:
+            msg = f"missing tile {z:d}/{x:d}/{y:d}"
+            raise KeyError(msg)
+        return self._download(z, x, y)
+
+    def prefetch(
+        self,
+        bounds: Bounds,
+        zoom_min: int,
+        zoom_max: int,
+        max_workers: int = 8,
+    ) -> int:
+        """Downloads all missing tiles covering the bounds for the zoom range.
+
+        Failed downloads do not stop the prefetch, they are counted and logged
+        (the tiles are downloaded again on access).
+
+        Returns:
+            The number of downloaded tiles.
+
+        Raises:
+            ValueError: If the bounds & zoom range cover more than
+                `MAX_PREFETCH_TILES` tiles.
+        """
+        count = count_tiles(bounds, zoom_min, zoom_max)
+        if count > MAX_PREFETCH_TILES:
+            msg = (
+                f"too many tiles to prefetch ({count:d} > "
+                f"{MAX_PREFETCH_TILES:d}), reduce the zoom range"
+            )
+            raise ValueError(msg)
+
+        if self._offline:
+            logger.info("Offline, tiles are not prefetched")
+            return 0
+        missing = [
+            t
+            for t in iter_tiles(bounds, zoom_min, zoom_max)
+            if not self.contains(*t)
+        ]
+        logger.info(
+            "Prefetching %d of %d tiles (zoom %d-%d) into '%s'",
+            len(missing),
+            count,
+            zoom_min,
+            zoom_max,
+            self._path,
+        )
+        if len(missing) == 0:
+            return 0
+
+        fetched = 0
+        failed = []
+        with concurrent.futures.ThreadPoolExecutor(
+            max_workers=max_workers
+        ) as pool:
+            futures = {pool.submit(self._download, *t): t for t in missing}
+            for future in concurrent.futures.as_completed(futures):
+                try:
+                    future.result()
+                except (OSError, requests.RequestException) as e:
+                    failed.append((futures[future], e))
+                else:
+                    fetched += 1
+        if failed:
+            (z, x, y), e = failed[0]
+            logger.warning(
+                "Could not prefetch %d of %d tiles (e.g. %d/%d/%d: %r)",
+                len(failed),
+                len(missing),
+                z,
+                x,
+                y,
+                e,
+            )
+        logger.info("Prefetched %d tiles", fetched)
+        return fetched
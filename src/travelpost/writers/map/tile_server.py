@@ -0,0 +1,128 @@
+"""Tile Server."""
+
+import http.server
+import logging
+import re
+import threading
+from typing import Any, Self
+
+from travelpost.writers.map.tile_cache import TileCache
+
+logger = logging.getLogger(__name__)
+
+
+def _content_type(tile: bytes) -> str:
+    if tile.startswith(b"\x89PNG"):
+        return "image/png"
+    if tile.startswith(b"RIFF") and tile[8:12] == b"WEBP":
+        return "image/webp"
+    return "image/jpeg"
+
+
+class _TileRequestHandler(http.server.BaseHTTPRequestHandler):
+    PATH_PATTERN: re.Pattern = re.compile(r"^/(\d+)/(\d+)/(\d+)$")
+
+    server: "_TileHTTPServer"
+
+    def do_GET(self) -> None:
+        match = self.PATH_PATTERN.match(self.path)
+        if match is None:
+            self.send_error(404)
+            return
+
+        z, x, y = (int(g) for g in match.groups())
+        try:
+            tile = self.server.cache.get(z, x, y)
+        except KeyError:
+            self.send_error(404)
+            return
+        except Exception as e:
+            logger.error("Could not load tile %d/%d/%d - %r", z, x, y, e)
+            self.send_error(502)
+            return
+
+        self.send_response(200)
+        self.send_header("Access-Control-Allow-Origin", "*")
+        self.send_header("Cache-Control", "public, max-age=31536000")
+        self.send_header("Content-Length", str(len(tile)))
+        self.send_header("Content-Type", _content_type(tile))
+        self.end_headers()
+        self.wfile.write(tile)
+
+    def log_message(self, format: str, *args: Any) -> None:
+        logger.debug(format, *args)
+
+
+class _TileHTTPServer(http.server.ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self, address: tuple[str, int], cache: TileCache) -> None:
+        super().__init__(address, _TileRequestHandler)
+        self.cache = cache
+
+
+class TileServer:
+    """Local HTTP server of a `TileCache`.
+
+    Examples
+    --------
+    >>> cache = TileCache("data/tiles", Map.TILES)
+    >>> with TileServer(cache) as server:
+    ...     Map(points, posts, tiles=server.url).to_png("map.png")
+
+    """
+
+    def __init__(
+        self,
+        cache: TileCache,
+        host: str = "127.0.0.1",
+        port: int = 0,
+    ) -> None:
+        self._cache = cache
+        self._address = (host, port)
+        self._server: _TileHTTPServer | None = None
+        self._thread: threading.Thread | None = None
+
+    def __enter__(self) -> Self:
+        self.start()
+        return self
+
+    def __exit__(self, *args: object) -> None:
+        self.stop()
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__:s}(cache={self._cache!r:s})"
+
+    @property
+    def cache(self) -> TileCache:
+        return self._cache
+
+    @property
+    def url(self) -> str:
+        """The tile url template (`{z}/{x}/{y}`) for `Map(tiles=...)`."""
+        if self._server is None:
+            msg = "tile server is not running"
+            raise RuntimeError(msg)
+        host, port = self._server.server_address[:2]
+        return f"http://{host:s}:{port:d}/{{z}}/{{x}}/{{y}}"
+
+    def start(self) -> None:
+        if self._server is not None:
+            return
+        self._server = _TileHTTPServer(self._address, self._cache)
+        self._thread = threading.Thread(
+            target=self._server.serve_forever,
+            name=type(self).__name__,
+            daemon=True,
+        )
+        self._thread.start()
+        logger.info("Serving tiles of %r at %s", self._cache, self.url)
+
+    def stop(self) -> None:
+        if self._server is None:
+            return
+        self._server.shutdown()
+        self._server.server_close()
+        self._thread.join()
+        self._server = None
+        self._thread = None
@@ -6,6 +6,9 @@ from typing import Any
 import folium
 from folium.template import Template
 from folium.utilities import parse_options
+from folium.vector_layers import path_options
+
+from travelpost.writers.map.polyline import encode
 
 
 class TravelSegment(folium.PolyLine):
@@ -39,3 +42,51 @@ class TravelSegment(folium.PolyLine):
             "transport_marker_z_index_offset", 0
         )
         self.transport = transport
+
+
+class TravelSegments(folium.MacroElement):
+    """Travel Segments (all segments as one encoded payload).
+
+    The locations of all segments are encoded as one polyline (see
+    `polyline.encode`) with a run table `[transport, number of locations]`,
+    the options are shared by all segments and only the differing options are
+    given per transport. `L.Travel.segments` decodes them client-side.
+    """
+
+    _template = Template(
+        """
+        {% macro script(this, kwargs) %}
+            var {{ this.get_name() }} = L.Travel.segments(
+                {{ this.encoded|tojson }},
+                {{ this.runs|tojson }},
+                {{ this.options|tojson }},
+                {{ this.transport_options|tojson }}
+            ).addTo({{this._parent.get_name()}});
+        {% endmacro %}
+        """
+    )
+
+    def __init__(
+        self,
+        segments: Sequence[tuple[str | None, Sequence[tuple[float, float]]]],
+        transport_options: dict[str, dict[str, Any]] | None = None,
+        **kwargs: Any,
+    ) -> None:
+        super().__init__()
+        self._name = "TravelSegments"
+        icon_options = kwargs.pop("icon_options", {})
+        self.options = path_options(line=True, **kwargs)
+        self.options["iconOptions"] = parse_options(**icon_options)
+        self.options["transportMarkerZIndexOffset"] = kwargs.pop(
+            "transport_marker_z_index_offset", 0
+        )
+        self.transport_options = {
+            transport: parse_options(**options)
+            for transport, options in (transport_options or {}).items()
+        }
+        self.encoded = encode(
+            [location for _, locations in segments for location in locations]
+        )
+        self.runs = [
+            [transport, len(locations)] for transport, locations in segments
+        ]
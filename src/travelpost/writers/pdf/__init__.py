@@ -1,5 +1,6 @@
 """PDF."""
 
 from travelpost.writers.pdf.book import Book
+from travelpost.writers.pdf.post import PostSpec
 
-__all__ = ("Book",)
+__all__ = ("Book", "PostSpec")
@@ -12,8 +12,7 @@ from reportlab.pdfgen.canvas import Canvas
 from travelpost.writers.pdf.libs.reportlab.libs import TextAlignment
 from travelpost.writers.pdf.libs.reportlab.libs.units import pt
 from travelpost.writers.pdf.libs.reportlab.pdfgen import canvas_state
-from travelpost.writers.pdf.libs.reportlab.platypus import ParagraphStyle
-from travelpost.writers.pdf.styles import get_style
+from travelpost.writers.pdf.styles import class_style
 
 
 def core_url(url: str) -> str:
@@ -37,7 +36,7 @@ class QRCode(QrCode):
 
     F_OVERLAP: float = 1.05  # NOTE: To have vertical overlap of drawn rects
     HEIGHT: float = 108 * pt
-    STYLE: ParagraphStyle = get_style("back_cover_qr_code")
+    STYLE = class_style("back_cover_qr_code")
 
     hAlign: TextAlignment
 
@@ -1,6 +1,6 @@
 """Book."""
 
-from collections.abc import Sequence
+from collections.abc import Iterable, Iterator, Sequence
 import datetime as dt
 import pathlib
 
@@ -9,6 +9,7 @@ from reportlab.lib.pagesizes import landscape
 from reportlab.lib.units import mm
 import reportlab.rl_config
 
+from travelpost.writers.map.raster import RasterRenderer
 from travelpost.writers.pdf.back_cover import BackCoverPage
 from travelpost.writers.pdf.back_cover import back_cover_flowables
 from travelpost.writers.pdf.blank import blank_page_templates
@@ -18,15 +19,20 @@ from travelpost.writers.pdf.index import idx_flowables
 from travelpost.writers.pdf.index import idx_page_templates
 from travelpost.writers.pdf.libs.reportlab.libs import Box
 from travelpost.writers.pdf.libs.reportlab.libs import Gap
+from travelpost.writers.pdf.libs.reportlab.libs import ImageCache
 from travelpost.writers.pdf.libs.reportlab.libs import Margin
+from travelpost.writers.pdf.libs.reportlab.libs import image_cache
 from travelpost.writers.pdf.libs.reportlab.platypus import DocTemplate
 from travelpost.writers.pdf.libs.reportlab.platypus import Flowable
 from travelpost.writers.pdf.libs.reportlab.platypus import Index
+from travelpost.writers.pdf.libs.reportlab.platypus import LazyStory
 from travelpost.writers.pdf.libs.reportlab.platypus import PageABC
 from travelpost.writers.pdf.libs.reportlab.platypus import PageTemplateABC
 from travelpost.writers.pdf.libs.reportlab.platypus.page_label import Canvas
 from travelpost.writers.pdf.map import MapPage
 from travelpost.writers.pdf.map import map_flowables
+from travelpost.writers.pdf.post import PostPhotoPage
+from travelpost.writers.pdf.post import PostSpec
 from travelpost.writers.pdf.post import PostStartTextPage
 from travelpost.writers.pdf.post import post_flowables
 from travelpost.writers.pdf.post import reset_doc_vars
@@ -54,8 +60,35 @@ class Book(PageABC):
         margin: Margin | tuple[float, ...] | float = (42.0, 42.0),
         gap: Gap | tuple[float, ...] | float = (12.0, 18.0),
         spine_width: float = 12 * mm,
+        image_dpi: float | None = None,
+        layout_passes: bool = True,
+        workers: int = 1,
+        optimize: bool = False,
+        image_cache_path: pathlib.Path | str | None = None,
     ) -> None:
+        """Initializes the book.
+
+        Args:
+            image_dpi: The target resolution of the images, e.g. 300 dpi for
+                print or 150 dpi for screen (`None`: full resolution).
+            layout_passes: Whether the passes resolving the table of contents
+                and the index are layout-only (see `DocTemplate`).
+            workers: The number of processes rendering the pages, e.g.
+                `os.cpu_count()` for large books (Linux only, see
+                `DocTemplate`).
+            optimize: Whether to optimize the saved book, e.g. for sharing
+                (see `DocTemplate`, the sizes are reported in `size_report`).
+            image_cache_path: The directory of the prepared images (see
+                `ImageCache`). Defaults to `.images` next to the book, the
+                photo folders are not written to unless
+                `image_cache.next_to_sources` is set.
+        """
         self._gap = Gap(gap)
+        self._image_cache_path = (
+            pathlib.Path(image_cache_path)
+            if image_cache_path is not None
+            else pathlib.Path(filename).parent / ImageCache.DIRNAME
+        )
         margin = Margin(margin)
         pagesize = Box(*pagesize)
 
@@ -69,6 +102,10 @@ class Book(PageABC):
             author=author,
             # subject=subject,
             creator="TravelPost",
+            image_dpi=image_dpi,
+            layout_passes=layout_passes,
+            workers=workers,
+            optimize=optimize,
         )
         self._idx: Index | None = None
         self._bc_flows: tuple[Flowable] | None = None
@@ -91,6 +128,11 @@ class Book(PageABC):
     def pagesize(self) -> Box:
         return self._doc.pagesize
 
+    @property
+    def size_report(self) -> dict[str, int] | None:
+        """The size [bytes] of the saved book by category, if optimized."""
+        return self._doc.size_report
+
     @staticmethod
     def _create_page_templates(
         pagesize: Box,
@@ -106,6 +148,7 @@ class Book(PageABC):
             MapPage(pagesize),
             PostsPrefacePage(pagesize, margin),
             PostStartTextPage(pagesize, margin, gap),
+            PostPhotoPage(pagesize, margin, gap),
             *idx_page_templates(pagesize, margin, gap),
             BackCoverPage(pagesize, margin, spine_width=spine_width),
         ]
@@ -138,9 +181,18 @@ class Book(PageABC):
 
     def add_map(
         self,
-        map_path: pathlib.Path,
+        map_path: pathlib.Path | None = None,
+        map_renderer: RasterRenderer | None = None,
     ) -> None:
-        self._map_flows = map_flowables(map_path, title="Map")
+        """Adds the map page, either the map image or the map drawn as vector
+        map over its tiles (`Map.renderer`).
+        """
+        if (map_path is None) == (map_renderer is None):
+            msg = "either map_path or map_renderer is required"
+            raise ValueError(msg)
+        self._map_flows = map_flowables(
+            map_path if map_path is not None else map_renderer, title="Map"
+        )
 
     def add_post(
         self,
@@ -152,27 +204,70 @@ class Book(PageABC):
         title: str,
         subtitle: str | None = None,
         text: str | None = None,
-        # images: Sequence[pathlib.Path] = (),
+        images: Sequence[pathlib.Path] = (),
         weather_condition: str | None = None,
         weather_temperature: float | None = None,
+        map_path: pathlib.Path | None = None,
     ) -> None:
+        """Adds a post.
+
+        Args:
+            images: The photos of the post, laid out on photo pages after the
+                text (see `PhotoGrid`).
+            map_path: The inset map of the post (see `render_mini_maps`).
+        """
         self._posts.append(
-            post_flowables(
-                datetime,
-                start_date,
-                end_date,
-                location,
-                country_code,
-                title,
-                subtitle=subtitle,
-                text=text,
-                # images=images,
-                progress_bar_label="Day",
-                weather_condition=weather_condition,
-                weather_temperature=weather_temperature,
+            self._post_flowables(
+                PostSpec(
+                    datetime=datetime,
+                    start_date=start_date,
+                    end_date=end_date,
+                    location=location,
+                    country_code=country_code,
+                    title=title,
+                    subtitle=subtitle,
+                    text=text,
+                    images=images,
+                    weather_condition=weather_condition,
+                    weather_temperature=weather_temperature,
+                    map_path=map_path,
+                )
             )
         )
 
+    def add_posts(self, posts: Iterable[PostSpec]) -> None:
+        """Adds posts, streamed while saving.
+
+        The flowables of a post are created when the doc template reaches the
+        post and released once drawn (see `LazyStory`), so the memory stays
+        bounded for books with thousands of posts.
+
+        Args:
+            posts: The posts, iterated once per build pass (an iterator is
+                collected into a list of specs).
+        """
+        if isinstance(posts, Iterator):
+            posts = list(posts)
+        self._posts.append((LazyStory(posts, self._post_flowables),))
+
+    @staticmethod
+    def _post_flowables(post: PostSpec) -> tuple[Flowable, ...]:
+        return post_flowables(
+            post.datetime,
+            post.start_date,
+            post.end_date,
+            post.location,
+            post.country_code,
+            post.title,
+            subtitle=post.subtitle,
+            text=post.text,
+            images=post.images,
+            progress_bar_label="Day",
+            weather_condition=post.weather_condition,
+            weather_temperature=post.weather_temperature,
+            map_path=post.map_path,
+        )
+
     def add_summary(
         self,
         country_codes: Sequence[str] | None = None,
@@ -228,4 +323,6 @@ class Book(PageABC):
         if self._bc_flows is not None:
             story.extend(self._bc_flows)
 
+        # The images are prepared while drawn
+        image_cache.path = self._image_cache_path
         self._doc.multiBuild(story, canvasmaker=canvasmaker)
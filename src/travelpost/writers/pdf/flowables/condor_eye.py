@@ -15,7 +15,8 @@ from travelpost.writers.pdf.libs.reportlab.pdfgen import canvas_state
 from travelpost.writers.pdf.libs.reportlab.pdfgen import canvas_style
 from travelpost.writers.pdf.libs.reportlab.platypus import Flowable
 from travelpost.writers.pdf.libs.reportlab.platypus import ParagraphStyle
-from travelpost.writers.pdf.styles import get_style
+from travelpost.writers.pdf.libs.utils import cached_classproperty
+from travelpost.writers.pdf.styles import class_style
 
 
 class CondorEye(Flowable):
@@ -33,27 +34,61 @@ class CondorEye(Flowable):
     #    \/
 
     ANGLE: float = 15.0  # deg
-    STYLE: ParagraphStyle = get_style("condor_eye")
-
-    TEXT_PAD: Padding = Padding(STYLE.get("textPadding", 2.0))
-    LINE_WIDTH: float = float(STYLE.get("lineWidth", 1.0))
-    HEIGHT: float = (
-        TEXT_PAD.top + STYLE.eff_font_size + TEXT_PAD.bottom + 4 * LINE_WIDTH
-    )
+    STYLE = class_style("condor_eye")
 
     style: ParagraphStyle
 
-    def __init_subclass__(cls) -> None:
-        super().__init_subclass__()
-        cls.TEXT_PAD = Padding(cls.STYLE.textPadding)
-        cls.LINE_WIDTH = float(cls.STYLE.lineWidth)
-        cls.HEIGHT = (
+    @cached_classproperty
+    def TEXT_PAD(cls) -> Padding:
+        return Padding(cls.STYLE.get("textPadding", 2.0))
+
+    @cached_classproperty
+    def LINE_WIDTH(cls) -> float:
+        return float(cls.STYLE.get("lineWidth", 1.0))
+
+    @cached_classproperty
+    def HEIGHT(cls) -> float:
+        return (
             cls.TEXT_PAD.top
             + cls.STYLE.eff_font_size
             + cls.TEXT_PAD.bottom
             + 4 * cls.LINE_WIDTH
         )
 
+    # NOTE: The geometry only depends on the style, it is computed once per
+    #       class (see also the form of `draw`)
+    @cached_classproperty
+    def _content_height(cls) -> float:
+        return cls.TEXT_PAD.bottom + cls.STYLE.eff_font_size + cls.TEXT_PAD.top
+
+    @cached_classproperty
+    def _inner_diamond(cls) -> Box:
+        return Box(
+            width=cls._content_height / math.tan(math.radians(cls.ANGLE)),
+            height=cls._content_height,
+        )
+
+    @cached_classproperty
+    def _diamond_stroke(cls) -> Box:
+        return Box(
+            width=cls.LINE_WIDTH / math.tan(math.radians(cls.ANGLE)),
+            height=cls.LINE_WIDTH,
+        )
+
+    @cached_classproperty
+    def _middle_diamond(cls) -> Box:
+        return Box(
+            width=cls._inner_diamond.width + 2 * cls._diamond_stroke.width,
+            height=cls._inner_diamond.height + 2 * cls._diamond_stroke.height,
+        )
+
+    @cached_classproperty
+    def _outer_diamond(cls) -> Box:
+        return Box(
+            width=cls._inner_diamond.width + 4 * cls._diamond_stroke.width,
+            height=cls._inner_diamond.height + 4 * cls._diamond_stroke.height,
+        )
+
     def __init__(self, text: str | None = None) -> None:
         """Initializes the condor eye.
 
@@ -61,28 +96,6 @@ class CondorEye(Flowable):
             text: The text to show in the inner diamond. Defaults to ``None``.
         """
         self._text = str(text) if text is not None else None
-
-        self._text_height = self.STYLE.eff_font_size
-        self._content_height = (
-            self.TEXT_PAD.bottom + self._text_height + self.TEXT_PAD.top
-        )
-        self._inner_diamond = Box(
-            width=self._content_height / math.tan(math.radians(self.ANGLE)),
-            height=self._content_height,
-        )
-        self._diamond_stroke = Box(
-            width=self.LINE_WIDTH / math.tan(math.radians(self.ANGLE)),
-            height=self.LINE_WIDTH,
-        )
-        self._middle_diamond = Box(
-            width=self._inner_diamond.width + 2 * self._diamond_stroke.width,
-            height=self._inner_diamond.height + 2 * self._diamond_stroke.height,
-        )
-        self._outer_diamond = Box(
-            width=self._inner_diamond.width + 4 * self._diamond_stroke.width,
-            height=self._inner_diamond.height + 4 * self._diamond_stroke.height,
-        )
-
         super().__init__(
             self._outer_diamond.width,
             self._outer_diamond.height,
@@ -297,11 +310,9 @@ class CondorEye(Flowable):
 class CondorEyeBand(CondorEye):
     """Condor Eye Band."""
 
-    HEIGHT: float = CondorEye.HEIGHT + 4 * CondorEye.LINE_WIDTH
-
-    def __init_subclass__(cls) -> None:
-        super().__init_subclass__()
-        cls.HEIGHT += 4 * cls.LINE_WIDTH
+    @cached_classproperty
+    def HEIGHT(cls) -> float:
+        return super().HEIGHT + 4 * cls.LINE_WIDTH
 
     def __init__(
         self,
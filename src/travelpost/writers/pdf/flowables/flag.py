@@ -4,28 +4,29 @@ from typing import Literal
 
 from reportlab.graphics.shapes import Drawing
 from reportlab.pdfgen.canvas import Canvas
-from svglib.svglib import svg2rlg
 
 from travelpost.writers.pdf.libs import flag_icons
+from travelpost.writers.pdf.libs.reportlab.libs import svg_drawing
 from travelpost.writers.pdf.libs.reportlab.pdfgen import canvas_clip_path
 from travelpost.writers.pdf.libs.reportlab.pdfgen import canvas_form
 from travelpost.writers.pdf.libs.reportlab.pdfgen import canvas_state
 from travelpost.writers.pdf.libs.reportlab.platypus import Flowable
 from travelpost.writers.pdf.libs.reportlab.platypus import ParagraphStyle
-from travelpost.writers.pdf.styles import get_style
+from travelpost.writers.pdf.libs.utils import cached_classproperty
+from travelpost.writers.pdf.styles import class_style
 
 
 class Flag(Flowable):
     """Flag."""
 
-    STYLE: ParagraphStyle = get_style("flag")
-    HEIGHT: float = STYLE.eff_font_size
+    DRAW_ON_LAYOUT: bool = False
+    STYLE = class_style("flag")
 
     style: ParagraphStyle
 
-    def __init_subclass__(cls) -> None:
-        super().__init_subclass__()
-        cls.HEIGHT = cls.STYLE.eff_font_size
+    @cached_classproperty
+    def HEIGHT(cls) -> float:
+        return cls.STYLE.eff_font_size
 
     def __init__(
         self,
@@ -120,7 +121,7 @@ class Flag(Flowable):
 
     def _draw_flag(self, canvas: Canvas) -> None:
         path = getattr(self._flag, f"flag_{self._flag_format:s}")
-        drawing: Drawing | None = svg2rlg(path)
+        drawing: Drawing | None = svg_drawing(path)
         if drawing is None:
             msg = f"could not process flag of {self._flag.name!r:s}"
             raise ValueError(msg)
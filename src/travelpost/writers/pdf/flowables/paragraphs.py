@@ -1,9 +1,16 @@
-"""Paragraphs."""
+"""Paragraphs.
 
+The paragraph classes (one per style of `_MEMBERS`) are created on first
+access, their styles on first use. The stub `paragraphs.pyi` is written by
+`write_stub` (run after changing `_MEMBERS`).
+"""
+
+import functools
 import pathlib
+from typing import Any
 
 from travelpost.writers.pdf.libs.reportlab.platypus import Paragraph
-from travelpost.writers.pdf.styles import STYLESHEET
+from travelpost.writers.pdf.styles import class_style
 
 _MEMBERS: tuple[str] = (
     "default",
@@ -33,7 +40,24 @@ def var_name(name: str) -> str:
     return name.title().replace("_", "")
 
 
-def create_classes() -> None:
+_MEMBERS_BY_VAR_NAME: dict[str, str] = {var_name(m): m for m in _MEMBERS}
+
+
+@functools.cache
+def _create_class(name: str) -> type[Paragraph]:
+    return type(
+        var_name(name),
+        (Paragraph,),
+        {
+            "__doc__": doc(name),
+            "__module__": __name__,
+            "STYLE": class_style(name),
+        },
+    )
+
+
+def write_stub() -> None:
+    """Writes the stub of the paragraph classes (`paragraphs.pyi`)."""
     with (
         pathlib.Path(__file__)
         .with_suffix(".pyi")
@@ -44,14 +68,14 @@ def create_classes() -> None:
             "import Paragraph\n\n"
         )
         for m in sorted(_MEMBERS):
-            globals()[var_name(m)] = type(
-                var_name(m),
-                (Paragraph,),
-                {"__doc__": doc(m), "STYLE": STYLESHEET[m]},
-            )
             f.write(f"class {var_name(m):s}(Paragraph): ...\n")
 
 
-create_classes()
+def __getattr__(name: str) -> Any:
+    if name in _MEMBERS_BY_VAR_NAME:
+        return _create_class(_MEMBERS_BY_VAR_NAME[name])
+    msg = f"module {__name__!r:s} has no attribute {name!r:s}"
+    raise AttributeError(msg)
+
 
 __all__ = tuple(var_name(m) for m in _MEMBERS)
@@ -1,8 +1,7 @@
 """Title - Publisher Logo."""
 
 from travelpost.writers.pdf.flowables.condor_eye import CondorEye
-from travelpost.writers.pdf.libs.reportlab.platypus import ParagraphStyle
-from travelpost.writers.pdf.styles import get_style
+from travelpost.writers.pdf.styles import class_style
 
 
 def initials(author: str) -> str:
@@ -12,7 +11,7 @@ def initials(author: str) -> str:
 class PublisherLogo(CondorEye):
     """Publisher Logo."""
 
-    STYLE: ParagraphStyle = get_style("publisher_logo")
+    STYLE = class_style("publisher_logo")
 
     def __init__(self, author: str) -> None:
         """Initializes the publisher logo.
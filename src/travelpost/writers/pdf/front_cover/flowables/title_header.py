@@ -2,8 +2,8 @@
 
 from travelpost.writers.pdf.libs.reportlab.pdfgen import canvas_state
 from travelpost.writers.pdf.libs.reportlab.platypus import Flowable
-from travelpost.writers.pdf.libs.reportlab.platypus import ParagraphStyle
-from travelpost.writers.pdf.styles import get_style
+from travelpost.writers.pdf.libs.utils import cached_classproperty
+from travelpost.writers.pdf.styles import class_style
 
 
 class TitleHeader(Flowable):
@@ -15,8 +15,11 @@ class TitleHeader(Flowable):
         text.
     """
 
-    STYLE: ParagraphStyle = get_style("title_header")
-    HEIGHT: float = STYLE.eff_font_size
+    STYLE = class_style("title_header")
+
+    @cached_classproperty
+    def HEIGHT(cls) -> float:
+        return cls.STYLE.eff_font_size
 
     def __init__(self, text: str) -> None:
         """Initializes the title header.
@@ -3,21 +3,22 @@
 import warnings
 
 from reportlab.pdfgen.canvas import Canvas
-from reportlab.platypus import BaseDocTemplate
 from reportlab.rl_config import _FUZZ
 
 from travelpost.writers.pdf.flowables.condor_eye import CondorEye
 from travelpost.writers.pdf.libs.reportlab.libs import TextAlignment
+from travelpost.writers.pdf.libs.reportlab.platypus import DocTemplate
 from travelpost.writers.pdf.libs.reportlab.platypus import PageTemplateABC
 from travelpost.writers.pdf.libs.reportlab.platypus import Paragraph
 from travelpost.writers.pdf.libs.reportlab.platypus import ParagraphStyle
-from travelpost.writers.pdf.styles import get_style
+from travelpost.writers.pdf.libs.utils import cached_classproperty
+from travelpost.writers.pdf.styles import class_style
 
 
 class PageLabelFooter(CondorEye):
     """Page Label Footer"""
 
-    STYLE: ParagraphStyle = get_style("page_footer")
+    STYLE = class_style("page_footer")
 
 
 class FooterMixin(PageTemplateABC):
@@ -26,12 +27,16 @@ class FooterMixin(PageTemplateABC):
     Mixin for a page template, showing the page number.
     """
 
-    def afterDrawPage(self, canv: Canvas, doc: BaseDocTemplate) -> None:
+    def afterDrawPage(self, canv: Canvas, doc: DocTemplate) -> None:
         if hasattr(canv, "getPageLabel"):
             text = canv.getPageLabel()
         else:
             text = str(canv.getPageNumber())
-        footer = PageLabelFooter(text=text)
+        # The footers are reused on the pages of every build pass
+        key = (PageLabelFooter, text)
+        footer = doc.page_cache.get(key)
+        if footer is None:
+            footer = doc.page_cache[key] = PageLabelFooter(text=text)
 
         avail_width = self.content_box.width
         avail_height = (
@@ -39,7 +44,7 @@ class FooterMixin(PageTemplateABC):
             - PageLabelFooter.STYLE.spaceBefore
             - PageLabelFooter.STYLE.spaceAfter
         )
-        w, h = footer.wrapOn(canv, avail_width, avail_height)
+        w, h = footer.width, footer.height
         if w <= avail_width and h <= avail_height:
             x = self.margin.left
             if doc.page % 2 == 1:
@@ -53,74 +58,58 @@ class FooterMixin(PageTemplateABC):
 class HeaderMixin(PageTemplateABC):
     """Header Mixin, showing last h2-title."""
 
-    STYLE: ParagraphStyle = get_style("page_header")
-    LEFT_STYLE: ParagraphStyle = ParagraphStyle(
-        "page_header_right", parent=STYLE, alignment=TextAlignment.LEFT
-    )
-    RIGHT_STYLE: ParagraphStyle = ParagraphStyle(
-        "page_header_right", parent=STYLE, alignment=TextAlignment.RIGHT
-    )
-
-    def afterDrawPage(self, canv: Canvas, doc: BaseDocTemplate) -> None:
-        try:
-            heading = doc.docEval("heading")
-        except NameError:
+    STYLE = class_style("page_header")
+
+    @cached_classproperty
+    def LEFT_STYLE(cls) -> ParagraphStyle:
+        return ParagraphStyle(
+            "page_header_right", parent=cls.STYLE, alignment=TextAlignment.LEFT
+        )
+
+    @cached_classproperty
+    def RIGHT_STYLE(cls) -> ParagraphStyle:
+        return ParagraphStyle(
+            "page_header_right",
+            parent=cls.STYLE,
+            alignment=TextAlignment.RIGHT,
+        )
+
+    def afterDrawPage(self, canv: Canvas, doc: DocTemplate) -> None:
+        # NOTE: Reads the doc variables directly, `docEval` compiles the
+        #       expression on every page
+        doc_vars = doc._nameSpace
+        if "heading" not in doc_vars:
             msg = f"no heading on page {doc.page:d}, no header can be drawn"
             warnings.warn(msg, stacklevel=1)
             return super().afterDrawPage(canv, doc)
 
-        try:
-            day = doc.docEval("day")
-            total_days = doc.docEval("total_days")
-            days_txt = f" (Day {day:d} of {total_days:d})"
-        except NameError:
+        heading = doc_vars["heading"]
+        if "day" in doc_vars and "total_days" in doc_vars:
+            days_txt = (
+                f" (Day {doc_vars['day']:d} of {doc_vars['total_days']:d})"
+            )
+        else:
             days_txt = ""
-        header = Paragraph(
-            f"{heading:s}{days_txt:s}",
-            style=self.LEFT_STYLE if doc.page % 2 == 0 else self.RIGHT_STYLE,
-        )
 
         avail_width = self.content_box.width / 2
         avail_height = (
             self.margin.top - self.STYLE.spaceBefore - self.STYLE.spaceAfter
         )
         if avail_height >= self.STYLE.eff_font_size:
-            w, h = header.wrapOn(canv, avail_width, avail_height)
-            assert w <= avail_width
-
-            # NOTE: If the header occupies more than a line, shorten it to
-            #       a single line, by wrapping the text into two lines and just
-            #       take the first line
-            if h > self.STYLE.leading + _FUZZ:
-                header = Paragraph(
-                    doc.heading,
-                    style=self.LEFT_STYLE
-                    if doc.page % 2 == 0
-                    else self.RIGHT_STYLE,
-                )
-                w, h = header.wrapOn(
-                    canv,
-                    self.content_box.width / 2
-                    - self.STYLE.string_width(f" ...{days_txt:s}"),
-                    2 * self.STYLE.leading,
-                )
-                assert w <= avail_width
-                assert h > self.STYLE.leading
-                # headers = header.splitOn(
-                #     canv, avail_width, 2 * self.STYLE.leading
-                # )
-                # assert len(headers) == 2, len(headers)
-                short_heading = " ".join(header.blPara.lines[0][1])
-
-                header = Paragraph(
-                    f"{short_heading:s} ...{days_txt:s}",
-                    style=self.LEFT_STYLE
-                    if doc.page % 2 == 0
-                    else self.RIGHT_STYLE,
-                )
-                w, h = header.wrapOn(canv, avail_width, avail_height)
-                assert w <= avail_width
-                assert h == self.STYLE.leading
+            # The headers are reused on the pages of every build pass with
+            # the same heading, day and parity
+            args = (
+                heading,
+                days_txt,
+                doc.page % 2 == 0,
+                avail_width,
+                avail_height,
+            )
+            key = (type(self), *args)
+            wrapped = doc.page_cache.get(key)
+            if wrapped is None:
+                wrapped = doc.page_cache[key] = self._wrap_header(*args)
+            header, w, h = wrapped
 
             x = self.margin.left
             if doc.page % 2 == 1:
@@ -134,3 +123,40 @@ class HeaderMixin(PageTemplateABC):
             header.drawOn(canv, x, y)
 
         return super().afterDrawPage(canv, doc)
+
+    @classmethod
+    def _wrap_header(
+        cls,
+        heading: str,
+        days_txt: str,
+        left: bool,
+        avail_width: float,
+        avail_height: float,
+    ) -> tuple[Paragraph, float, float]:
+        """Returns the wrapped header and its size."""
+        style = cls.LEFT_STYLE if left else cls.RIGHT_STYLE
+        header = Paragraph(f"{heading:s}{days_txt:s}", style=style)
+        w, h = header.wrap(avail_width, avail_height)
+        assert w <= avail_width
+
+        # NOTE: If the header occupies more than a line, shorten it to
+        #       a single line, by wrapping the text into two lines and just
+        #       take the first line
+        if h > cls.STYLE.leading + _FUZZ:
+            header = Paragraph(heading, style=style)
+            w, h = header.wrap(
+                avail_width - cls.STYLE.string_width(f" ...{days_txt:s}"),
+                2 * cls.STYLE.leading,
+            )
+            assert w <= avail_width
+            assert h > cls.STYLE.leading
+            short_heading = " ".join(header.blPara.lines[0][1])
+
+            header = Paragraph(
+                f"{short_heading:s} ...{days_txt:s}", style=style
+            )
+            w, h = header.wrap(avail_width, avail_height)
+            assert w <= avail_width
+            assert h == cls.STYLE.leading
+
+        return header, w, h
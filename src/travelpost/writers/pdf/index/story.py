@@ -7,6 +7,7 @@ from reportlab.platypus import FrameBreak
 from reportlab.platypus import NextPageTemplate
 from reportlab.platypus import PageBreak
 
+from travelpost.writers.pdf import styles
 from travelpost.writers.pdf.blank import blank_flowables
 from travelpost.writers.pdf.flowables.paragraphs import H1
 from travelpost.writers.pdf.index.page_templates import IDXPage
@@ -14,7 +15,6 @@ from travelpost.writers.pdf.index.page_templates import IDXStartPage
 from travelpost.writers.pdf.libs.reportlab.platypus import TOCEntry
 from travelpost.writers.pdf.libs.reportlab.platypus import VarLifetime
 from travelpost.writers.pdf.libs.reportlab.platypus.page_label import Index
-from travelpost.writers.pdf.styles import IDX_LEVEL_STYLES
 from travelpost.writers.pdf.table_styles import get_table_style
 
 
@@ -22,7 +22,7 @@ def idx_flowables(
     title: str = "Index",
 ) -> tuple[Index, tuple[Flowable, ...]]:
     index = Index(
-        level_styles=IDX_LEVEL_STYLES,
+        level_styles=styles.IDX_LEVEL_STYLES,
         outline_offset=1,  # Because title "Index" as level 0
         show_headers=True,
         show_in_outline=True,
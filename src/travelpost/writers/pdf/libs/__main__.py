@@ -0,0 +1,50 @@
+"""Libs - Main.
+
+Compiles the asset bundles of the flags, country shapes and Font Awesome icons
+(see `bundle`).
+"""
+
+import argparse
+import logging
+import pathlib
+
+from travelpost.writers.pdf.libs import country_shapes
+from travelpost.writers.pdf.libs import flag_icons
+from travelpost.writers.pdf.libs import fontawesome
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument(
+        "--country-shapes",
+        type=pathlib.Path,
+        default=country_shapes.svg_getter.PATH,
+        help="The country shape path (directory with 'country.json').",
+    )
+    parser.add_argument(
+        "--flag-icons",
+        type=pathlib.Path,
+        default=flag_icons.PATH,
+        help="The flag path (directory with 'country.json').",
+    )
+    parser.add_argument(
+        "--fontawesome",
+        type=pathlib.Path,
+        default=fontawesome.PATH,
+        help="The Font Awesome path (directory with 'metadata' and 'svgs').",
+    )
+    args = parser.parse_args()
+
+    logging.basicConfig(
+        datefmt="%H:%M:%S",
+        format="%(levelname)s %(asctime)s %(filename)s:%(lineno)d] %(message)s",
+        level=logging.INFO,
+    )
+
+    country_shapes.build_country_shapes_bundle(args.country_shapes)
+    flag_icons.build_flags_bundle(args.flag_icons)
+    fontawesome.build_icons_bundle(args.fontawesome)
+
+
+if __name__ == "__main__":
+    main()
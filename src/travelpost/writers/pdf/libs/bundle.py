@@ -0,0 +1,182 @@
+"""Asset Bundle.
+
+An asset bundle compiles an asset library (flags, country shapes, Font Awesome
+icons) into one file next to its manifest: the loaded entries and the
+pre-parsed drawings of all SVG files. Loading a bundle neither reads the
+manifest nor parses the SVG files, the drawings are unpickled from a memory
+map on first use (see `svg_drawing`). The bundle is outdated as soon as the
+manifest or one of the SVG files changes; SVG files may be removed once they
+are bundled.
+
+File layout: `<header length><pickled header><pickled drawing>...`
+"""
+
+from collections.abc import Iterable
+import dataclasses
+import logging
+import mmap
+import os
+import pathlib
+import pickle
+import struct
+import threading
+from typing import Any
+
+from reportlab.graphics.shapes import Drawing
+from svglib.svglib import svg2rlg
+
+from travelpost.writers.pdf.libs.reportlab.libs import add_svg_drawings
+
+BUNDLE_NAME: str = "bundle.pickle"
+VERSION: int = 2
+
+_LENGTH = struct.Struct("<Q")
+
+logger = logging.getLogger(__name__)
+
+
+@dataclasses.dataclass(frozen=True, kw_only=True)
+class _Header:
+    version: int
+    root: str
+    manifest_mtime_ns: int
+    entries: Any
+    drawings: dict[str, tuple[int, int]]
+    """The `(offset, length)` of the drawings by absolute SVG path."""
+    svg_stats: dict[str, tuple[int, int]]
+    """The `(mtime_ns, size)` of the SVG files by absolute SVG path."""
+
+
+def _svg_stat(path: str) -> tuple[int, int] | None:
+    try:
+        stat = os.stat(path)
+    except FileNotFoundError:
+        return None
+    return stat.st_mtime_ns, stat.st_size
+
+
+class Bundle:
+    """Asset Bundle (see `build_bundle`)."""
+
+    def __init__(self, file: pathlib.Path | str) -> None:
+        self._file = pathlib.Path(file)
+        with open(self._file, mode="rb") as f:
+            (length,) = _LENGTH.unpack(f.read(_LENGTH.size))
+            self._header: _Header = pickle.loads(f.read(length))
+        self._offset = _LENGTH.size + length
+        self._lock = threading.Lock()
+        self._mmap: mmap.mmap | None = None
+
+    @property
+    def entries(self) -> Any:
+        """The entries of the asset library."""
+        return self._header.entries
+
+    def is_fresh(self, root: pathlib.Path, manifest: pathlib.Path) -> bool:
+        """Returns whether the bundle is up-to-date with the manifest and the
+        SVG files (removed SVG files are served from the bundle).
+        """
+        return (
+            self._header.version == VERSION
+            and self._header.root == os.path.abspath(root)
+            and self._header.manifest_mtime_ns == manifest.stat().st_mtime_ns
+            and all(
+                _svg_stat(path) in (None, stat)
+                for path, stat in self._header.svg_stats.items()
+            )
+        )
+
+    def drawing(self, path: str) -> Drawing | None:
+        """Returns the pre-parsed drawing of the SVG file."""
+        offset, length = self._header.drawings[os.path.abspath(path)]
+        with self._lock:
+            if self._mmap is None:
+                with open(self._file, mode="rb") as f:
+                    self._mmap = mmap.mmap(
+                        f.fileno(), 0, access=mmap.ACCESS_READ
+                    )
+        start = self._offset + offset
+        return pickle.loads(self._mmap[start : start + length])
+
+    def add_svg_drawings(self) -> None:
+        """Adds the pre-parsed drawings to `svg_drawing`."""
+        add_svg_drawings(self._header.drawings, self.drawing)
+
+
+def build_bundle(
+    root: pathlib.Path | str,
+    manifest: pathlib.Path,
+    entries: Any,
+    svg_paths: Iterable[pathlib.Path],
+) -> pathlib.Path:
+    """Compiles an asset library into its bundle (`<root>/bundle.pickle`).
+
+    Args:
+        root: The asset library path.
+        manifest: The manifest of the asset library (the bundle is outdated as
+            soon as the manifest or one of the SVG files changes).
+        entries: The loaded entries.
+        svg_paths: The SVG files to pre-parse.
+
+    Returns:
+        The bundle path.
+    """
+    root = pathlib.Path(root)
+    drawings = {}
+    svg_stats = {}
+    chunks = []
+    offset = 0
+    for path in dict.fromkeys(os.path.abspath(p) for p in svg_paths):
+        chunk = pickle.dumps(svg2rlg(path), protocol=pickle.HIGHEST_PROTOCOL)
+        stat = os.stat(path)
+        svg_stats[path] = (stat.st_mtime_ns, stat.st_size)
+        drawings[path] = (offset, len(chunk))
+        chunks.append(chunk)
+        offset += len(chunk)
+
+    header = pickle.dumps(
+        _Header(
+            version=VERSION,
+            root=os.path.abspath(root),
+            manifest_mtime_ns=manifest.stat().st_mtime_ns,
+            entries=entries,
+            drawings=drawings,
+            svg_stats=svg_stats,
+        ),
+        protocol=pickle.HIGHEST_PROTOCOL,
+    )
+    file = root / BUNDLE_NAME
+    part = file.with_suffix(f"{file.suffix:s}.part")
+    with open(part, mode="wb") as f:
+        f.write(_LENGTH.pack(len(header)))
+        f.write(header)
+        f.writelines(chunks)
+    part.replace(file)
+    logger.info(
+        "Bundled %d drawings into %r (%d bytes)",
+        len(drawings),
+        str(file),
+        file.stat().st_size,
+    )
+    return file
+
+
+def load_bundle(
+    root: pathlib.Path | str,
+    manifest: pathlib.Path,
+) -> Bundle | None:
+    """Returns the bundle of an asset library, `None` if it does not exist or
+    is outdated (see `build_bundle`).
+    """
+    file = pathlib.Path(root) / BUNDLE_NAME
+    if not file.exists():
+        return None
+    try:
+        bundle = Bundle(file)
+    except (OSError, pickle.UnpicklingError, struct.error) as e:
+        logger.warning("Could not load bundle %r: %r", str(file), e)
+        return None
+    if not bundle.is_fresh(pathlib.Path(root), manifest):
+        logger.warning("Bundle %r is outdated, rebuild it", str(file))
+        return None
+    return bundle
@@ -5,6 +5,9 @@ from travelpost.writers.pdf.libs.country_shapes.interface import Projection
 from travelpost.writers.pdf.libs.country_shapes.interface import ViewBox
 from travelpost.writers.pdf.libs.country_shapes.svg_editor import SVGEditor
 from travelpost.writers.pdf.libs.country_shapes.svg_getter import COUNTRY_CODES
+from travelpost.writers.pdf.libs.country_shapes.svg_getter import (
+    build_country_shapes_bundle,
+)
 from travelpost.writers.pdf.libs.country_shapes.svg_getter import (
     setup_country_shapes,
 )
@@ -17,6 +20,7 @@ __all__ = (
     "Projection",
     "SVGEditor",
     "ViewBox",
+    "build_country_shapes_bundle",
     "setup_country_shapes",
     "shape_by_code",
     "shape_by_name",
@@ -3,6 +3,8 @@
 import json
 import pathlib
 
+from travelpost.writers.pdf.libs.bundle import build_bundle
+from travelpost.writers.pdf.libs.bundle import load_bundle
 from travelpost.writers.pdf.libs.country_shapes.interface import CountryShape
 
 PATH: pathlib.Path = pathlib.Path("lib/natural_earth_data").resolve()
@@ -18,6 +20,9 @@ COUNTRY_CODES: list[str] = list()
 def setup_country_shapes(path: pathlib.Path | str | None = None) -> None:
     """Load Country Shapes.
 
+    Loads the bundle of the country shapes if it is up-to-date (see
+    `build_country_shapes_bundle`).
+
     Args:
         path: Couuntry shape path (directory with "country.json").
 
@@ -33,9 +38,61 @@ def setup_country_shapes(path: pathlib.Path | str | None = None) -> None:
     if not json_path.exists():
         msg = f"cannot find {json_path.as_posix()!r:s}"
         raise ValueError(msg)
+
+    bundle = load_bundle(path, json_path)
+    if bundle is not None:
+        shapes = bundle.entries
+        bundle.add_svg_drawings()
+    else:
+        shapes = _load_shapes(path, json_path)
+
+    for shape in shapes:
+        if shape.code in _SHAPES:
+            msg = f"country code {shape.code!r:s} exists already"
+            raise ValueError(msg)
+
+        _SHAPES[shape.code] = shape
+        _SHAPES_BY_NAME[shape.name.lower().replace(" ", "_")] = shape
+
+    COUNTRY_CODES.extend(_SHAPES.keys())
+
+
+def build_country_shapes_bundle(
+    path: pathlib.Path | str | None = None,
+) -> pathlib.Path:
+    """Compiles the country shapes and their pre-parsed svgs into a bundle
+    (`<path>/bundle.pickle`), which `setup_country_shapes` loads instead.
+
+    Args:
+        path: Country shape path (directory with "country.json").
+
+    Returns:
+        The bundle path.
+
+    Raises:
+        ValueError: See `setup_country_shapes`.
+    """
+    path = pathlib.Path(path) if path is not None else PATH
+
+    json_path = path / "country.json"
+    if not json_path.exists():
+        msg = f"cannot find {json_path.as_posix()!r:s}"
+        raise ValueError(msg)
+
+    shapes = _load_shapes(path, json_path)
+    return build_bundle(
+        path, json_path, shapes, (shape.path for shape in shapes)
+    )
+
+
+def _load_shapes(
+    path: pathlib.Path,
+    json_path: pathlib.Path,
+) -> list[CountryShape]:
     with json_path.open(encoding="utf-8") as f:
         data = json.load(f)
 
+    shapes = []
     for d in data:
         shape = CountryShape.from_dict(d, path_prefix=path)
 
@@ -45,14 +102,8 @@ def setup_country_shapes(path: pathlib.Path | str | None = None) -> None:
                 f"{shape.path.as_posix()!r:s}"
             )
             raise ValueError(msg)
-        if shape.code in _SHAPES:
-            msg = f"country code {shape.code!r:s} exists already"
-            raise ValueError(msg)
-
-        _SHAPES[shape.code] = shape
-        _SHAPES_BY_NAME[shape.name.lower().replace(" ", "_")] = shape
-
-    COUNTRY_CODES.extend(_SHAPES.keys())
+        shapes.append(shape)
+    return shapes
 
 
 def shape_by_code(code: str) -> CountryShape:
@@ -105,6 +156,7 @@ def shape_by_name(name: str) -> CountryShape:
 
 __all__ = (
     "COUNTRY_CODES",
+    "build_country_shapes_bundle",
     "setup_country_shapes",
     "shape_by_code",
     "shape_by_name",
@@ -1,11 +1,20 @@
-"""Emoji PNGs."""
+"""Emoji PNGs.
 
+The emojis of a text are replaced by inline images (see `replace_emoji`), the
+markup is cached per text and font size. The paragraphs share the image of an
+emoji PNG, so it is decoded once and embedded once per document.
+"""
+
+import functools
 import json
+import logging
 import pathlib
 from typing import Any
 
 import emoji
 
+logger = logging.getLogger(__name__)
+
 PATH: pathlib.Path = pathlib.Path("lib/emoji").resolve()
 PNG_PATH: pathlib.Path = PATH / "png" / "160"
 
@@ -96,7 +105,7 @@ def create_json(
     return found
 
 
-EMOJI: dict[str, pathlib.Path]
+EMOJI: dict[str, pathlib.Path] = {}
 
 
 def setup_emojis(path: pathlib.Path | str | None = None) -> None:
@@ -124,6 +133,7 @@ def setup_emojis(path: pathlib.Path | str | None = None) -> None:
         EMOJI = data["emoji"]
         for k, v in EMOJI.items():
             EMOJI[k] = (path / v).resolve()
+    replace_emoji.cache_clear()
 
 
 def emoji_png_path(emoji_unicode: str) -> pathlib.Path:
@@ -150,9 +160,20 @@ def emoji_png_path(emoji_unicode: str) -> pathlib.Path:
         raise KeyError(msg) from e
 
 
+@functools.cache
+def _log_missing_emoji(message: str) -> None:
+    # Logged once per missing emoji (or missing emoji library)
+    logger.warning("%s, the emoji is kept as text", message)
+
+
+@functools.lru_cache(maxsize=4096)
 def replace_emoji(text: str, font_size: float = 10.0) -> str:
     """Replaces all emoji in a text by a reportlab `img`-tag.
 
+    The result is cached per text and font size (e.g. for the paragraphs of
+    every build pass). The emoji are loaded on the first emoji found. Emoji
+    without PNG (or without emoji library) are kept as text.
+
     Args:
         text: The text to replace the emoji in.
         font_size: The font size of the text to scale the emoji PNGs
@@ -160,15 +181,14 @@ def replace_emoji(text: str, font_size: float = 10.0) -> str:
 
     Returns:
         The text with the emoji replaced by `img`-tags.
-
-    Raises:
-        KeyError: If no PNG path can be found for an emoji.
     """
-    if len(EMOJI) == 0:
-        setup_emojis()
 
     def to_image(em: str, data_dict: dict[str, Any]) -> str:
-        fp = emoji_png_path(em)
+        try:
+            fp = emoji_png_path(em)
+        except (KeyError, ValueError) as e:
+            _log_missing_emoji(str(e.args[0]))
+            return em
         return (
             f'<img height="{font_size!s:s}" src="{fp!s:s}" '
             f'valign="text-bottom" width="{font_size!s:s}"/>'
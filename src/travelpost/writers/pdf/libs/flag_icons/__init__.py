@@ -3,6 +3,8 @@
 import json
 import pathlib
 
+from travelpost.writers.pdf.libs.bundle import build_bundle
+from travelpost.writers.pdf.libs.bundle import load_bundle
 from travelpost.writers.pdf.libs.flag_icons.interface import FlagIcon
 
 PATH: pathlib.Path = pathlib.Path("lib/flag-icons").resolve()
@@ -17,6 +19,9 @@ COUNTRY_CODES: tuple[str] = tuple()
 def setup_flags(path: pathlib.Path | str | None = None) -> None:
     """Load Flags.
 
+    Loads the bundle of the flags if it is up-to-date (see
+    `build_flags_bundle`).
+
     Args:
         path: Flag path (directory with "country.json").
 
@@ -34,9 +39,62 @@ def setup_flags(path: pathlib.Path | str | None = None) -> None:
     if not json_path.exists():
         msg = f"cannot find {json_path.as_posix()!r:s}"
         raise ValueError(msg)
+
+    bundle = load_bundle(path, json_path)
+    if bundle is not None:
+        flags = bundle.entries
+        bundle.add_svg_drawings()
+    else:
+        flags = _load_flags(path, json_path)
+
+    for flag in flags:
+        if flag.code in _FLAGS:
+            msg = f"country code {flag.code!r:s} exists already"
+            raise ValueError(msg)
+
+        _FLAGS[flag.code] = flag
+        _FLAGS_BY_NAME[flag.name.lower().replace(" ", "_")] = flag
+
+    COUNTRY_CODES = tuple(_FLAGS.keys())
+
+
+def build_flags_bundle(path: pathlib.Path | str | None = None) -> pathlib.Path:
+    """Compiles the flags and their pre-parsed svgs into a bundle
+    (`<path>/bundle.pickle`), which `setup_flags` loads instead.
+
+    Args:
+        path: Flag path (directory with "country.json").
+
+    Returns:
+        The bundle path.
+
+    Raises:
+        ValueError: See `setup_flags`.
+    """
+    path = pathlib.Path(path) if path is not None else PATH
+
+    json_path = path / "country.json"
+    if not json_path.exists():
+        msg = f"cannot find {json_path.as_posix()!r:s}"
+        raise ValueError(msg)
+
+    flags = _load_flags(path, json_path)
+    return build_bundle(
+        path,
+        json_path,
+        flags,
+        (p for flag in flags for p in (flag.flag_1x1, flag.flag_4x3)),
+    )
+
+
+def _load_flags(
+    path: pathlib.Path,
+    json_path: pathlib.Path,
+) -> list[FlagIcon]:
     with json_path.open(encoding="utf-8") as f:
         data = json.load(f)
 
+    flags = []
     for d in data:
         flag = FlagIcon.from_dict(d, path_prefix=path)
 
@@ -52,14 +110,8 @@ def setup_flags(path: pathlib.Path | str | None = None) -> None:
                 f"{flag.flag_4x3.as_posix()!r:s}"
             )
             raise ValueError(msg)
-        if flag.code in _FLAGS:
-            msg = f"country code {flag.code!r:s} exists already"
-            raise ValueError(msg)
-
-        _FLAGS[flag.code] = flag
-        _FLAGS_BY_NAME[flag.name.lower().replace(" ", "_")] = flag
-
-        COUNTRY_CODES = tuple(_FLAGS.keys())
+        flags.append(flag)
+    return flags
 
 
 def flag_by_code(code: str) -> FlagIcon:
@@ -113,6 +165,7 @@ def flag_by_name(name: str) -> FlagIcon:
 __all__ = (
     "COUNTRY_CODES",
     "FlagIcon",
+    "build_flags_bundle",
     "flag_by_code",
     "flag_by_name",
     "setup_flags",
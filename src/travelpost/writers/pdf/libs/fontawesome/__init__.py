@@ -12,6 +12,8 @@ import json
 import pathlib
 import string
 
+from travelpost.writers.pdf.libs.bundle import build_bundle
+from travelpost.writers.pdf.libs.bundle import load_bundle
 from travelpost.writers.pdf.libs.fontawesome.interface import FAIcon
 
 PATH: pathlib.Path = pathlib.Path("lib/fontawesome").resolve()
@@ -27,6 +29,9 @@ FA_STYLES: tuple[str] = ("brands", "regular", "solid")
 def setup_icons(path: pathlib.Path | str | None = None) -> None:
     """Load Icons.
 
+    Loads the bundle of the icons if it is up-to-date (see
+    `build_icons_bundle`).
+
     Args:
         path: Font-Awesome path (directory with "metadata" and "svgs"-subdir).
 
@@ -44,9 +49,54 @@ def setup_icons(path: pathlib.Path | str | None = None) -> None:
     if not json_path.exists():
         msg = f"cannot find {json_path.as_posix()!r:s}"
         raise ValueError(msg)
+
+    bundle = load_bundle(path, json_path)
+    if bundle is not None:
+        _ICONS.update(bundle.entries)
+        bundle.add_svg_drawings()
+    else:
+        _ICONS.update(_load_icons(path, json_path))
+
+    FA_ICONS = tuple(_ICONS.keys())
+
+
+def build_icons_bundle(path: pathlib.Path | str | None = None) -> pathlib.Path:
+    """Compiles the icons and their pre-parsed svgs into a bundle
+    (`<path>/bundle.pickle`), which `setup_icons` loads instead.
+
+    Args:
+        path: Font-Awesome path (directory with "metadata" and "svgs"-subdir).
+
+    Returns:
+        The bundle path.
+
+    Raises:
+        ValueError: See `setup_icons`.
+    """
+    path = pathlib.Path(path) if path is not None else PATH
+
+    json_path = path / "metadata" / "icons.json"
+    if not json_path.exists():
+        msg = f"cannot find {json_path.as_posix()!r:s}"
+        raise ValueError(msg)
+
+    icons = _load_icons(path, json_path)
+    return build_bundle(
+        path,
+        json_path,
+        icons,
+        (p for icon in icons.values() for p in icon.svg_paths.values()),
+    )
+
+
+def _load_icons(
+    path: pathlib.Path,
+    json_path: pathlib.Path,
+) -> dict[str, FAIcon]:
     with json_path.open(encoding="utf-8") as f:
         data = json.load(f)
 
+    icons = {}
     for label, d in data.items():
         icon = FAIcon.from_dict(d, path, load_svg_in_json=False)
         for style, svg_path in icon.svg_paths.items():
@@ -57,7 +107,7 @@ def setup_icons(path: pathlib.Path | str | None = None) -> None:
                 )
                 raise ValueError(msg)
 
-        _ICONS[label] = icon
+        icons[label] = icon
         if "names" in icon.aliases:
             for alias in icon.aliases["names"]:
                 alias_dict = icon.to_dict()
@@ -69,13 +119,12 @@ def setup_icons(path: pathlib.Path | str | None = None) -> None:
                     alias_dict["svg_paths"][style] = pathlib.Path(
                         str(svg_path).replace(label, alias)
                     )
-                _ICONS[alias] = FAIcon(**alias_dict)
+                icons[alias] = FAIcon(**alias_dict)
 
-    if len(_ICONS) == 0:
+    if len(icons) == 0:
         msg = f"no font-awesome icon definitions in {json_path.as_posix()!r:s}"
         raise ValueError(msg)
-
-    FA_ICONS = tuple(_ICONS.keys())
+    return icons
 
 
 def fa_icon(label: str) -> FAIcon:
@@ -105,4 +154,11 @@ def fa_icon(label: str) -> FAIcon:
         raise KeyError(msg) from e
 
 
-__all__ = ("FA_ICONS", "FA_STYLES", "FAIcon", "fa_icon", "setup_icons")
+__all__ = (
+    "FA_ICONS",
+    "FA_STYLES",
+    "FAIcon",
+    "build_icons_bundle",
+    "fa_icon",
+    "setup_icons",
+)
@@ -9,6 +9,8 @@ from travelpost.writers.pdf.libs.reportlab.libs.color import register_color
 from travelpost.writers.pdf.libs.reportlab.libs.color import to_color
 from travelpost.writers.pdf.libs.reportlab.libs.drawing import LineCap
 from travelpost.writers.pdf.libs.reportlab.libs.drawing import LineJoin
+from travelpost.writers.pdf.libs.reportlab.libs.drawing import add_svg_drawings
+from travelpost.writers.pdf.libs.reportlab.libs.drawing import svg_drawing
 from travelpost.writers.pdf.libs.reportlab.libs.drawing import (
     update_drawing_attributes,
 )
@@ -19,12 +21,19 @@ from travelpost.writers.pdf.libs.reportlab.libs.geom_tuples import Box
 from travelpost.writers.pdf.libs.reportlab.libs.geom_tuples import Gap
 from travelpost.writers.pdf.libs.reportlab.libs.geom_tuples import Margin
 from travelpost.writers.pdf.libs.reportlab.libs.geom_tuples import Padding
+from travelpost.writers.pdf.libs.reportlab.libs.image import ImageCache
+from travelpost.writers.pdf.libs.reportlab.libs.image import image_cache
+from travelpost.writers.pdf.libs.reportlab.libs.image import prepare_image
 from travelpost.writers.pdf.libs.reportlab.libs.image import read_jpeg_info
+from travelpost.writers.pdf.libs.reportlab.libs.image import shared_image_reader
+from travelpost.writers.pdf.libs.reportlab.libs.pdf import merge_pdf_pages
+from travelpost.writers.pdf.libs.reportlab.libs.pdf import optimize_pdf
 from travelpost.writers.pdf.libs.reportlab.libs.stylesheet import StyleSheet
 
 __all__ = (
     "Box",
     "Gap",
+    "ImageCache",
     "LineCap",
     "LineJoin",
     "Margin",
@@ -33,10 +42,17 @@ __all__ = (
     "TextAlignment",
     "TextTransform",
     "VAlignment",
+    "add_svg_drawings",
     "change_color_transparency",
     "css_color",
+    "image_cache",
+    "merge_pdf_pages",
+    "optimize_pdf",
+    "prepare_image",
     "read_jpeg_info",
     "register_color",
+    "shared_image_reader",
+    "svg_drawing",
     "to_color",
     "units",
     "update_drawing_attributes",
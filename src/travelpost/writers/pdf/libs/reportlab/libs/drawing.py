@@ -1,9 +1,17 @@
 """Drawing Utils."""
 
+from collections.abc import Callable, Iterable
 import enum
+import functools
+import os
+import pathlib
 from typing import Any, Self
 
+from reportlab.graphics.shapes import Drawing
+from reportlab.graphics.shapes import Group
 from reportlab.graphics.shapes import Shape
+from reportlab.lib.colors import Color
+from svglib.svglib import svg2rlg
 
 
 class LineCap(enum.IntEnum):
@@ -41,3 +49,78 @@ def update_drawing_attributes(node: Shape, **kw: Any) -> None:
     if hasattr(node, "contents"):
         for child in node.contents:
             update_drawing_attributes(child, **kw)
+
+
+# Pre-parsed drawings by absolute SVG path (see `add_svg_drawings`)
+_SVG_LOADERS: dict[str, Callable[[str], Drawing | None]] = {}
+
+
+@functools.cache
+def _parse_svg(path: str, mtime_ns: int) -> Drawing | None:
+    return svg2rlg(path)
+
+
+@functools.cache
+def _load_svg(path: str) -> Drawing | None:
+    return _SVG_LOADERS[path](path)
+
+
+def add_svg_drawings(
+    paths: Iterable[pathlib.Path | str],
+    loader: Callable[[str], Drawing | None],
+) -> None:
+    """Adds pre-parsed drawings of SVG files (e.g. of an asset bundle), which
+    `svg_drawing` loads with `loader(<absolute path>)` instead of parsing the
+    SVG files.
+    """
+    _SVG_LOADERS.update((os.path.abspath(p), loader) for p in paths)
+    _load_svg.cache_clear()
+
+
+def _copy_shape(node: Shape) -> Shape:
+    copy = node.copy()
+    if isinstance(node, Group):
+        copy.contents = [_copy_shape(child) for child in node.contents]
+    return copy
+
+
+def _convert_colors(
+    node: Shape, color_converter: Callable[[Color], Any]
+) -> None:
+    for attr in ("fillColor", "strokeColor"):
+        color = getattr(node, attr, None)
+        if isinstance(color, Color):
+            setattr(node, attr, color_converter(color))
+    if isinstance(node, Group):
+        for child in node.contents:
+            _convert_colors(child, color_converter)
+
+
+def svg_drawing(
+    path: pathlib.Path | str,
+    color_converter: Callable[[Color], Any] | None = None,
+) -> Drawing | None:
+    """Returns the drawing of an SVG file (`svg2rlg`).
+
+    The SVG files are parsed once per process (and modification) unless added
+    pre-parsed (`add_svg_drawings`). Every call returns a copy of the parsed
+    drawing, which can be changed freely (e.g. `update_drawing_attributes`).
+
+    Args:
+        path: The SVG file.
+        color_converter: Converts the colors of the drawing.
+
+    Returns:
+        The drawing or `None` if the SVG file could not be processed.
+    """
+    path = os.path.abspath(path)
+    if path in _SVG_LOADERS:
+        drawing = _load_svg(path)
+    else:
+        drawing = _parse_svg(path, os.stat(path).st_mtime_ns)
+    if drawing is None:
+        return None
+    drawing = _copy_shape(drawing)
+    if color_converter is not None:
+        _convert_colors(drawing, color_converter)
+    return drawing
@@ -1,8 +1,19 @@
 """Image."""
 
+import functools
+import hashlib
+import logging
+import math
+import os
 import pathlib
+import tempfile
+import threading
+from typing import Literal
 
 from PIL import Image as PillowImage
+from reportlab.lib.utils import ImageReader
+
+logger = logging.getLogger(__name__)
 
 
 def read_jpeg_info(
@@ -14,3 +25,220 @@ def read_jpeg_info(
         color = len(img.getbands())
         dpi_x, dpi_y = img.info.get("dpi", (72, 72))
     return width, height, color, (int(dpi_x), int(dpi_y))
+
+
+@functools.lru_cache(maxsize=256)
+def shared_image_reader(src: str) -> ImageReader:
+    """Returns the image reader of a small image file shared by all its uses
+    (e.g. the emojis of paragraphs).
+
+    The image is decoded once per process, and the canvas registers it once
+    per document as image XObject.
+    """
+    return ImageReader(src)
+
+
+def prepare_image(
+    in_: pathlib.Path | str,
+    out: pathlib.Path | str,
+    size: tuple[int, int] | None = None,
+    fit: Literal["cover", "contain"] = "cover",
+    quality: int = 75,
+) -> None:
+    """Prepares an image for embedding: resampled to the size (cropped to its
+    aspect ratio for `fit="cover"`) and saved as JPEG (`.jpg`) or PNG.
+
+    Args:
+        in_: The image.
+        out: The prepared image.
+        size: The size (width, height) [px], `None` keeps the size.
+        fit: The object-fit of the image.
+        quality: The JPEG quality.
+    """
+    out = pathlib.Path(out)
+    with PillowImage.open(in_) as img:
+        if size is not None:
+            if img.mode == "P":
+                img = img.convert("RGBA")
+            box = _crop_box(img.size, size, fit)
+            # Decode JPEGs in reduced size
+            img_size = img.size
+            img.draft(
+                img.mode,
+                (
+                    math.ceil(size[0] * img_size[0] / (box[2] - box[0])),
+                    math.ceil(size[1] * img_size[1] / (box[3] - box[1])),
+                ),
+            )
+            fx, fy = img.size[0] / img_size[0], img.size[1] / img_size[1]
+            img = img.resize(
+                size,
+                PillowImage.Resampling.LANCZOS,
+                box=(box[0] * fx, box[1] * fy, box[2] * fx, box[3] * fy),
+            )
+        if out.suffix.lower() in (".jpg", ".jpeg"):
+            img.save(out, format="JPEG", quality=quality)
+        else:
+            img.save(out, format="PNG")
+
+
+def _crop_box(
+    img_size: tuple[int, int],
+    size: tuple[int, int],
+    fit: Literal["cover", "contain"],
+) -> tuple[float, float, float, float]:
+    width, height = img_size
+    if fit != "cover":
+        return (0.0, 0.0, float(width), float(height))
+    scale = max(size[0] / width, size[1] / height)
+    # Rounding may exceed the image for the same aspect ratio
+    crop_width = min(size[0] / scale, float(width))
+    crop_height = min(size[1] / scale, float(height))
+    left, top = (width - crop_width) / 2, (height - crop_height) / 2
+    return (left, top, left + crop_width, top + crop_height)
+
+
+def user_cache_path() -> pathlib.Path:
+    """Returns the cache directory of the user (`$XDG_CACHE_HOME/travelpost`,
+    default `~/.cache/travelpost`).
+    """
+    cache_home = os.environ.get("XDG_CACHE_HOME")
+    root = (
+        pathlib.Path(cache_home)
+        if cache_home
+        else pathlib.Path.home() / ".cache"
+    )
+    return root / "travelpost"
+
+
+class ImageCache:
+    """Prepared Image Cache.
+
+    Images prepared for embedding (see `prepare_image`) are stored in the cache
+    directory, keyed by the hash of the source and the size, fit and quality.
+    Without `path`, the images are stored in the user cache directory
+    (`$XDG_CACHE_HOME/travelpost/images`). With `next_to_sources` (opt-in),
+    they are stored in a `.images` directory next to their source instead,
+    i.e. in the photo folders.
+
+    The source hashes and image infos are memoized by modification time and
+    size, so repeated (multi-pass) builds do not read the sources again.
+    """
+
+    DIRNAME: str = ".images"
+    JPEG_SUFFIXES: frozenset[str] = frozenset((".jpeg", ".jpg"))
+
+    def __init__(
+        self,
+        path: pathlib.Path | str | None = None,
+        next_to_sources: bool = False,
+    ) -> None:
+        self._lock = threading.Lock()
+        self._path = pathlib.Path(path) if path is not None else None
+        self.next_to_sources = next_to_sources
+        self._digests: dict[tuple[str, int, int], str] = {}
+        self._infos: dict[
+            tuple[str, int, int], tuple[int, int, int, tuple[int, int]]
+        ] = {}
+
+    @property
+    def path(self) -> pathlib.Path | None:
+        return self._path
+
+    @path.setter
+    def path(self, path: pathlib.Path | str | None) -> None:
+        with self._lock:
+            self._path = pathlib.Path(path) if path is not None else None
+
+    def directory(self, src: pathlib.Path) -> pathlib.Path:
+        """Returns the directory of the prepared images of the source."""
+        if self.next_to_sources:
+            return pathlib.Path(src).parent / self.DIRNAME
+        if self._path is not None:
+            return self._path
+        return user_cache_path() / "images"
+
+    @staticmethod
+    def _key(src: pathlib.Path) -> tuple[str, int, int]:
+        stat = src.stat()
+        return (src.resolve().as_posix(), stat.st_mtime_ns, stat.st_size)
+
+    def info(
+        self, src: pathlib.Path | str
+    ) -> tuple[int, int, int, tuple[int, int]]:
+        """Returns the info of the image read from its header (see
+        `read_jpeg_info`).
+        """
+        src = pathlib.Path(src)
+        key = self._key(src)
+        with self._lock:
+            info = self._infos.get(key)
+        if info is None:
+            info = read_jpeg_info(src)
+            with self._lock:
+                self._infos[key] = info
+        return info
+
+    def _digest(self, src: pathlib.Path) -> str:
+        key = self._key(src)
+        with self._lock:
+            digest = self._digests.get(key)
+        if digest is None:
+            with open(src, mode="rb") as f:
+                digest = hashlib.file_digest(f, "sha1").hexdigest()
+            with self._lock:
+                self._digests[key] = digest
+        return digest
+
+    def _target(
+        self,
+        src: pathlib.Path,
+        size: tuple[int, int] | None,
+        fit: Literal["cover", "contain"],
+        quality: int,
+    ) -> pathlib.Path:
+        size_ = f"{size[0]:d}x{size[1]:d}" if size is not None else "full"
+        suffix = ".jpg" if src.suffix.lower() in self.JPEG_SUFFIXES else ".png"
+        return self.directory(src) / (
+            f"{self._digest(src)[:16]:s}-{size_:s}-{fit:s}-q{quality:d}"
+            f"{suffix:s}"
+        )
+
+    def get(
+        self,
+        src: pathlib.Path | str,
+        size: tuple[int, int] | None = None,
+        fit: Literal["cover", "contain"] = "cover",
+        quality: int = 75,
+    ) -> pathlib.Path:
+        """Returns the path of the prepared image, prepares it if it is
+        missing.
+
+        Args:
+            src: The image.
+            size: The size (width, height) [px], `None` keeps the size.
+            fit: The object-fit of the image.
+            quality: The JPEG quality.
+        """
+        src = pathlib.Path(src)
+        out = self._target(src, size, fit, quality)
+        if out.exists():
+            return out
+
+        logger.debug("Preparing image %r (%r)", str(src), out.name)
+        out.parent.mkdir(exist_ok=True, parents=True)
+        # Written under a unique name first (concurrent builds)
+        fd, part = tempfile.mkstemp(
+            suffix=out.suffix, prefix=f"{out.stem:s}-", dir=out.parent
+        )
+        os.close(fd)
+        try:
+            prepare_image(src, part, size, fit=fit, quality=quality)
+            pathlib.Path(part).replace(out)
+        except BaseException:
+            pathlib.Path(part).unlink(missing_ok=True)
+            raise
+        return out
+
+
+image_cache = ImageCache()
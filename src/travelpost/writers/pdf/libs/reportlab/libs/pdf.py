@@ -0,0 +1,420 @@
+"""PDF.
+
+Merges the pages of PDF documents written by ReportLab (classic cross-reference
+table, no object streams, no encryption) and optimizes them.
+"""
+
+import base64
+from collections.abc import Callable, Sequence
+import dataclasses
+import hashlib
+import logging
+import os
+import pathlib
+import re
+import zlib
+
+logger = logging.getLogger(__name__)
+
+_STARTXREF = re.compile(rb"startxref\s+(\d+)\s+%%EOF\s*$")
+_OBJ = re.compile(rb"\d+ 0 obj\r?\n(.*?)\s*endobj\s*$", re.S)
+_STREAM = re.compile(rb"\sstream\r?\n")
+# Literal strings and hex strings are skipped, only references are replaced
+_TOKEN = re.compile(rb"\((?:\\.|[^\\)])*\)|<[0-9A-Fa-f\s]*>|(\d+) 0 R\b", re.S)
+_REF = rb"/%s (\d+) 0 R"
+_KIDS = re.compile(rb"/Kids\s*\[([^\]]*)\]")
+_ID = re.compile(rb"/ID\s*(\[[^\]]*\])")
+_VERSION = re.compile(rb"^%PDF-1\.[0-4]")
+_FONT = re.compile(rb"/Type\s*/Font|/FontFile|/Length1\b")
+_A85 = re.compile(rb"/Filter\s*\[\s*/ASCII85Decode\s*(/\w+)?\s*\]")
+_LENGTH = re.compile(rb"/Length (\d+)\b")
+_OBJECTS_PER_STREAM = 100
+
+SIZE_CATEGORIES: tuple[str, ...] = (
+    "images",
+    "forms",
+    "fonts",
+    "content",
+    "other",
+)
+"""The categories of the size report (see `optimize_pdf`)."""
+
+
+@dataclasses.dataclass(frozen=True, kw_only=True)
+class _Document:
+    header: bytes
+    objects: dict[int, bytes]
+    root: int
+    info: int | None
+    id: bytes | None
+    pages: list[int]
+
+    @classmethod
+    def read(cls, path: pathlib.Path | str) -> "_Document":
+        data = pathlib.Path(path).read_bytes()
+        m = _STARTXREF.search(data[-64:])
+        start = int(m[1]) if m is not None else -1
+        if not data.startswith(b"%PDF-") or data[start : start + 4] != b"xref":
+            msg = f"unsupported PDF {str(path)!r:s}"
+            raise ValueError(msg)
+
+        offsets = {}
+        pos = start + 4
+        trailer = data.index(b"trailer", pos)
+        lines = data[pos:trailer].split()
+        i = 0
+        while i < len(lines):
+            first, count = int(lines[i]), int(lines[i + 1])
+            for n in range(count):
+                offset, _, kind = lines[i + 2 + 3 * n : i + 5 + 3 * n]
+                if kind == b"n":
+                    offsets[first + n] = int(offset)
+            i += 2 + 3 * count
+
+        # Every object ends where the next one (or the xref table) starts
+        starts = sorted(offsets.values())
+        ends = dict(zip(starts, [*starts[1:], start], strict=True))
+        objects = {
+            num: _OBJ.match(data, offset, ends[offset])[1]
+            for num, offset in offsets.items()
+        }
+
+        tail = data[trailer:]
+        root = int(re.search(_REF % b"Root", tail)[1])
+        info = re.search(_REF % b"Info", tail)
+        id_ = _ID.search(tail)
+        return cls(
+            header=data[: min(offsets.values())],
+            objects=objects,
+            root=root,
+            info=int(info[1]) if info is not None else None,
+            id=id_[1] if id_ is not None else None,
+            pages=cls._read_pages(objects, objects[root]),
+        )
+
+    @staticmethod
+    def _read_pages(objects: dict[int, bytes], node: bytes) -> list[int]:
+        pages = []
+        m = re.search(_REF % b"Pages", node)
+        kids = _KIDS.search(objects[int(m[1])] if m is not None else node)
+        for ref in re.findall(rb"(\d+) 0 R", kids[1]):
+            if _KIDS.search(objects[int(ref)]) is not None:
+                pages.extend(_Document._read_pages(objects, objects[int(ref)]))
+            else:
+                pages.append(int(ref))
+        return pages
+
+
+def _replace_refs(obj: bytes, replace: Callable[[int], int]) -> bytes:
+    m = _STREAM.search(obj) if obj.startswith(b"<<") else None
+    head, stream = (obj[: m.start()], obj[m.start() :]) if m else (obj, b"")
+
+    def replace_ref(m: re.Match) -> bytes:
+        if m[1] is None:
+            return m[0]
+        return b"%d 0 R" % replace(int(m[1]))
+
+    return _TOKEN.sub(replace_ref, head) + stream
+
+
+def _decode_ascii85(obj: bytes) -> bytes:
+    # ReportLab encodes the streams in ASCII85 (`rl_config.useA85`), 25 %
+    # larger than binary
+    m = _STREAM.search(obj) if obj.startswith(b"<<") else None
+    if m is None:
+        return obj
+    head = obj[: m.start()]
+    filter_ = _A85.search(head)
+    length = _LENGTH.search(head)
+    if filter_ is None or length is None:
+        return obj
+    data = obj[m.end() : m.end() + int(length[1])]
+    data = base64.a85decode(data.strip().removesuffix(b"~>"))
+    head = _A85.sub(
+        b"/Filter %s" % filter_[1] if filter_[1] is not None else b"", head
+    )
+    head = _LENGTH.sub(b"/Length %d" % len(data), head)
+    return head + obj[m.start() : m.end()] + data + b"\nendstream"
+
+
+def _is_stream(obj: bytes) -> bool:
+    return obj.startswith(b"<<") and _STREAM.search(obj) is not None
+
+
+def _category(obj: bytes) -> str:
+    if not obj.startswith(b"<<"):
+        return "other"
+    m = _STREAM.search(obj)
+    head = obj[: m.start()] if m is not None else obj
+    if b"/Subtype /Image" in head:
+        return "images"
+    if b"/Subtype /Form" in head:
+        return "forms"
+    if _FONT.search(head) is not None:
+        return "fonts"
+    # Page contents
+    return "content" if m is not None else "other"
+
+
+def _object_stream(objects: Sequence[tuple[int, bytes]]) -> bytes:
+    offsets, pos = [], 0
+    for num, obj in objects:
+        offsets.append(b"%d %d" % (num, pos))
+        pos += len(obj) + 1
+    index = b" ".join(offsets) + b"\n"
+    data = zlib.compress(index + b"\n".join(obj for _, obj in objects))
+    return (
+        b"<< /Type /ObjStm /N %d /First %d /Filter /FlateDecode /Length %d >>"
+        b"\nstream\n%s\nendstream" % (len(objects), len(index), len(data), data)
+    )
+
+
+class _Writer:
+    def __init__(self, documents: Sequence[_Document], owners: Sequence[int]):
+        self._documents = documents
+        self._objects: dict[int, bytes] = {}
+        self._numbers: dict[tuple[int, int], int] = {}
+        self._digests: dict[bytes, int] = {}
+        self._copying: set[tuple[int, int]] = set()
+        # The pages are the first objects, every document refers to page `i`
+        # of the merged document by its own page `i`
+        self._pages = [
+            {page: i + 1 for i, page in enumerate(d.pages)} for d in documents
+        ]
+        self._next = len(owners) + 1
+        for i, owner in enumerate(owners):
+            page = documents[owner].pages[i]
+            self._objects[i + 1] = _replace_refs(
+                documents[owner].objects[page],
+                lambda n, owner=owner: self.copy(owner, n),
+            )
+
+    def _allocate(self) -> int:
+        num = self._next
+        self._next += 1
+        return num
+
+    def copy(self, doc: int, num: int) -> int:
+        """Copies an object and the objects it refers to, returns its number.
+
+        Identical objects (e.g. fonts and images shared by the documents) are
+        written once.
+        """
+        if (page := self._pages[doc].get(num)) is not None:
+            return page
+        key = (doc, num)
+        if key in self._numbers:
+            return self._numbers[key]
+        if key in self._copying:
+            # Cyclic reference (e.g. outline entries)
+            self._numbers[key] = self._allocate()
+            return self._numbers[key]
+
+        self._copying.add(key)
+        obj = _replace_refs(
+            self._documents[doc].objects[num], lambda n: self.copy(doc, n)
+        )
+        self._copying.remove(key)
+        if key in self._numbers:
+            self._objects[self._numbers[key]] = obj
+            return self._numbers[key]
+
+        unique = b"/Annot" in obj
+        digest = hashlib.sha1(obj).digest()
+        if not unique and digest in self._digests:
+            self._numbers[key] = self._digests[digest]
+        else:
+            self._numbers[key] = self._allocate()
+            self._objects[self._numbers[key]] = obj
+            if not unique:
+                self._digests[digest] = self._numbers[key]
+        return self._numbers[key]
+
+    def write(
+        self,
+        path: pathlib.Path,
+        header: bytes,
+        root: int,
+        info: int | None,
+        id_: bytes | None,
+        object_streams: bool = False,
+    ) -> dict[str, int]:
+        """Writes the document, returns its size by category (see
+        `SIZE_CATEGORIES`).
+
+        With `object_streams`, the objects other than streams are packed into
+        compressed object streams and referred to by a cross-reference stream
+        (PDF 1.5).
+        """
+        size = self._next
+        sizes = dict.fromkeys(SIZE_CATEGORIES, 0)
+        trailer = b"/Root %d 0 R /Size %d" % (root, size)
+        if info is not None:
+            trailer = b"/Info %d 0 R %s" % (info, trailer)
+        if id_ is not None:
+            trailer = b"/ID %s %s" % (id_, trailer)
+
+        packed = []
+        if object_streams:
+            header = _VERSION.sub(b"%PDF-1.5", header)
+            packed = [
+                num
+                for num in range(1, size)
+                if not _is_stream(self._objects[num])
+            ]
+        # (type, offset or object stream, index) by object number
+        entries = [(0, 0, 65535)] + [(1, 0, 0)] * (size - 1)
+        chunks = [header]
+        pos = len(header)
+
+        def append(num: int, obj: bytes) -> None:
+            nonlocal pos
+            chunk = b"%d 0 obj\n%s\nendobj\n" % (num, obj)
+            if num < len(entries):
+                entries[num] = (1, pos, 0)
+            else:
+                entries.append((1, pos, 0))
+            pos += len(chunk)
+            chunks.append(chunk)
+
+        packed_set = set(packed)
+        for num in range(1, size):
+            if num not in packed_set:
+                obj = self._objects[num]
+                append(num, obj)
+                sizes[_category(obj)] += len(chunks[-1])
+        for i in range(0, len(packed), _OBJECTS_PER_STREAM):
+            objects = [
+                (num, self._objects[num])
+                for num in packed[i : i + _OBJECTS_PER_STREAM]
+            ]
+            stream = len(entries)
+            append(stream, _object_stream(objects))
+            # The compressed size is shared by the packed objects
+            ratio = len(chunks[-1]) / sum(len(obj) for _, obj in objects)
+            for index, (num, obj) in enumerate(objects):
+                entries[num] = (2, stream, index)
+                sizes[_category(obj)] += round(len(obj) * ratio)
+
+        if object_streams:
+            xref_num = len(entries)
+            entries.append((1, pos, 0))
+            width = max(1, (max(e[1] for e in entries).bit_length() + 7) // 8)
+            data = zlib.compress(
+                b"".join(
+                    kind.to_bytes(1, "big")
+                    + field.to_bytes(width, "big")
+                    + index.to_bytes(2, "big")
+                    for kind, field, index in entries
+                )
+            )
+            trailer = trailer.replace(
+                b"/Size %d" % size, b"/Size %d" % len(entries)
+            )
+            xref = [
+                b"%d 0 obj\n<< /Type /XRef %s /W [1 %d 2] /Filter /FlateDecode"
+                b" /Length %d >>\nstream\n%s\nendstream\nendobj\n"
+                % (xref_num, trailer, width, len(data), data),
+                b"startxref\n%d\n%%%%EOF\n" % pos,
+            ]
+        else:
+            xref = [b"xref\n0 %d\n0000000000 65535 f \n" % size]
+            xref.extend(b"%010d 00000 n \n" % e[1] for e in entries[1:])
+            xref.append(
+                b"trailer\n<<\n%s\n>>\nstartxref\n%d\n%%%%EOF\n"
+                % (trailer, pos)
+            )
+
+        part = path.with_suffix(f"{path.suffix:s}.part")
+        with open(part, mode="wb") as f:
+            f.writelines(chunks)
+            f.writelines(xref)
+        os.replace(part, path)
+        sizes["other"] += path.stat().st_size - sum(sizes.values())
+        return sizes
+
+
+def merge_pdf_pages(
+    documents: Sequence[pathlib.Path | str],
+    owners: Sequence[int],
+    out: pathlib.Path | str,
+) -> None:
+    """Merges the pages of PDF documents with the same structure, e.g. the
+    parts of a document built in parallel (see `DocTemplate.multiBuild`).
+
+    The merged document takes page `i` from the document `owners[i]`, and
+    everything else (outlines, page labels, metadata) from the first
+    document. The references of the documents to their pages (links,
+    outlines) refer to the pages of the merged document. Identical objects
+    (fonts, images, forms) are written once.
+
+    Args:
+        documents: The PDF documents (with the same number of pages).
+        owners: The index of the document of each page.
+        out: The merged PDF document.
+    """
+    docs = [_Document.read(d) for d in documents]
+    if any(len(d.pages) != len(owners) for d in docs):
+        msg = (
+            f"{len(owners):d} pages expected, documents have "
+            f"{[len(d.pages) for d in docs]!r:s} pages"
+        )
+        raise ValueError(msg)
+
+    writer = _Writer(docs, owners)
+    root = writer.copy(0, docs[0].root)
+    info = writer.copy(0, docs[0].info) if docs[0].info is not None else None
+    writer.write(pathlib.Path(out), docs[0].header, root, info, docs[0].id)
+    logger.debug(
+        "Merged %d pages of %d documents into %r",
+        len(owners),
+        len(docs),
+        str(out),
+    )
+
+
+def optimize_pdf(
+    path: pathlib.Path | str,
+    out: pathlib.Path | str | None = None,
+    object_streams: bool = True,
+) -> dict[str, int]:
+    """Optimizes a PDF document written by ReportLab.
+
+    The streams are stored binary instead of ASCII85-encoded (ReportLab's
+    default) and identical objects are written once, e.g. the image streams
+    of the same photo embedded from different sources or the forms (headers,
+    footers, flags, country shapes) drawn by several canvases. The other
+    objects than streams are packed into compressed object streams.
+
+    Args:
+        path: The PDF document.
+        out: The optimized PDF document. Defaults to `path`.
+        object_streams: Whether to write object streams (PDF 1.5).
+
+    Returns:
+        The size [bytes] of the optimized document by category (see
+        `SIZE_CATEGORIES`).
+    """
+    doc = _Document.read(path)
+    for num, obj in doc.objects.items():
+        doc.objects[num] = _decode_ascii85(obj)
+    writer = _Writer([doc], [0] * len(doc.pages))
+    root = writer.copy(0, doc.root)
+    info = writer.copy(0, doc.info) if doc.info is not None else None
+    size = pathlib.Path(path).stat().st_size
+    sizes = writer.write(
+        pathlib.Path(out if out is not None else path),
+        doc.header,
+        root,
+        info,
+        doc.id,
+        object_streams=object_streams,
+    )
+    logger.info(
+        "Optimized %r from %d to %d bytes (%s)",
+        str(path),
+        size,
+        sum(sizes.values()),
+        ", ".join(f"{k:s}: {v:d}" for k, v in sizes.items()),
+    )
+    return sizes
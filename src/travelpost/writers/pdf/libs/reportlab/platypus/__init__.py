@@ -17,6 +17,7 @@ from travelpost.writers.pdf.libs.reportlab.platypus.image_flowable import (
     ImageFlowable,
 )
 from travelpost.writers.pdf.libs.reportlab.platypus.index import Index
+from travelpost.writers.pdf.libs.reportlab.platypus.lazy_story import LazyStory
 from travelpost.writers.pdf.libs.reportlab.platypus.page_abc import PageABC
 from travelpost.writers.pdf.libs.reportlab.platypus.page_abc import (
     PageGapTemplateABC,
@@ -40,6 +41,7 @@ __all__ = (
     "FrameBreak",
     "ImageFlowable",
     "Index",
+    "LazyStory",
     "PageABC",
     "PageGapTemplateABC",
     "PageTemplateABC",
@@ -1,22 +1,36 @@
 """Document Template."""
 
-from collections.abc import Sequence
+from collections.abc import Callable, Hashable, Sequence
+import concurrent.futures
 import enum
+import logging
+import math
+import multiprocessing
 import pathlib
+import sys
+import tempfile
+import threading
 from typing import Any, Self
 
+from reportlab.pdfgen.canvas import Canvas
 from reportlab.platypus import BaseDocTemplate
+from reportlab.platypus import Flowable
 from reportlab.rl_config import defaultPageSize
 
 from travelpost.writers.pdf.libs.reportlab.libs import Box
 from travelpost.writers.pdf.libs.reportlab.libs import Margin
+from travelpost.writers.pdf.libs.reportlab.libs import merge_pdf_pages
+from travelpost.writers.pdf.libs.reportlab.libs import optimize_pdf
 from travelpost.writers.pdf.libs.reportlab.libs.units import cm
+from travelpost.writers.pdf.libs.reportlab.platypus.lazy_story import LazyStory
 from travelpost.writers.pdf.libs.reportlab.platypus.page_abc import PageABC
 from travelpost.writers.pdf.libs.reportlab.platypus.page_abc import (
     PageTemplateABC,
 )
 from travelpost.writers.pdf.libs.reportlab.settings import SHOW_BOUNDARY
 
+logger = logging.getLogger(__name__)
+
 
 class VarLifetime(enum.StrEnum):
     """Variable Lifetime in Doc Template."""
@@ -46,8 +60,28 @@ class DocTemplate(PageABC, BaseDocTemplate):
         pagesize: Box | tuple[float, float] = defaultPageSize,
         pageTemplates: Sequence[PageTemplateABC] | None = None,
         margin: Margin | tuple[float, ...] | float = (2 * cm, 2 * cm),
+        image_dpi: float | None = None,
+        layout_passes: bool = True,
+        workers: int = 1,
+        optimize: bool = False,
         **kw: Any,
     ) -> None:
+        """Initializes the doc template.
+
+        Args:
+            image_dpi: The target resolution of the images (see
+                `ImageFlowable`), `None` embeds them in full resolution.
+            layout_passes: Whether `multiBuild` lays out the story without
+                drawing images, drawings and maps until the indexing flowables
+                are satisfied and renders it once afterwards.
+            workers: The number of processes rendering the pages (see
+                `multiBuild`). The processes are forked, so the pages are
+                only rendered in parallel on Linux (with the "fork" start
+                method) and without other running threads.
+            optimize: Whether `multiBuild` optimizes the written document:
+                compressed pages, binary streams, identical objects written
+                once and object streams (see `optimize_pdf`).
+        """
         filename = str(pathlib.Path(filename))
         margin = Margin(margin)
 
@@ -62,8 +96,24 @@ class DocTemplate(PageABC, BaseDocTemplate):
         kw["topMargin"] = margin.top
         kw["bottomMargin"] = margin.bottom
         kw["_debug"] = 1  # Log always on debug and turn logger on or off
+        if optimize:
+            kw["pageCompression"] = 1
 
         super().__init__(filename, **kw)
+        self.image_dpi = image_dpi
+        self.layout_passes = layout_passes
+        self.workers = workers
+        self.optimize = optimize
+        self.size_report: dict[str, int] | None = None
+        """The size [bytes] of the optimized document by category (see
+        `optimize_pdf`)."""
+        self.layout_only = False
+        """Whether the current build pass (or page) is layout-only (see
+        `Flowable.DRAW_ON_LAYOUT`)."""
+        self.page_cache: dict[Hashable, Any] = {}
+        """The flowables drawn by the page templates (e.g. headers and
+        footers), reused on the pages of every build pass of this document."""
+        self._render_pages: range | None = None
 
     @property
     def margin(self) -> Margin:
@@ -88,3 +138,207 @@ class DocTemplate(PageABC, BaseDocTemplate):
     def _calc(self) -> None:
         # NOTE: Overwritten by `PageABC`-properties
         pass
+
+    def multiBuild(
+        self,
+        story: list[Flowable],
+        maxPasses: int = 10,
+        **buildKwds: Any,
+    ) -> int:
+        """Makes multiple passes until all indexing flowables are happy.
+
+        With `layout_passes`, the passes are layout-only (images, drawings and
+        maps are not drawn, see `Flowable.DRAW_ON_LAYOUT`) until the indexing
+        flowables are happy, then a final pass renders the document.
+
+        With `workers`, the final pass is split into contiguous page ranges
+        rendered by forked processes (each lays out the whole story, but
+        renders its pages only) and the parts are merged (see
+        `merge_pdf_pages`).
+
+        With `optimize`, the written document is optimized afterwards (see
+        `optimize_pdf`).
+
+        Returns:
+            The number of passes.
+        """
+        parallel = self.workers > 1 and _can_fork()
+        if not self.layout_passes and not parallel:
+            passes = super().multiBuild(story, maxPasses=maxPasses, **buildKwds)
+        else:
+            passes = self._multi_build(story, maxPasses, parallel, **buildKwds)
+        if self.optimize:
+            self.size_report = optimize_pdf(self.filename)
+        return passes
+
+    def _multi_build(
+        self,
+        story: list[Flowable],
+        maxPasses: int,
+        parallel: bool,
+        **buildKwds: Any,
+    ) -> int:
+        buildKwds["canvasmaker"] = _layout_canvasmaker(
+            self, buildKwds.get("canvasmaker", Canvas)
+        )
+        self._indexingFlowables = [f for f in story if f.isIndexing()]
+        self._doSave = 0
+        passes = 0
+        edits = []
+        self._multiBuildEdits = edits.append
+        # Without indexing flowables, the first pass settles and is rendered
+        self.layout_only = parallel or len(self._indexingFlowables) > 0
+        try:
+            while True:
+                passes += 1
+                self._build_pass(story, **buildKwds)
+
+                if self._allSatisfied():
+                    if parallel:
+                        self._build_parts(story, **buildKwds)
+                        passes += 1
+                        break
+                    if not self.layout_only:
+                        self.canv.save()
+                        break
+                    # Render the settled layout
+                    self.layout_only = False
+                elif passes > maxPasses:
+                    msg = (
+                        f"index entries not resolved after {maxPasses:d} passes"
+                    )
+                    raise IndexError(msg)
+
+                while edits:
+                    e = edits.pop(0)
+                    e[0](*e[1:])
+        finally:
+            self.layout_only = False
+            del self._multiBuildEdits
+        logger.debug("Built %r in %d passes", self.filename, passes)
+        return passes
+
+    def filterFlowables(self, flowables: list[Flowable | None]) -> None:
+        # Expands the lazy stories about to be handled, including those kept
+        # with the next flowables
+        i = 0
+        while i < len(flowables) and (
+            i == 0 or flowables[i - 1].getKeepWithNext()
+        ):
+            if isinstance(flowables[i], LazyStory):
+                flowables[i : i + 1] = flowables[i].expand()
+            else:
+                i += 1
+        if len(flowables) == 0:
+            flowables.append(None)
+
+    def handle_pageBegin(self) -> None:
+        if self._render_pages is not None:
+            self.layout_only = self.page + 1 not in self._render_pages
+        super().handle_pageBegin()
+
+    def _build_pass(self, story: list[Flowable], **buildKwds: Any) -> None:
+        for f in self._indexingFlowables:
+            f.beforeBuild()
+        self.build(story[:], **buildKwds)
+        for f in self._indexingFlowables:
+            f.afterBuild()
+
+    def _build_parts(self, story: list[Flowable], **buildKwds: Any) -> None:
+        global _parts_doc
+        pages = self.page
+        size = math.ceil(pages / min(self.workers, pages))
+        parts = [
+            range(p, min(p + size, pages + 1))
+            for p in range(1, pages + 1, size)
+        ]
+        logger.info("Rendering %d pages in %d parts", pages, len(parts))
+
+        filename = pathlib.Path(self.filename)
+        with tempfile.TemporaryDirectory(
+            prefix=f".{filename.stem:s}-", dir=filename.parent
+        ) as tmp:
+            files = [
+                pathlib.Path(tmp) / f"{i:d}.pdf" for i in range(len(parts))
+            ]
+            _parts_doc = (self, story, buildKwds)
+            try:
+                with concurrent.futures.ProcessPoolExecutor(
+                    max_workers=len(parts),
+                    mp_context=multiprocessing.get_context("fork"),
+                ) as executor:
+                    list(executor.map(_build_part, files, parts))
+            finally:
+                _parts_doc = None
+            merge_pdf_pages(
+                files,
+                [i for i, part in enumerate(parts) for _ in part],
+                filename,
+            )
+
+
+_parts_doc: tuple[DocTemplate, list[Flowable], dict[str, Any]] | None = None
+"""The doc template building the parts, inherited by the forked processes."""
+
+
+def _build_part(filename: pathlib.Path, pages: range) -> None:
+    doc, story, buildKwds = _parts_doc
+    doc._render_pages = pages
+    doc._build_pass(story, filename=str(filename), **buildKwds)
+    doc.canv.save()
+
+
+def _can_fork() -> bool:
+    # Forking is unsafe on macOS (spawn by default since Python 3.8) and in a
+    # process with running threads (e.g. thumbnail or tile pools)
+    if sys.platform != "linux" or multiprocessing.get_start_method(
+        allow_none=True
+    ) not in (None, "fork"):
+        logger.warning(
+            "Cannot fork processes on %r, rendering in one process",
+            sys.platform,
+        )
+        return False
+    if threading.active_count() > 1:
+        logger.warning(
+            "Cannot fork a process with %d running threads, rendering in one "
+            "process",
+            threading.active_count(),
+        )
+        return False
+    return True
+
+
+def _layout_canvasmaker(
+    doc: DocTemplate,
+    canvasmaker: Callable[..., Canvas],
+) -> Callable[..., Canvas]:
+    def layout_canvasmaker(*args: Any, **kwargs: Any) -> Canvas:
+        canvas = canvasmaker(*args, **kwargs)
+        draw_image = canvas.drawImage
+        draw_inline_image = canvas.drawInlineImage
+        show_page = canvas.showPage
+
+        # Inline images (e.g. emojis of paragraphs) are not drawn and the
+        # content of layout-only pages is dropped
+        def drawImage(*args: Any, **kwargs: Any) -> Any:
+            if doc.layout_only:
+                return (0, 0)
+            return draw_image(*args, **kwargs)
+
+        def drawInlineImage(*args: Any, **kwargs: Any) -> Any:
+            if doc.layout_only:
+                return (0, 0)
+            return draw_inline_image(*args, **kwargs)
+
+        def showPage() -> None:
+            if doc.layout_only:
+                del canvas._code[:]
+            show_page()
+
+        canvas.drawImage = drawImage
+        canvas.drawInlineImage = drawInlineImage
+        canvas.showPage = showPage
+        return canvas
+
+    return layout_canvasmaker
@@ -4,6 +4,7 @@ NOTE: Enforces horizontal `alignment`, `spaceBefore`, `spaceAfter` and
       `showBoundary`-behavior.
 """
 
+from reportlab.pdfgen.canvas import Canvas
 from reportlab.platypus.flowables import Flowable as OrigFlowable
 
 from travelpost.writers.pdf.libs.reportlab.libs import TextAlignment
@@ -21,6 +22,11 @@ class Flowable(OrigFlowable):
     hAlign: TextAlignment
     _minWidth: float
 
+    DRAW_ON_LAYOUT: bool = True
+    """Whether the flowable is drawn in layout-only build passes (see
+    `DocTemplate.multiBuild`), disabled by costly flowables without side
+    effects (images, drawings, maps)."""
+
     def __init__(
         self,
         width: float,
@@ -53,3 +59,16 @@ class Flowable(OrigFlowable):
 
         self._minWidth = minWidth or width
         self._showBoundary = int(bool(showBoundary or SHOW_BOUNDARY))
+
+    def drawOn(
+        self,
+        canvas: Canvas,
+        x: float,
+        y: float,
+        _sW: float = 0,
+    ) -> None:
+        if not self.DRAW_ON_LAYOUT and getattr(
+            getattr(canvas, "_doctemplate", None), "layout_only", False
+        ):
+            return
+        super().drawOn(canvas, x, y, _sW=_sW)
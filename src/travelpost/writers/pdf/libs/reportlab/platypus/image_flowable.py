@@ -1,15 +1,11 @@
 """Image."""
 
-import io
 import logging
 import pathlib
 from typing import Literal
 
-from PIL import Image as PillowImage
-from reportlab.lib.utils import ImageReader
-
 from travelpost.writers.pdf.libs.reportlab import pdfgen
-from travelpost.writers.pdf.libs.reportlab.libs.image import read_jpeg_info
+from travelpost.writers.pdf.libs.reportlab.libs.image import image_cache
 from travelpost.writers.pdf.libs.reportlab.platypus.flowable import Flowable
 
 logger = logging.getLogger(__name__)
@@ -22,18 +18,31 @@ class ImageFlowable(Flowable):
     - `'cover'`:   Scale to fill the frame completely and crop overflow.
     - `'contain'`: Scale the image to fit in the frame and leave white space if
                    necessary.
+
+    Resolution: The image is embedded in full resolution unless a target
+    resolution is set (`dpi` or `image_dpi` of the doc template), e.g. 300 dpi
+    for print or 150 dpi for screen. Then the image is resampled (never
+    upsampled) to the drawn size and cropped to the visible area.
+
+    The prepared images are cached on disk, see `image_cache`.
     """
 
+    DRAW_ON_LAYOUT: bool = False
+    QUALITY: int = 75
+    """JPEG quality."""
+
     def __init__(
         self,
         filename: str | pathlib.Path,
         fit: Literal["cover", "contain"] = "cover",
         radius: float = 0.0,
+        dpi: float | None = None,
     ) -> None:
         self._filename = pathlib.Path(filename)
         self._fit = fit.lower()
+        self._dpi = dpi
 
-        info = read_jpeg_info(self._filename)
+        info = image_cache.info(self._filename)
         self._image_dpi: float = info[3][0]
         self._image_width: float = info[0]
         self._image_height: float = info[1]
@@ -87,24 +96,43 @@ class ImageFlowable(Flowable):
                     max(0, dx), max(0, dy), scaled_width, scaled_height, r
                 )
 
-        # BUG: https://stackoverflow.com/questions/60830301/python-reportlab-generates-large-files-when-i-add-jpeg
-        with io.BytesIO() as img_io, PillowImage.open(self._filename) as img:
-            img.save(img_io, format=img.format)
-            img_io.seek(0)
-
-            img_reader = ImageReader(img_io)
-            self.canv.drawImage(
-                img_reader,
-                dx,
-                dy,
-                width=scaled_width,
-                height=scaled_height,
-                preserveAspectRatio=False,
-                mask="auto",
+        # Visible area [pt] (cropped for `'cover'`)
+        x, y = max(0.0, dx), max(0.0, dy)
+        width = min(self.width, scaled_width)
+        height = min(self.height, scaled_height)
+
+        dpi = self._dpi or self._doctemplateAttr("image_dpi")
+        if dpi is not None:
+            # Never upsampled
+            factor = min(dpi / 72, 1 / scale)
+            size = (
+                max(1, round(width * factor)),
+                max(1, round(height * factor)),
             )
+            path = image_cache.get(
+                self._filename, size, fit=self._fit, quality=self.QUALITY
+            )
+        else:
+            # BUG: https://stackoverflow.com/questions/60830301/python-reportlab-generates-large-files-when-i-add-jpeg
+            path = image_cache.get(
+                self._filename, fit=self._fit, quality=self.QUALITY
+            )
+            x, y, width, height = dx, dy, scaled_width, scaled_height
+            size = (self._image_width, self._image_height)
+
+        # Prepared JPEGs are embedded as is (without decoding)
+        self.canv.drawImage(
+            str(path),
+            x,
+            y,
+            width=width,
+            height=height,
+            preserveAspectRatio=False,
+            mask="auto",
+        )
 
         logger.debug(
             "Resolution of img '%s': %d dpi",
             str(self._filename),
-            int(round(self._image_width / scaled_width * 72)),
+            int(round(size[0] / width * 72)),
         )
@@ -0,0 +1,60 @@
+"""Lazy Story."""
+
+from collections.abc import Callable, Iterable, Iterator
+from typing import Any
+
+from reportlab.platypus import Flowable
+
+
+class LazyStory(Flowable):
+    """Lazy Story.
+
+    A placeholder in the story for the flowables of many items (e.g. the posts
+    of a book), created item by item when the doc template reaches them (see
+    `DocTemplate.filterFlowables`). The flowables are created anew in every
+    build pass and released once drawn, so only the flowables of the current
+    item are kept in memory.
+    """
+
+    _ZEROSIZE: int = 1
+
+    def __init__(
+        self,
+        items: Iterable[Any],
+        create_flowables: Callable[[Any], Iterable[Flowable]],
+        _iterator: Iterator[Any] | None = None,
+    ) -> None:
+        """Initializes the lazy story.
+
+        Args:
+            items: The items, iterated once per build pass.
+            create_flowables: Creates the flowables of an item.
+        """
+        self.width = 0
+        self.height = 0
+
+        self._items = items
+        self._create_flowables = create_flowables
+        self._iterator = _iterator
+
+    def expand(self) -> list[Flowable]:
+        """Returns the flowables of the next item followed by the lazy story of
+        the remaining items, an empty list after the last item.
+        """
+        iterator = (
+            self._iterator if self._iterator is not None else iter(self._items)
+        )
+        try:
+            item = next(iterator)
+        except StopIteration:
+            return []
+        return [
+            *self._create_flowables(item),
+            LazyStory(self._items, self._create_flowables, iterator),
+        ]
+
+    def wrap(
+        self, availWidth: float, availHeight: float
+    ) -> tuple[float, float]:
+        msg = "lazy story must be expanded by the doc template"
+        raise RuntimeError(msg)
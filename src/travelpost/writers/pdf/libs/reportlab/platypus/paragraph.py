@@ -7,6 +7,7 @@ NOTE: Extends the original version by the use of the new convenient classes
 
 from __future__ import annotations
 
+from collections.abc import Callable
 from typing import Any, Literal
 import warnings
 
@@ -23,6 +24,7 @@ from travelpost.writers.pdf.libs.reportlab.libs import LineJoin
 from travelpost.writers.pdf.libs.reportlab.libs import Padding
 from travelpost.writers.pdf.libs.reportlab.libs import TextAlignment
 from travelpost.writers.pdf.libs.reportlab.libs import TextTransform
+from travelpost.writers.pdf.libs.reportlab.libs import shared_image_reader
 from travelpost.writers.pdf.libs.reportlab.libs import to_color
 
 
@@ -196,3 +198,22 @@ class Paragraph(OrigParagraph):
             caseSensitive=caseSensitive,
             encoding=encoding,
         )
+
+    def _setup(
+        self,
+        text: str | None,
+        style: ParagraphStyle,
+        bulletText: str | None,
+        frags: list[ParaFrag] | None,
+        cleaner: Callable[[str], str],
+    ) -> None:
+        super()._setup(text, style, bulletText, frags, cleaner)
+        # NOTE: Inline images (e.g. emojis) share their image reader, the
+        #       parser creates one per occurrence that would be decoded at
+        #       every draw
+        for frag in self.frags:
+            cb_defn = getattr(frag, "cbDefn", None)
+            if getattr(cb_defn, "kind", None) == "img" and isinstance(
+                cb_defn.src, str
+            ):
+                cb_defn.image = shared_image_reader(cb_defn.src)
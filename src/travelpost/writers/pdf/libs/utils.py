@@ -1,6 +1,30 @@
 """Utils."""
 
+from collections.abc import Callable
 import datetime as dt
+from typing import Any
+
+
+class cached_classproperty[T]:
+    """Cached class property.
+
+    Computed on first access, once per class (subclasses compute their own
+    value, e.g. from an overridden style).
+    """
+
+    def __init__(self, fget: Callable[[type], T]) -> None:
+        self._fget = fget
+        self._values: dict[type, T] = {}
+        self.__doc__ = fget.__doc__
+
+    def __get__(self, obj: Any, cls: type | None = None) -> T:
+        if cls is None:
+            cls = type(obj)
+        try:
+            return self._values[cls]
+        except KeyError:
+            value = self._values[cls] = self._fget(cls)
+            return value
 
 
 def decimal_coo_to_dms(value: float, is_lat: bool, decimals: int = 0) -> str:
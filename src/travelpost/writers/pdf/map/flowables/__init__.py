@@ -0,0 +1,5 @@
+"""Map - Flowables."""
+
+from travelpost.writers.pdf.map.flowables.vector_map import VectorMapFlowable
+
+__all__ = ("VectorMapFlowable",)
@@ -0,0 +1,283 @@
+"""Vector Map."""
+
+import hashlib
+import io
+import logging
+import pathlib
+from typing import Literal
+
+from PIL import Image as PillowImage
+from reportlab.graphics.shapes import Drawing
+from reportlab.lib.colors import Color
+from reportlab.lib.utils import ImageReader
+from reportlab.pdfgen.canvas import Canvas
+from reportlab.pdfgen.pathobject import PDFPathObject
+
+from travelpost.utils.thumbnails.image import pil_image_thumbnail
+from travelpost.writers.map.raster import Marker
+from travelpost.writers.map.raster import RasterRenderer
+from travelpost.writers.map.raster import rgba
+from travelpost.writers.pdf.libs.fontawesome import fa_icon
+from travelpost.writers.pdf.libs.reportlab.libs import LineCap
+from travelpost.writers.pdf.libs.reportlab.libs import LineJoin
+from travelpost.writers.pdf.libs.reportlab.libs import svg_drawing
+from travelpost.writers.pdf.libs.reportlab.pdfgen import canvas_clip_path
+from travelpost.writers.pdf.libs.reportlab.pdfgen import canvas_form
+from travelpost.writers.pdf.libs.reportlab.pdfgen import canvas_path
+from travelpost.writers.pdf.libs.reportlab.pdfgen import canvas_state
+from travelpost.writers.pdf.libs.reportlab.platypus import Flowable
+
+logger = logging.getLogger(__name__)
+
+
+def _color(color: tuple[int, ...] | str | None) -> Color | None:
+    if isinstance(color, str):
+        color = rgba(color)
+    if color is None:
+        return None
+    r, g, b, a = color
+    return Color(r / 255, g / 255, b / 255, alpha=a / 255)
+
+
+class VectorMapFlowable(Flowable):
+    """Vector Map Flowable.
+
+    The tiles are embedded as a single background image, the route is drawn
+    as vector paths and the transport, start and final icons as PDF forms
+    (reused by every marker with the same icon & style). Layout and styles
+    follow the map renderer (see `Map.renderer`).
+
+    Object-fit:
+    - `'cover'`:   Scale to fill the frame completely and crop overflow.
+    - `'contain'`: Scale the map to fit in the frame and leave white space if
+                   necessary.
+    """
+
+    BACKGROUND_QUALITY: int = 90
+    """JPEG quality of the background image."""
+    DRAW_ON_LAYOUT: bool = False
+
+    def __init__(
+        self,
+        renderer: RasterRenderer,
+        fit: Literal["cover", "contain"] = "cover",
+    ) -> None:
+        self._renderer = renderer
+        self._fit = fit.lower()
+        self._map_width, self._map_height = renderer.size
+
+        # Encoded images, created once & reused by every build pass
+        self._background: bytes | None = None
+        self._thumbnails: dict[pathlib.Path, bytes] = {}
+
+        # Map pixel to canvas transformation (set on draw)
+        self._scale = 1.0
+        self._dx = 0.0
+        self._dy = 0.0
+
+        super().__init__(self._map_width, self._map_height)
+
+    def wrap(
+        self,
+        availWidth: float,
+        availHeight: float,
+    ) -> tuple[float, float]:
+        """This will be called by the enclosing frame before objects are asked
+        their size, drawn or whatever. It returns the size actually used."""
+        self.width = availWidth
+        self.height = availHeight
+        return (availWidth, availHeight)
+
+    def _x(self, x: float) -> float:
+        return self._dx + x * self._scale
+
+    def _y(self, y: float) -> float:
+        return self._dy + (self._map_height - y) * self._scale
+
+    def draw(self) -> None:
+        fn = max if self._fit == "cover" else min
+        self._scale = fn(
+            self.height / self._map_height, self.width / self._map_width
+        )
+        self._dx = (self.width - self._map_width * self._scale) / 2
+        self._dy = (self.height - self._map_height * self._scale) / 2
+
+        with canvas_state(self.canv) as c:
+            if self._fit == "cover":
+                with canvas_clip_path(c) as path:
+                    path.rect(0, 0, self.width, self.height)
+            self._draw_background(c)
+            self._draw_lines(c)
+            for marker in self._renderer.markers:
+                if marker.icon is not None:
+                    self._draw_fa_marker(c, marker)
+                else:
+                    self._draw_post_marker(c, marker)
+
+    @property
+    def background(self) -> bytes:
+        """The tiles as JPEG."""
+        if self._background is None:
+            with io.BytesIO() as img_io:
+                self._renderer.render_tiles().save(
+                    img_io, format="JPEG", quality=self.BACKGROUND_QUALITY
+                )
+                self._background = img_io.getvalue()
+        return self._background
+
+    def _thumbnail(self, marker: Marker) -> bytes:
+        """Returns the image of the post marker as JPEG."""
+        thumbnail = self._thumbnails.get(marker.image_path)
+        if thumbnail is None:
+            with (
+                PillowImage.open(marker.image_path) as img,
+                io.BytesIO() as img_io,
+            ):
+                # Reduced while decoded (JPEG draft), converted afterwards
+                pil_image_thumbnail(img, marker.size, fit="cover").convert(
+                    "RGB"
+                ).save(img_io, format="JPEG")
+                thumbnail = self._thumbnails[marker.image_path] = (
+                    img_io.getvalue()
+                )
+        return thumbnail
+
+    def _draw_background(self, canvas: Canvas) -> None:
+        with io.BytesIO(self.background) as img_io:
+            canvas.drawImage(
+                ImageReader(img_io),
+                self._x(0),
+                self._y(self._map_height),
+                width=self._map_width * self._scale,
+                height=self._map_height * self._scale,
+            )
+
+    def _draw_lines(self, canvas: Canvas) -> None:
+        canvas.setLineCap(LineCap.ROUND)
+        canvas.setLineJoin(LineJoin.ROUND)
+        for line in self._renderer.lines:
+            color = _color(line.color)
+            if color is None:
+                continue
+            with canvas_state(canvas) as c:
+                c.setStrokeColor(color)
+                c.setLineWidth(line.width * self._scale)
+                if line.dash_array is not None:
+                    c.setDash(
+                        [d * self._scale for d in line.dash_array],
+                        line.dash_offset * self._scale,
+                    )
+                with canvas_path(c) as path:
+                    (x0, y0), *xy = line.xy.tolist()
+                    path.moveTo(self._x(x0), self._y(y0))
+                    for x, y in xy:
+                        path.lineTo(self._x(x), self._y(y))
+
+    def _shape_path(
+        self,
+        path: PDFPathObject,
+        shape: str,
+        x: float,
+        y: float,
+        size: float,
+    ) -> None:
+        match shape:
+            case "circle":
+                path.circle(x + size / 2, y + size / 2, size / 2)
+            case "rounded-square":
+                path.roundRect(x, y, size, size, size / 4)
+            case "square":
+                path.rect(x, y, size, size)
+            case _:
+                msg = f"invalid icon shape: {shape!r:s}"
+                raise ValueError(msg)
+
+    def _marker_origin(self, marker: Marker) -> tuple[float, float]:
+        left, _, _, bottom = marker.box
+        return self._x(left), self._y(bottom + 1)
+
+    def _draw_shape(self, canvas: Canvas, marker: Marker) -> None:
+        options = marker.options
+        size = marker.size * self._scale
+        border_width = options["border_width"] * self._scale
+        fill = (
+            _color(marker.options["background_color"])
+            if marker.image_path is None
+            else None
+        )
+        stroke = _color(options["border_color"]) if border_width else None
+        if fill is None and stroke is None:
+            return
+
+        if fill is not None:
+            canvas.setFillColor(fill)
+        if stroke is not None:
+            canvas.setStrokeColor(stroke)
+            canvas.setLineWidth(border_width)
+        # CSS `box-sizing: border-box`, the border is inside the icon
+        inset = border_width / 2 if stroke is not None else 0.0
+        with canvas_path(
+            canvas, stroke=stroke is not None, fill=fill is not None
+        ) as path:
+            self._shape_path(
+                path,
+                options["icon_shape"],
+                inset,
+                inset,
+                size - 2 * inset,
+            )
+
+    def _draw_glyph(self, canvas: Canvas, marker: Marker) -> None:
+        try:
+            svg_path = fa_icon(marker.icon).svg_paths["solid"]
+        except (KeyError, ValueError) as e:
+            logger.warning("No svg of icon %r: %s", marker.icon, e)
+            return
+        color = _color(marker.options["color"])
+        drawing: Drawing | None = svg_drawing(
+            svg_path, color_converter=lambda c: color
+        )
+        if drawing is None or drawing.width == 0 or drawing.height == 0:
+            logger.warning("Could not process svg of icon %r", marker.icon)
+            return
+
+        size = marker.size * self._scale
+        font_size = marker.options["font_size"] * self._scale
+        drawing.renderScale = min(
+            font_size / drawing.height, font_size / drawing.width
+        )
+        drawing.drawOn(
+            canvas,
+            (size - drawing.width * drawing.renderScale) / 2,
+            (size - drawing.height * drawing.renderScale) / 2,
+        )
+
+    def _draw_fa_marker(self, canvas: Canvas, marker: Marker) -> None:
+        key = repr((marker.icon, sorted(marker.options.items()), self._scale))
+        digest = hashlib.sha1(key.encode("utf-8")).hexdigest()[:16]
+
+        def draw(c: Canvas) -> None:
+            self._draw_shape(c, marker)
+            self._draw_glyph(c, marker)
+
+        canvas_form(
+            canvas,
+            f"map_icon_{marker.icon:s}_{digest:s}",
+            *self._marker_origin(marker),
+            draw,
+        )
+
+    def _draw_post_marker(self, canvas: Canvas, marker: Marker) -> None:
+        x, y = self._marker_origin(marker)
+        size = marker.size * self._scale
+        with canvas_state(canvas) as c:
+            c.translate(x, y)
+            if marker.image_path is not None:
+                with canvas_state(c):
+                    with canvas_clip_path(c) as path:
+                        self._shape_path(
+                            path, marker.options["icon_shape"], 0, 0, size
+                        )
+                    with io.BytesIO(self._thumbnail(marker)) as img_io:
+                        c.drawImage(ImageReader(img_io), 0, 0, size, size)
+            self._draw_shape(c, marker)
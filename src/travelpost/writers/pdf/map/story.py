@@ -8,21 +8,34 @@ from reportlab.platypus import FrameBreak
 from reportlab.platypus import NextPageTemplate
 from reportlab.platypus import PageBreak
 
+from travelpost.writers.map.raster import RasterRenderer
 from travelpost.writers.pdf.blank import blank_flowables
 from travelpost.writers.pdf.libs.reportlab.platypus import ImageFlowable
 from travelpost.writers.pdf.libs.reportlab.platypus.toc_entry import TOCEntry
+from travelpost.writers.pdf.map.flowables import VectorMapFlowable
 from travelpost.writers.pdf.map.page_templates import MapPage
 
 
 def map_flowables(
-    map_path: pathlib.Path,
+    map_: pathlib.Path | RasterRenderer,
     title: str = "Map",
 ) -> tuple[Flowable]:
+    """Returns the flowables of the map page.
+
+    Args:
+        map_: The map image or the renderer of the map (drawn as vector map
+            over the tiles).
+        title: The title (table of contents).
+    """
     return (
         NextPageTemplate(MapPage.id),
         PageBreak(),
         FrameBreak(ix=MapPage.map_frame_id),
         TOCEntry(title, "map", outline_entry=True, toc_entry=True),
-        ImageFlowable(map_path, fit="cover"),
+        (
+            VectorMapFlowable(map_, fit="cover")
+            if isinstance(map_, RasterRenderer)
+            else ImageFlowable(map_, fit="cover")
+        ),
         DocIf("doc.page % 2 == 0", blank_flowables(include_page_label=True)),
     )
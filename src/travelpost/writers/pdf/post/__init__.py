@@ -1,9 +1,17 @@
 """Post."""
 
+from travelpost.writers.pdf.post.page_templates.text_image import PostPhotoPage
 from travelpost.writers.pdf.post.page_templates.text_image import (
     PostStartTextPage,
 )
+from travelpost.writers.pdf.post.story import PostSpec
 from travelpost.writers.pdf.post.story import post_flowables
 from travelpost.writers.pdf.post.story import reset_doc_vars
 
-__all__ = ("PostStartTextPage", "post_flowables", "reset_doc_vars")
+__all__ = (
+    "PostPhotoPage",
+    "PostSpec",
+    "PostStartTextPage",
+    "post_flowables",
+    "reset_doc_vars",
+)
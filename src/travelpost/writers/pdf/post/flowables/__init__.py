@@ -2,12 +2,16 @@
 
 from travelpost.writers.pdf.post.flowables.country_flag import CountryFlag
 from travelpost.writers.pdf.post.flowables.country_shape import CountryShape
+from travelpost.writers.pdf.post.flowables.photo_grid import PhotoGrid
+from travelpost.writers.pdf.post.flowables.post_map import PostMap
 from travelpost.writers.pdf.post.flowables.progress_bar import ProgressBar
 from travelpost.writers.pdf.post.flowables.stats import PostStats
 
 __all__ = (
     "CountryFlag",
     "CountryShape",
+    "PhotoGrid",
+    "PostMap",
     "PostStats",
     "ProgressBar",
 )
@@ -4,14 +4,13 @@ from typing import Literal
 
 from travelpost.writers.pdf.flowables.flag import Flag
 from travelpost.writers.pdf.libs.reportlab.pdfgen import canvas_style
-from travelpost.writers.pdf.libs.reportlab.platypus import ParagraphStyle
-from travelpost.writers.pdf.styles import get_style
+from travelpost.writers.pdf.styles import class_style
 
 
 class CountryFlag(Flag):
     """Country Flag."""
 
-    STYLE: ParagraphStyle = get_style("post_country_flag")
+    STYLE = class_style("post_country_flag")
 
     def __init__(
         self,
@@ -5,29 +5,33 @@ import warnings
 from reportlab.graphics.shapes import Drawing
 from reportlab.lib.colors import gray
 from reportlab.pdfgen.canvas import Canvas
-from svglib.svglib import svg2rlg
 
 from travelpost.writers.pdf.flowables.texts import AltitudeTextFlowable
 from travelpost.writers.pdf.flowables.texts import LatitudeTextFlowable
 from travelpost.writers.pdf.flowables.texts import LongitudeTextFlowable
 from travelpost.writers.pdf.libs import country_shapes
 from travelpost.writers.pdf.libs.reportlab.libs import TextAlignment
+from travelpost.writers.pdf.libs.reportlab.libs import svg_drawing
 from travelpost.writers.pdf.libs.reportlab.libs import update_drawing_attributes
 from travelpost.writers.pdf.libs.reportlab.pdfgen import canvas_form
 from travelpost.writers.pdf.libs.reportlab.pdfgen import canvas_path
 from travelpost.writers.pdf.libs.reportlab.pdfgen import canvas_state
 from travelpost.writers.pdf.libs.reportlab.platypus import Flowable
-from travelpost.writers.pdf.libs.reportlab.platypus import ParagraphStyle
-from travelpost.writers.pdf.styles import get_style
+from travelpost.writers.pdf.libs.utils import cached_classproperty
+from travelpost.writers.pdf.styles import class_style
 
 
 class CountryShape(Flowable):
     """Country Shape."""
 
     ALT_SYMBOL_RATIO: float = 0.5
-    STYLE: ParagraphStyle = get_style("post_country_shape")
-    TEXT_STYLE: ParagraphStyle = get_style("post_country_shape_text")
-    HEIGHT: float = STYLE.height
+    DRAW_ON_LAYOUT: bool = False
+    STYLE = class_style("post_country_shape")
+    TEXT_STYLE = class_style("post_country_shape_text")
+
+    @cached_classproperty
+    def HEIGHT(cls) -> float:
+        return cls.STYLE.height
 
     def __init__(
         self,
@@ -178,7 +182,7 @@ class CountryShape(Flowable):
         warnings.warn(msg, stacklevel=1)
 
     def _draw_shape(self, canvas: Canvas) -> None:
-        drawing: Drawing | None = svg2rlg(self._shape.path)
+        drawing: Drawing | None = svg_drawing(self._shape.path)
         if drawing is None:
             msg = f"could not process country shape of {self._shape.name!r:s}"
             raise ValueError(msg)
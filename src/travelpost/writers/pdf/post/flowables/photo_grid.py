@@ -0,0 +1,197 @@
+"""Photo Grid."""
+
+from collections.abc import Sequence
+import pathlib
+from typing import NamedTuple
+
+from reportlab.rl_config import _FUZZ
+
+from travelpost.writers.pdf.libs.reportlab.libs import image_cache
+from travelpost.writers.pdf.libs.reportlab.platypus import Flowable
+from travelpost.writers.pdf.libs.reportlab.platypus import ImageFlowable
+from travelpost.writers.pdf.styles import class_style
+
+
+class Row(NamedTuple):
+    """Row of a photo grid: the photos `[start, end)` scaled to `height`."""
+
+    start: int
+    end: int
+    height: float
+
+
+def justify_rows(
+    aspect_ratios: Sequence[float],
+    width: float,
+    height: float,
+    gap: float = 0.0,
+    max_height: float | None = None,
+) -> tuple[Row, ...]:
+    """Returns the rows of a justified layout: each row is scaled to fill the
+    width, its height as close as possible to the target height.
+
+    The rows are filled greedily, so the layout of the photos from any row on
+    is the same as of all photos.
+
+    Args:
+        aspect_ratios: The aspect ratios (width / height) of the photos.
+        width: The width of the rows.
+        height: The target height of the rows.
+        gap: The gap between the photos of a row.
+        max_height: The maximum height of a row (e.g. of a single portrait
+            photo), narrower rows are centered. Defaults to `None`.
+
+    Returns:
+        The rows, the last row is not scaled above the target height.
+    """
+    rows = []
+    start = 0
+    while start < len(aspect_ratios):
+        end, total = start, 0.0
+        while end < len(aspect_ratios):
+            total += aspect_ratios[end]
+            end += 1
+            row_height = (width - gap * (end - start - 1)) / total
+            if row_height <= height:
+                break
+        else:
+            rows.append(Row(start, end, min(row_height, height)))
+            break
+
+        # Closes the row before the last photo if its height is closer to the
+        # target height
+        if end - start > 1:
+            prev_height = (width - gap * (end - start - 2)) / (
+                total - aspect_ratios[end - 1]
+            )
+            if prev_height - height < height - row_height:
+                end, row_height = end - 1, prev_height
+        if max_height is not None:
+            row_height = min(row_height, max_height)
+        rows.append(Row(start, end, row_height))
+        start = end
+    return tuple(rows)
+
+
+class PhotoGrid(Flowable):
+    """Photo Grid.
+
+    The photos are laid out in justified rows (see `justify_rows`), their
+    aspect ratios read once from the image headers (see `ImageCache.info`).
+    The photos are only decoded when drawn and resampled to their cells (see
+    `ImageFlowable`, at `DPI` unless the doc template sets `image_dpi`). The
+    grid splits between rows onto the next frames.
+    """
+
+    DRAW_ON_LAYOUT: bool = False
+    DPI: float = 300.0
+    STYLE = class_style("post_photo_grid")
+
+    def __init__(
+        self,
+        photos: Sequence[pathlib.Path | str],
+        _aspect_ratios: Sequence[float] | None = None,
+        _layout: tuple[float, tuple[Row, ...]] | None = None,
+    ) -> None:
+        """Initializes the photo grid.
+
+        Args:
+            photos: The photos.
+        """
+        self._photos = tuple(pathlib.Path(p) for p in photos)
+        if _aspect_ratios is None:
+            _aspect_ratios = tuple(
+                info[0] / info[1]
+                for info in map(image_cache.info, self._photos)
+            )
+        self._aspect_ratios = tuple(_aspect_ratios)
+        # The rows by width
+        self._layout = _layout
+
+        super().__init__(0.0, 0.0, style=self.STYLE)
+
+    def _rows(self, width: float) -> tuple[Row, ...]:
+        if self._layout is None or abs(self._layout[0] - width) > _FUZZ:
+            self._layout = (
+                width,
+                justify_rows(
+                    self._aspect_ratios,
+                    width,
+                    self.style.height,
+                    gap=self.style.gap,
+                    max_height=self.style.maxHeight,
+                ),
+            )
+        return self._layout[1]
+
+    def _height(self, rows: Sequence[Row]) -> float:
+        return sum(r.height for r in rows) + self.style.gap * max(
+            0, len(rows) - 1
+        )
+
+    def wrap(
+        self,
+        availWidth: float,
+        availHeight: float,
+    ) -> tuple[float, float]:
+        self.width = availWidth
+        self.height = self._height(self._rows(availWidth))
+        return (self.width, self.height)
+
+    def split(
+        self,
+        availWidth: float,
+        availHeight: float,
+    ) -> list[Flowable]:
+        rows = self._rows(availWidth)
+        count = 0
+        while (
+            count < len(rows)
+            and self._height(rows[: count + 1]) <= availHeight + _FUZZ
+        ):
+            count += 1
+        if count == 0 or count == len(rows):
+            return [] if count == 0 else [self]
+
+        end = rows[count - 1].end
+        return [
+            PhotoGrid(
+                self._photos[:end],
+                _aspect_ratios=self._aspect_ratios[:end],
+                _layout=(availWidth, rows[:count]),
+            ),
+            PhotoGrid(
+                self._photos[end:],
+                _aspect_ratios=self._aspect_ratios[end:],
+                _layout=(
+                    availWidth,
+                    tuple(
+                        Row(r.start - end, r.end - end, r.height)
+                        for r in rows[count:]
+                    ),
+                ),
+            ),
+        ]
+
+    def draw(self) -> None:
+        dpi = self._doctemplateAttr("image_dpi") or self.DPI
+        y = self.height
+        for row in self._rows(self.width):
+            y -= row.height
+            widths = [
+                self._aspect_ratios[i] * row.height
+                for i in range(row.start, row.end)
+            ]
+            row_width = sum(widths) + self.style.gap * (len(widths) - 1)
+            x = max(0.0, (self.width - row_width) / 2)
+            for i, width in zip(range(row.start, row.end), widths, strict=True):
+                photo = ImageFlowable(
+                    self._photos[i],
+                    fit="cover",
+                    radius=self.style.radius,
+                    dpi=dpi,
+                )
+                photo.wrapOn(self.canv, width, row.height)
+                photo.drawOn(self.canv, x, y)
+                x += width + self.style.gap
+            y -= self.style.gap
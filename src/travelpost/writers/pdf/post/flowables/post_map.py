@@ -0,0 +1,32 @@
+"""Post Map."""
+
+import pathlib
+
+from travelpost.writers.pdf.libs.reportlab.platypus import ImageFlowable
+from travelpost.writers.pdf.libs.utils import cached_classproperty
+from travelpost.writers.pdf.styles import class_style
+
+
+class PostMap(ImageFlowable):
+    """Post Map (inset map, see `render_mini_maps`)."""
+
+    STYLE = class_style("post_map")
+
+    @cached_classproperty
+    def HEIGHT(cls) -> float:
+        return cls.STYLE.height
+
+    def __init__(self, filename: str | pathlib.Path) -> None:
+        super().__init__(filename, fit="cover", radius=self.STYLE.radius)
+        self.style = self.STYLE
+
+    def wrap(
+        self,
+        availWidth: float,
+        availHeight: float,
+    ) -> tuple[float, float]:
+        """This will be called by the enclosing frame before objects are asked
+        their size, drawn or whatever. It returns the size actually used."""
+        self.width = availWidth
+        self.height = min(availHeight, self.HEIGHT)
+        return (self.width, self.height)
@@ -3,17 +3,22 @@
 from travelpost.writers.pdf.libs.reportlab.pdfgen import canvas_path
 from travelpost.writers.pdf.libs.reportlab.pdfgen import canvas_state
 from travelpost.writers.pdf.libs.reportlab.platypus import Flowable
-from travelpost.writers.pdf.libs.reportlab.platypus import ParagraphStyle
-from travelpost.writers.pdf.styles import get_style
+from travelpost.writers.pdf.libs.utils import cached_classproperty
+from travelpost.writers.pdf.styles import class_style
 
 
 class ProgressBar(Flowable):
     """Progress Bar."""
 
-    STYLE: ParagraphStyle = get_style("post_progress_bar")
-    HEIGHT: float = (
-        STYLE.textPadding.top + STYLE.eff_font_size + STYLE.textPadding.bottom
-    )
+    STYLE = class_style("post_progress_bar")
+
+    @cached_classproperty
+    def HEIGHT(cls) -> float:
+        return (
+            cls.STYLE.textPadding.top
+            + cls.STYLE.eff_font_size
+            + cls.STYLE.textPadding.bottom
+        )
 
     def __init__(
         self,
@@ -8,6 +8,7 @@ from travelpost.writers.pdf.flowables.paragraphs import PostStatsHeader
 from travelpost.writers.pdf.flowables.paragraphs import PostStatsMain
 from travelpost.writers.pdf.libs.reportlab.platypus import Flowable
 from travelpost.writers.pdf.libs.reportlab.platypus import tables
+from travelpost.writers.pdf.libs.utils import cached_classproperty
 from travelpost.writers.pdf.styles import get_style
 from travelpost.writers.pdf.table_styles import get_table_style
 
@@ -71,14 +72,16 @@ def weather_stat(condition: str, temperature: float) -> Stat:
 class PostStats(_StatsTable):
     """Post Stats."""
 
-    height: float = (
-        get_style("post_stats_header").fontSize
-        + max(
-            get_style("post_stats_header").spaceAfter,
-            get_style("post_stats_main").spaceBefore,
+    @cached_classproperty
+    def height(cls) -> float:
+        return (
+            get_style("post_stats_header").fontSize
+            + max(
+                get_style("post_stats_header").spaceAfter,
+                get_style("post_stats_main").spaceBefore,
+            )
+            + get_style("post_stats_main").fontSize
         )
-        + get_style("post_stats_main").fontSize
-    )
 
     def __init__(
         self,
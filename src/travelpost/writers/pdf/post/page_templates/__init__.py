@@ -1,7 +1,8 @@
 """Post - Page Templates."""
 
+from travelpost.writers.pdf.post.page_templates.text_image import PostPhotoPage
 from travelpost.writers.pdf.post.page_templates.text_image import (
     PostStartTextPage,
 )
 
-__all__ = ("PostStartTextPage",)
+__all__ = ("PostPhotoPage", "PostStartTextPage")
@@ -38,3 +38,22 @@ class PostStartTextPage(PageGapTemplateABC, HeaderMixin, FooterMixin):
                 h,
             ),
         ]
+
+
+class PostPhotoPage(PageGapTemplateABC, HeaderMixin, FooterMixin):
+    """Post - Photo Page (single frame, continued on the next pages)."""
+
+    id: ClassVar[str] = "post_photo_page"
+
+    photo_frame_id: ClassVar[str] = "photo_frame"
+
+    def _create_frames(self) -> list[Frame]:
+        return [
+            Frame(
+                self.photo_frame_id,
+                self.margin.left,
+                self.margin.bottom,
+                self.content_width,
+                self.content_height,
+            ),
+        ]
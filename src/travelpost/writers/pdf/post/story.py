@@ -1,6 +1,9 @@
 """Post - Story."""
 
+from collections.abc import Sequence
+import dataclasses
 import datetime as dt
+import pathlib
 
 from reportlab.platypus import DocAssign
 from reportlab.platypus import DocExec
@@ -10,19 +13,43 @@ from reportlab.platypus import PageBreak
 from travelpost.writers.pdf.flowables.paragraphs import Body
 from travelpost.writers.pdf.flowables.paragraphs import H2
 from travelpost.writers.pdf.flowables.paragraphs import H3
+from travelpost.writers.pdf.libs.emoji import replace_emoji
 from travelpost.writers.pdf.libs.reportlab.platypus import Flowable
 from travelpost.writers.pdf.libs.reportlab.platypus import FrameBreak
 from travelpost.writers.pdf.libs.reportlab.platypus import TOCEntry
 from travelpost.writers.pdf.libs.reportlab.platypus import VarLifetime
 from travelpost.writers.pdf.post.flowables import CountryFlag
 from travelpost.writers.pdf.post.flowables import CountryShape
+from travelpost.writers.pdf.post.flowables import PhotoGrid
+from travelpost.writers.pdf.post.flowables import PostMap
 from travelpost.writers.pdf.post.flowables import PostStats
 from travelpost.writers.pdf.post.flowables import ProgressBar
+from travelpost.writers.pdf.post.page_templates.text_image import PostPhotoPage
 from travelpost.writers.pdf.post.page_templates.text_image import (
     PostStartTextPage,
 )
 
 
+@dataclasses.dataclass(frozen=True, kw_only=True)
+class PostSpec:
+    """Post Specification (see `post_flowables`)."""
+
+    datetime: dt.datetime
+    start_date: dt.date
+    end_date: dt.date
+    location: tuple[float, float] | tuple[float, float, float]
+    country_code: str
+    title: str
+    subtitle: str | None = None
+    text: str | None = None
+    images: Sequence[pathlib.Path] = ()
+    """The photos of the post, laid out on photo pages (see `PhotoGrid`)."""
+    weather_condition: str | None = None
+    weather_temperature: float | None = None
+    map_path: pathlib.Path | None = None
+    """The inset map of the post (see `render_mini_maps`)."""
+
+
 def post_flowables(
     datetime: dt.datetime,
     start_date: dt.date,
@@ -33,8 +60,10 @@ def post_flowables(
     progress_bar_label: str = "Day",
     subtitle: str | None = None,
     text: str | None = None,
+    images: Sequence[pathlib.Path] = (),
     weather_condition: str | None = None,
     weather_temperature: float | None = None,
+    map_path: pathlib.Path | None = None,
 ) -> tuple[Flowable]:
     total_days = (end_date - start_date).days + 1
     day = (datetime.date() - start_date).days + 1
@@ -67,9 +96,21 @@ def post_flowables(
             datetime_fmt="date time",
         ),
     )
+    if map_path is not None:
+        flows.append(PostMap(map_path))
     if text is not None:
         for t in text.strip().split("\n"):
-            flows.append(Body(t.strip()))
+            flows.append(
+                Body(replace_emoji(t.strip(), font_size=Body.STYLE.fontSize))
+            )
+    if images:
+        flows.extend(
+            (
+                NextPageTemplate(PostPhotoPage.id),
+                PageBreak(),
+                PhotoGrid(images),
+            )
+        )
     return tuple(flows)
 
 
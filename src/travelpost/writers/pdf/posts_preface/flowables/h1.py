@@ -2,15 +2,18 @@
 
 from travelpost.writers.pdf.libs.reportlab.pdfgen import canvas_style
 from travelpost.writers.pdf.libs.reportlab.platypus import Flowable
-from travelpost.writers.pdf.libs.reportlab.platypus import ParagraphStyle
-from travelpost.writers.pdf.styles import get_style
+from travelpost.writers.pdf.libs.utils import cached_classproperty
+from travelpost.writers.pdf.styles import class_style
 
 
 class PostsPrefaceH1(Flowable):
     """Posts Preface H1."""
 
-    STYLE: ParagraphStyle = get_style("posts_preface_h1")
-    HEIGHT: float = STYLE.eff_font_size
+    STYLE = class_style("posts_preface_h1")
+
+    @cached_classproperty
+    def HEIGHT(cls) -> float:
+        return cls.STYLE.eff_font_size
 
     # NOTE: Aligns itself vertically on the page template
     def __init__(self, text: str) -> None:
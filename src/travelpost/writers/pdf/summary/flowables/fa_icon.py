@@ -2,25 +2,25 @@
 
 from reportlab.graphics.shapes import Drawing
 from reportlab.pdfgen.canvas import Canvas
-from svglib.svglib import svg2rlg
 
 from travelpost.writers.pdf.libs.fontawesome import fa_icon
+from travelpost.writers.pdf.libs.reportlab.libs import svg_drawing
 from travelpost.writers.pdf.libs.reportlab.pdfgen import canvas_form
 from travelpost.writers.pdf.libs.reportlab.pdfgen import canvas_state
 from travelpost.writers.pdf.libs.reportlab.platypus import Flowable
-from travelpost.writers.pdf.libs.reportlab.platypus import ParagraphStyle
-from travelpost.writers.pdf.styles import get_style
+from travelpost.writers.pdf.libs.utils import cached_classproperty
+from travelpost.writers.pdf.styles import class_style
 
 
 class FAIconFlowable(Flowable):
     """Font Awesome Icon Flowable."""
 
-    STYLE: ParagraphStyle = get_style("fa_icon")
-    HEIGHT: float = STYLE.eff_font_size
+    DRAW_ON_LAYOUT: bool = False
+    STYLE = class_style("fa_icon")
 
-    def __init_subclass__(cls) -> None:
-        super().__init_subclass__()
-        cls.HEIGHT = cls.STYLE.eff_font_size
+    @cached_classproperty
+    def HEIGHT(cls) -> float:
+        return cls.STYLE.eff_font_size
 
     def __init__(
         self,
@@ -87,7 +87,7 @@ class FAIconFlowable(Flowable):
             )
 
     def _draw_icon(self, canvas: Canvas) -> None:
-        drawing: Drawing | None = svg2rlg(
+        drawing: Drawing | None = svg_drawing(
             self._svg_path,
             color_converter=lambda c: self.style.textColor,
         )
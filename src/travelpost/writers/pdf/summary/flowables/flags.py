@@ -7,22 +7,21 @@ from reportlab.platypus import Flowable
 from reportlab.rl_config import _FUZZ
 
 from travelpost.writers.pdf.flowables.flag import Flag
-from travelpost.writers.pdf.libs.reportlab.platypus import ParagraphStyle
 from travelpost.writers.pdf.libs.reportlab.platypus import tables
-from travelpost.writers.pdf.styles import get_style
-from travelpost.writers.pdf.table_styles import get_table_style
+from travelpost.writers.pdf.styles import class_style
+from travelpost.writers.pdf.table_styles import class_table_style
 
 
 class SummaryFlag(Flag):
     """Summary Flag."""
 
-    STYLE: ParagraphStyle = get_style("summary_flag")
+    STYLE = class_style("summary_flag")
 
 
 class SummaryFlags(tables.Table):
     """Summary Flags Table."""
 
-    TABLE_STYLE: tables.TableStyle = get_table_style("summary_flags")
+    TABLE_STYLE = class_table_style("summary_flags")
     _split_count: int = 0
 
     def __init__(
@@ -5,15 +5,15 @@ import pathlib
 from reportlab.graphics.shapes import Drawing
 from reportlab.lib.colors import Color
 from reportlab.pdfgen.canvas import Canvas
-from svglib.svglib import svg2rlg
 
 from travelpost.writers.pdf.flowables.texts import AltitudeTextFlowable
+from travelpost.writers.pdf.libs.reportlab.libs import svg_drawing
 from travelpost.writers.pdf.libs.reportlab.libs import to_color
 from travelpost.writers.pdf.libs.reportlab.libs import update_drawing_attributes
 from travelpost.writers.pdf.libs.reportlab.pdfgen import canvas_state
 from travelpost.writers.pdf.libs.reportlab.platypus import Flowable
-from travelpost.writers.pdf.libs.reportlab.platypus import ParagraphStyle
-from travelpost.writers.pdf.styles import get_style
+from travelpost.writers.pdf.libs.utils import cached_classproperty
+from travelpost.writers.pdf.styles import class_style
 
 
 class SummaryPeakIcon(Flowable):
@@ -25,8 +25,11 @@ class SummaryPeakIcon(Flowable):
         text.
     """
 
-    STYLE: ParagraphStyle = get_style("summary_peak_icon")
-    HEIGHT: float = STYLE.eff_font_size
+    STYLE = class_style("summary_peak_icon")
+
+    @cached_classproperty
+    def HEIGHT(cls) -> float:
+        return cls.STYLE.eff_font_size
 
     def __init__(self, number: int) -> None:
         """Initializes the summary peak icon.
@@ -93,8 +96,9 @@ class SummaryPeakIcon(Flowable):
 class SummaryPeakDiagram(Flowable):
     """Summary Peak Diagram."""
 
-    STYLE: ParagraphStyle = get_style("summary_peak_diagram")
-    TEXTSTYLE: ParagraphStyle = get_style("summary_peak_text")
+    DRAW_ON_LAYOUT: bool = False
+    STYLE = class_style("summary_peak_diagram")
+    TEXTSTYLE = class_style("summary_peak_text")
 
     PATH: pathlib.Path = pathlib.Path(__file__).with_suffix(".svg")
 
@@ -123,7 +127,7 @@ class SummaryPeakDiagram(Flowable):
             sorted(peaks.items(), key=lambda x: x[1], reverse=True)
         )
         self.style = self.STYLE
-        self._drawing: Drawing | None = svg2rlg(
+        self._drawing: Drawing | None = svg_drawing(
             self.PATH, color_converter=self._convert_colors
         )
         if self._drawing is None:
@@ -10,8 +10,9 @@ from reportlab.rl_config import _FUZZ
 from travelpost.writers.pdf.flowables.paragraphs import SummaryStatsFooter
 from travelpost.writers.pdf.flowables.paragraphs import SummaryStatsMain
 from travelpost.writers.pdf.libs.reportlab.platypus import Flowable
-from travelpost.writers.pdf.libs.reportlab.platypus import ParagraphStyle
 from travelpost.writers.pdf.libs.reportlab.platypus import tables
+from travelpost.writers.pdf.libs.utils import cached_classproperty
+from travelpost.writers.pdf.styles import class_style
 from travelpost.writers.pdf.styles import get_style
 from travelpost.writers.pdf.summary.flowables.fa_icon import FAIconFlowable
 from travelpost.writers.pdf.table_styles import get_table_style
@@ -22,7 +23,7 @@ Stat = Sequence[Flowable]
 class SummaryStatsIcon(FAIconFlowable):
     """Summary Stats Icon."""
 
-    STYLE: ParagraphStyle = get_style("summary_stats_icon")
+    STYLE = class_style("summary_stats_icon")
 
 
 class _StatsTable(tables.Table):
@@ -164,20 +165,22 @@ def post_count_stat(post_count: int) -> Stat:
 class SummaryStats(_StatsTable):
     """Summary Stats."""
 
-    HEIGHT: float = (
-        get_style("summary_stats_icon").spaceBefore
-        + get_style("summary_stats_icon").fontSize
-        + max(
-            get_style("summary_stats_icon").spaceAfter,
-            get_style("summary_stats_main").spaceBefore,
+    @cached_classproperty
+    def HEIGHT(cls) -> float:
+        return (
+            get_style("summary_stats_icon").spaceBefore
+            + get_style("summary_stats_icon").fontSize
+            + max(
+                get_style("summary_stats_icon").spaceAfter,
+                get_style("summary_stats_main").spaceBefore,
+            )
+            + get_style("summary_stats_main").fontSize
+            + max(
+                get_style("summary_stats_main").spaceAfter,
+                get_style("summary_stats_footer").spaceBefore,
+            )
+            + get_style("summary_stats_footer").fontSize
         )
-        + get_style("summary_stats_main").fontSize
-        + max(
-            get_style("summary_stats_main").spaceAfter,
-            get_style("summary_stats_footer").spaceBefore,
-        )
-        + get_style("summary_stats_footer").fontSize
-    )
 
     def __init__(
         self,
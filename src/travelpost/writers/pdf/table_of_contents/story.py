@@ -7,6 +7,7 @@ from reportlab.platypus import FrameBreak
 from reportlab.platypus import NextPageTemplate
 from reportlab.platypus import PageBreak
 
+from travelpost.writers.pdf import styles
 from travelpost.writers.pdf.blank import blank_flowables
 from travelpost.writers.pdf.flowables.paragraphs import H1
 from travelpost.writers.pdf.libs.reportlab.platypus import TOCEntry
@@ -23,7 +24,6 @@ from travelpost.writers.pdf.libs.reportlab.platypus.page_label import (
 from travelpost.writers.pdf.libs.reportlab.platypus.page_label import (
     TableOfContents,
 )
-from travelpost.writers.pdf.styles import TOC_LEVEL_STYLES
 from travelpost.writers.pdf.table_of_contents.page_templates import (
     TOCDoublePage,
 )
@@ -65,7 +65,7 @@ def toc_flowables(
         (
             TableOfContents(
                 dots_min_level=-1,
-                level_styles=TOC_LEVEL_STYLES,
+                level_styles=styles.TOC_LEVEL_STYLES,
                 table_style=get_table_style("toc"),
             ),
             DocIf(
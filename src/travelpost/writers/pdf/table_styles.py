@@ -1,102 +1,130 @@
 """Table Styles."""
 
+import functools
+from typing import Any
+
 from travelpost.writers.pdf.libs.reportlab.libs import StyleSheet
 from travelpost.writers.pdf.libs.reportlab.libs import to_color
 from travelpost.writers.pdf.libs.reportlab.platypus import tables
 from travelpost.writers.pdf.libs.reportlab.settings import SHOW_BOUNDARY
+from travelpost.writers.pdf.libs.utils import cached_classproperty
 from travelpost.writers.pdf.styles import BASE_FONTNAME
 from travelpost.writers.pdf.styles import BASE_FONTSIZE
 from travelpost.writers.pdf.styles import rem
 
-TABLE_STYLES = StyleSheet[tables.TableStyle]()
-TABLE_STYLES.add(
-    tables.TableStyle(
-        "default",
-        cmds=[
-            tables.table_style_cmd("fontName", BASE_FONTNAME),
-            tables.table_style_cmd("fontSize", BASE_FONTSIZE),
-            tables.table_style_cmd("leading", BASE_FONTSIZE * 1.5),
-            tables.table_style_cmd("alignment", "LEFT"),
-            tables.table_style_cmd("leftPadding", 0),
-            tables.table_style_cmd("rightPadding", 0),
-            tables.table_style_cmd("topPadding", 0),
-            tables.table_style_cmd("bottomPadding", 0),
-            tables.table_style_cmd("valign", "BOTTOM"),
-        ],
-    )
-)
-if SHOW_BOUNDARY:
-    TABLE_STYLES["default"].add(
-        tables.table_style_cmd("grid", 1, to_color("grey"))
+# Created on first access (see `__getattr__`)
+TABLE_STYLES: StyleSheet[tables.TableStyle]
+
+
+@functools.cache
+def _create_table_stylesheet() -> StyleSheet[tables.TableStyle]:
+    stylesheet = StyleSheet[tables.TableStyle]()
+    stylesheet.add(
+        tables.TableStyle(
+            "default",
+            cmds=[
+                tables.table_style_cmd("fontName", BASE_FONTNAME),
+                tables.table_style_cmd("fontSize", BASE_FONTSIZE),
+                tables.table_style_cmd("leading", BASE_FONTSIZE * 1.5),
+                tables.table_style_cmd("alignment", "LEFT"),
+                tables.table_style_cmd("leftPadding", 0),
+                tables.table_style_cmd("rightPadding", 0),
+                tables.table_style_cmd("topPadding", 0),
+                tables.table_style_cmd("bottomPadding", 0),
+                tables.table_style_cmd("valign", "BOTTOM"),
+            ],
+        )
     )
-TABLE_STYLES.DEFAULT = TABLE_STYLES["default"]
-
-TABLE_STYLES.add(
-    tables.TableStyle(
-        "toc",
-        parent=TABLE_STYLES["default"],
-        cmds=[
-            tables.table_style_cmd("valign", "TOP"),
-        ],
+    if SHOW_BOUNDARY:
+        stylesheet["default"].add(
+            tables.table_style_cmd("grid", 1, to_color("grey"))
+        )
+    stylesheet.DEFAULT = stylesheet["default"]
+
+    stylesheet.add(
+        tables.TableStyle(
+            "toc",
+            parent=stylesheet["default"],
+            cmds=[
+                tables.table_style_cmd("valign", "TOP"),
+            ],
+        )
     )
-)
-
-TABLE_STYLES.add(
-    tables.TableStyle(
-        "summary_flags",
-        parent=TABLE_STYLES["default"],
-        cmds=[
-            tables.table_style_cmd("alignment", "CENTER"),
-            tables.table_style_cmd("valign", "MIDDLE"),
-            tables.table_style_cmd("rightpadding", 0.25 * rem),
-            tables.table_style_cmd("leftpadding", 0.25 * rem),
-        ],
-        spaceBefore=1.5 * rem * 0.2,
-        spaceAfter=1.25 * rem * 0.45,
+
+    stylesheet.add(
+        tables.TableStyle(
+            "summary_flags",
+            parent=stylesheet["default"],
+            cmds=[
+                tables.table_style_cmd("alignment", "CENTER"),
+                tables.table_style_cmd("valign", "MIDDLE"),
+                tables.table_style_cmd("rightpadding", 0.25 * rem),
+                tables.table_style_cmd("leftpadding", 0.25 * rem),
+            ],
+            spaceBefore=1.5 * rem * 0.2,
+            spaceAfter=1.25 * rem * 0.45,
+        )
     )
-)
-
-TABLE_STYLES.add(
-    tables.TableStyle(
-        "summary_stats",
-        parent=TABLE_STYLES["default"],
-        cmds=[
-            tables.table_style_cmd("alignment", "CENTER"),
-            tables.table_style_cmd("valign", "MIDDLE"),
-            tables.table_style_cmd("rightpadding", 0.5 * rem),
-            tables.table_style_cmd("leftpadding", 0.5 * rem),
-        ],
-        spaceBefore=1.5 * rem * 0.2,
-        spaceAfter=1.25 * rem * 0.45,
+
+    stylesheet.add(
+        tables.TableStyle(
+            "summary_stats",
+            parent=stylesheet["default"],
+            cmds=[
+                tables.table_style_cmd("alignment", "CENTER"),
+                tables.table_style_cmd("valign", "MIDDLE"),
+                tables.table_style_cmd("rightpadding", 0.5 * rem),
+                tables.table_style_cmd("leftpadding", 0.5 * rem),
+            ],
+            spaceBefore=1.5 * rem * 0.2,
+            spaceAfter=1.25 * rem * 0.45,
+        )
     )
-)
-
-TABLE_STYLES.add(
-    tables.TableStyle(
-        "post_stats",
-        parent=TABLE_STYLES["default"],
-        cmds=[
-            tables.table_style_cmd("alignment", "CENTER"),
-            tables.table_style_cmd("valign", "MIDDLE"),
-            tables.table_style_cmd("rightpadding", 0.25 * rem),
-            tables.table_style_cmd("leftpadding", 0.25 * rem),
-        ],
+
+    stylesheet.add(
+        tables.TableStyle(
+            "post_stats",
+            parent=stylesheet["default"],
+            cmds=[
+                tables.table_style_cmd("alignment", "CENTER"),
+                tables.table_style_cmd("valign", "MIDDLE"),
+                tables.table_style_cmd("rightpadding", 0.25 * rem),
+                tables.table_style_cmd("leftpadding", 0.25 * rem),
+            ],
+        )
     )
-)
-
-TABLE_STYLES.add(
-    tables.TableStyle(
-        "idx",
-        parent=TABLE_STYLES["default"],
-        cmds=[
-            tables.table_style_cmd("valign", "TOP"),
-        ],
+
+    stylesheet.add(
+        tables.TableStyle(
+            "idx",
+            parent=stylesheet["default"],
+            cmds=[
+                tables.table_style_cmd("valign", "TOP"),
+            ],
+        )
     )
-)
+    return stylesheet
 
 
 def get_table_style(name_alias: str) -> tables.TableStyle:
-    return TABLE_STYLES.get(name_alias)
+    return _create_table_stylesheet().get(name_alias)
+
+
+def class_table_style(
+    name_alias: str,
+) -> cached_classproperty[tables.TableStyle]:
+    """Returns a class attribute with a table style, looked up on first access
+    (not at import).
+    """
+    return cached_classproperty(lambda cls: get_table_style(name_alias))
+
+
+def __getattr__(name: str) -> Any:
+    # The stylesheet is created on first use, not at import
+    if name == "TABLE_STYLES":
+        return _create_table_stylesheet()
+    msg = f"module {__name__!r:s} has no attribute {name!r:s}"
+    raise AttributeError(msg)
 
 
-__all__ = ("get_table_style",)
+__all__ = ("class_table_style", "get_table_style")
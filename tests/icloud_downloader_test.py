@@ -0,0 +1,81 @@
+"""iCloud Downloader Tests."""
+
+from collections.abc import Iterator
+import dataclasses
+import datetime
+import json
+import pathlib
+from typing import Any
+
+import pytest
+
+from travelpost import icloud_downloader
+
+
+@dataclasses.dataclass
+class FakeAsset:
+    id: str
+    filename: str
+    size: int
+    created: datetime.datetime = datetime.datetime(
+        2025, 1, 1, tzinfo=datetime.UTC
+    )
+
+
+@pytest.fixture
+def downloader(
+    tmp_path: pathlib.Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> icloud_downloader.ICloudDownloader:
+    assets = [
+        FakeAsset(id=f"id{i:d}", filename=f"IMG_{i:04d}.HEIC", size=i)
+        for i in range(1, 6)
+    ]
+
+    def init(self: icloud_downloader.ICloudIterable, **kwargs: Any) -> None:
+        self._api = None
+        self._album_names = None
+
+    def iter_(
+        self: icloud_downloader.ICloudIterable, **kwargs: Any
+    ) -> Iterator[FakeAsset]:
+        return iter(assets)
+
+    monkeypatch.setattr(icloud_downloader.ICloudIterable, "__init__", init)
+    monkeypatch.setattr(icloud_downloader.ICloudIterable, "iter", iter_)
+    return icloud_downloader.ICloudDownloader(max_workers=2, path=tmp_path)
+
+
+def read_jsonl(path: pathlib.Path) -> list[dict[str, Any]]:
+    with open(path, encoding="utf-8") as f:
+        return [json.loads(line) for line in f]
+
+
+def test_sync_metadata_jsonl(
+    downloader: icloud_downloader.ICloudDownloader,
+    tmp_path: pathlib.Path,
+) -> None:
+    downloader.sync_metadata(output="json")
+    assert len(list((tmp_path / "2025-01-01").glob("*.json"))) == 5
+    assert not (tmp_path / "metadata.jsonl").exists()
+
+    # Flushes twice while syncing, the rest on completion
+    downloader.sync_metadata(output="jsonl", flush_size=2)
+    records = read_jsonl(tmp_path / "metadata.jsonl")
+    assert sorted(r["id"] for r in records) == [f"id{i:d}" for i in range(1, 6)]
+    assert {r["size"] for r in records} == {1, 2, 3, 4, 5}
+
+    # Already synced records are not appended again
+    downloader.sync_metadata(output="jsonl", flush_size=2)
+    assert len(read_jsonl(tmp_path / "metadata.jsonl")) == 5
+
+
+def test_metadata_dataset(tmp_path: pathlib.Path) -> None:
+    dataset = icloud_downloader.MetadataDataset(tmp_path, flush_size=3)
+    for i in range(4):
+        dataset.add({"id": str(i)})
+    assert len(read_jsonl(dataset.path)) == 3
+    dataset.flush()
+    assert [r["id"] for r in read_jsonl(dataset.path)] == ["0", "1", "2", "3"]
+    dataset.flush()
+    assert len(read_jsonl(dataset.path)) == 4
@@ -0,0 +1 @@
+"""iCloud Tests."""
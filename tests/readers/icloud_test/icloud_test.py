@@ -0,0 +1,56 @@
+"""iCloud Tests."""
+
+import json
+import pathlib
+
+import pandas as pd
+
+from travelpost.readers import icloud
+
+
+def write_jsonl(path: pathlib.Path, records: list[dict]) -> None:
+    with open(path, mode="w", encoding="utf-8") as f:
+        f.writelines(json.dumps(r) + "\n" for r in records)
+
+
+def test_metadata_reader(tmp_path: pathlib.Path) -> None:
+    path = tmp_path / "metadata.jsonl"
+    write_jsonl(
+        path,
+        [
+            {
+                "id": "b",
+                "filename": "IMG_0002.HEIC",
+                "asset_date": "2025-01-02 03:04:05+00:00",
+                "size": 2048,
+            },
+            {
+                "id": "a",
+                "filename": "IMG_0001.HEIC",
+                "asset_date": "2025-01-01 03:04:05+00:00",
+                "size": 1024,
+            },
+            {
+                "id": "b",
+                "filename": "IMG_0002.HEIC",
+                "asset_date": "2025-01-02 03:04:05+00:00",
+                "size": 4096,
+            },
+        ],
+    )
+
+    df = icloud.MetadataReader(path).read()
+
+    assert isinstance(df, pd.DataFrame)
+    assert df["id"].tolist() == ["a", "b"]
+    assert df["size"].tolist() == [1024, 4096]
+    assert isinstance(df["asset_date"].dtype, pd.DatetimeTZDtype)
+
+
+def test_metadata_reader_empty(tmp_path: pathlib.Path) -> None:
+    path = tmp_path / "metadata.jsonl"
+    path.touch()
+
+    df = icloud.MetadataReader(path).read()
+
+    assert len(df) == 0
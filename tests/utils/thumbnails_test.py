@@ -0,0 +1,253 @@
+"""Thumbnails Tests."""
+
+import concurrent.futures
+import io
+import json
+import pathlib
+import struct
+from typing import Any
+
+from PIL import Image
+import av
+import cv2
+import numpy as np
+import pytest
+
+from travelpost.utils import thumbnails
+
+
+@pytest.fixture
+def jpeg_path(tmp_path: pathlib.Path) -> pathlib.Path:
+    path = tmp_path / "image.jpg"
+    Image.new("RGB", (4000, 3000), color="goldenrod").save(path)
+    return path
+
+
+@pytest.mark.parametrize("reducing_gap", [None, 3.0])
+@pytest.mark.parametrize(
+    ["fit", "size"],
+    [("contain", (128, 96)), ("cover", (128, 128))],
+)
+def test_image_thumbnail(
+    tmp_path: pathlib.Path,
+    jpeg_path: pathlib.Path,
+    fit: str,
+    size: tuple[int, int],
+    reducing_gap: float | None,
+) -> None:
+    out = tmp_path / "image-thumb.jpg"
+    thumbnails.image_thumbnail(
+        jpeg_path, out, 128, fit=fit, reducing_gap=reducing_gap
+    )
+    with Image.open(out) as img:
+        assert img.size == size
+        r, g, b = img.getpixel((img.width // 2, img.height // 2))
+        assert abs(r - 218) <= 4 and abs(g - 165) <= 4 and abs(b - 32) <= 4
+
+
+def test_image_thumbnail_invalid_fit(
+    tmp_path: pathlib.Path,
+    jpeg_path: pathlib.Path,
+) -> None:
+    with pytest.raises(ValueError, match="invalid fit"):
+        thumbnails.image_thumbnail(
+            jpeg_path, tmp_path / "image-thumb.jpg", 128, fit="fill"
+        )
+
+
+def test_thumbnail_cache(
+    tmp_path: pathlib.Path,
+    jpeg_path: pathlib.Path,
+) -> None:
+    cache = thumbnails.ThumbnailCache(tmp_path / "cache")
+    specs = ((128, "cover"), (64, "contain"))
+
+    assert cache.generate([jpeg_path], specs, max_workers=2) == 2
+    assert cache.manifest(jpeg_path).exists()
+    for size, fit in specs:
+        assert cache.is_fresh(jpeg_path, size, fit=fit)
+    assert cache.generate([jpeg_path], specs, max_workers=2) == 0
+
+    out = cache.get(jpeg_path, 64, fit="contain")
+    with Image.open(out) as img:
+        assert img.size == (64, 48)
+
+    # Reload manifest from disk
+    cache = thumbnails.ThumbnailCache(tmp_path / "cache")
+    assert cache.get(jpeg_path, 64, fit="contain") == out
+
+    Image.new("RGB", (300, 400), color="goldenrod").save(jpeg_path)
+    assert not cache.is_fresh(jpeg_path, 64, fit="contain")
+    out = cache.get(jpeg_path, 64, fit="contain")
+    with Image.open(out) as img:
+        assert img.size == (48, 64)
+    assert cache.generate([jpeg_path], specs) == 1
+
+
+def test_thumbnail_cache_creating_lock(
+    tmp_path: pathlib.Path,
+    jpeg_path: pathlib.Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    cache = thumbnails.ThumbnailCache(tmp_path / "cache")
+    # The lock of the thumbnail is kept until it is registered, threads
+    # arriving in between wait for it instead of creating it again
+    registered = []
+    add = cache._add
+
+    def check_add(key: str, *args: Any) -> None:
+        registered.append(key in cache._creating)
+        add(key, *args)
+
+    monkeypatch.setattr(cache, "_add", check_add)
+    cache.get(jpeg_path, 64)
+    assert registered == [True]
+    assert cache._creating == {}
+
+    # Released on failure
+    def fail(*args: Any, **kwargs: Any) -> None:
+        raise OSError("cannot write")
+
+    monkeypatch.setattr(thumbnails.cache, "create_thumbnail", fail)
+    with pytest.raises(OSError, match="cannot write"):
+        cache.get(jpeg_path, 32)
+    assert cache._creating == {}
+
+
+def test_thumbnail_cache_default_path(
+    tmp_path: pathlib.Path,
+    jpeg_path: pathlib.Path,
+) -> None:
+    cache = thumbnails.ThumbnailCache(flush_size=2)
+    assert cache.directory(jpeg_path) == tmp_path / ".thumbnails"
+
+    # Concurrent requests of a thumbnail create it once
+    with concurrent.futures.ThreadPoolExecutor(max_workers=4) as pool:
+        outs = set(pool.map(lambda _: cache.get(jpeg_path, 64), range(8)))
+    assert len(outs) == 1
+    assert outs.pop().parent == tmp_path / ".thumbnails"
+    assert not cache.manifest(jpeg_path).exists()
+
+    cache.get(jpeg_path, 32)
+    assert cache.manifest(jpeg_path).exists()  # flushed after 2 thumbnails
+    cache.get(jpeg_path, 16)
+    cache.flush()
+    with open(cache.manifest(jpeg_path), encoding="utf-8") as f:
+        assert len(json.load(f)) == 3
+
+
+def test_thumbnail_cache_unsupported(tmp_path: pathlib.Path) -> None:
+    path = tmp_path / "route.gpx"
+    path.touch()
+    cache = thumbnails.ThumbnailCache(tmp_path / "cache")
+
+    assert not thumbnails.is_supported(path)
+    assert cache.generate([path], ((128, "cover"),)) == 0
+    with pytest.raises(TypeError, match="unsupported file format"):
+        cache.get(path, 128)
+
+
+@pytest.fixture
+def video_path(tmp_path: pathlib.Path) -> pathlib.Path:
+    path = tmp_path / "video.mp4"
+    writer = cv2.VideoWriter(
+        str(path), cv2.VideoWriter_fourcc(*"mp4v"), 10.0, (320, 240)
+    )
+    # Moving noise with the frame index as value of the center, the encoder
+    # inserts a keyframe every 12 frames.
+    noise = np.random.default_rng(0).integers(
+        0, 256, (240, 320, 3), dtype=np.uint8
+    )
+    for i in range(30):
+        fr = np.roll(noise, i * 4, axis=1)
+        fr[100:140, 140:180] = i * 8
+        writer.write(fr)
+    writer.release()
+    return path
+
+
+def keyframes(video_path: pathlib.Path) -> list[int]:
+    with av.open(str(video_path)) as container:
+        stream = container.streams.video[0]
+        rate = stream.average_rate * stream.time_base
+        return sorted(
+            int(p.pts * rate)
+            for p in container.demux(stream)
+            if p.is_keyframe and p.pts is not None
+        )
+
+
+def atom(atom_type: bytes, data: bytes) -> bytes:
+    return struct.pack(">I4s", len(data) + 8, atom_type) + data
+
+
+@pytest.mark.parametrize("seek", ["exact", "keyframe"])
+@pytest.mark.parametrize(
+    ["frame", "i"], [("start", 0), ("middle", 15), ("end", 29)]
+)
+def test_cv2_video_thumbnail(
+    video_path: pathlib.Path,
+    frame: str,
+    i: int,
+    seek: str,
+) -> None:
+    if seek == "keyframe":
+        # Nearest keyframe at or before the frame
+        assert keyframes(video_path) == [0, 12, 24]
+        i = max(k for k in keyframes(video_path) if k <= i)
+    img = thumbnails.video.cv2_video_thumbnail(video_path, frame, seek=seek)
+    assert img.size == (320, 240)
+    assert abs(img.getpixel((160, 120))[0] - i * 8) <= 4
+
+
+@pytest.mark.parametrize(
+    ["frame", "i"], [("start", 0), ("middle", 12), ("end", 24)]
+)
+def test_av_keyframe_mkv(tmp_path: pathlib.Path, frame: str, i: int) -> None:
+    # MKV has no frame count, the seek uses the duration
+    path = tmp_path / "video.mkv"
+    with av.open(str(path), mode="w", format="matroska") as container:
+        stream = container.add_stream("mpeg4", rate=10)
+        stream.width, stream.height = 320, 240
+        stream.pix_fmt = "yuv420p"
+        stream.codec_context.gop_size = 12
+        for j in range(30):
+            fr = np.zeros((240, 320, 3), dtype=np.uint8)
+            fr[100:140, 140:180] = j * 8
+            container.mux(
+                stream.encode(av.VideoFrame.from_ndarray(fr, format="rgb24"))
+            )
+        container.mux(stream.encode())
+    assert keyframes(path) == [0, 12, 24]
+
+    img = thumbnails.video.av_keyframe(path, frame)
+    assert abs(img.getpixel((160, 120))[0] - i * 8) <= 4
+
+
+def test_quicktime_poster(
+    tmp_path: pathlib.Path,
+    video_path: pathlib.Path,
+) -> None:
+    assert thumbnails.video.quicktime_poster(video_path) is None
+
+    with io.BytesIO() as f:
+        Image.new("RGB", (200, 100), color="goldenrod").save(f, format="PNG")
+        png = f.getvalue()
+    covr = atom(b"covr", atom(b"data", struct.pack(">II", 14, 0) + png))
+    hdlr = atom(b"hdlr", bytes(25))
+    meta = atom(b"meta", bytes(4) + hdlr + atom(b"ilst", covr))
+    path = tmp_path / "poster.mp4"
+    path.write_bytes(
+        atom(b"ftyp", b"isom")
+        + atom(b"mdat", bytes(64))
+        + atom(b"moov", atom(b"udta", meta))
+    )
+
+    img = thumbnails.video.quicktime_poster(path)
+    assert img is not None
+    assert img.size == (200, 100)
+
+    out = tmp_path / "poster-thumb.jpg"
+    thumbnails.video_thumbnail(path, out, 64, fit="cover")
+    with Image.open(out) as img:
+        assert img.size == (64, 64)
@@ -0,0 +1,68 @@
+"""Asset Bundle Test."""
+
+import os
+import pathlib
+import shutil
+
+import pytest
+from reportlab.graphics.shapes import Drawing
+
+from tests.writers import DATA_PATH
+from travelpost.writers.pdf.libs import bundle
+from travelpost.writers.pdf.libs import flag_icons
+from travelpost.writers.pdf.libs import fontawesome as fa
+from travelpost.writers.pdf.libs.reportlab.libs import svg_drawing
+
+
+def touch(path: pathlib.Path) -> None:
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1))
+
+
+def test_icons_bundle(
+    tmp_path: pathlib.Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    path = tmp_path / "fontawesome"
+    shutil.copytree(DATA_PATH / "fontawesome", path)
+    assert fa.build_icons_bundle(path) == path / "bundle.pickle"
+
+    # Neither the svgs nor the aliases are loaded again
+    shutil.rmtree(path / "svgs")
+    monkeypatch.setattr(fa, "_ICONS", {})
+    monkeypatch.setattr(fa, "FA_ICONS", ())
+    fa.setup_icons(path)
+    assert len(fa.FA_ICONS) > 5
+    icon = fa.fa_icon("home")
+    assert icon.aliases["names"] == ["house"]
+    assert isinstance(svg_drawing(icon.svg_paths["solid"]), Drawing)
+
+    # Outdated bundle
+    touch(path / "metadata" / "icons.json")
+    with pytest.raises(ValueError, match="cannot find svg"):
+        fa.setup_icons(path)
+
+
+def test_flags_bundle(
+    tmp_path: pathlib.Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    path = tmp_path / "flag_icons"
+    shutil.copytree(DATA_PATH / "flag_icons", path)
+    flag_icons.build_flags_bundle(path)
+
+    # Outdated bundle after an svg changed
+    json_path = path / "country.json"
+    assert bundle.load_bundle(path, json_path) is not None
+    touch(path / "flags" / "4x3" / "fr.svg")
+    assert bundle.load_bundle(path, json_path) is None
+    flag_icons.build_flags_bundle(path)
+
+    shutil.rmtree(path / "flags")
+    monkeypatch.setattr(flag_icons, "_FLAGS", {})
+    monkeypatch.setattr(flag_icons, "_FLAGS_BY_NAME", {})
+    monkeypatch.setattr(flag_icons, "COUNTRY_CODES", ())
+    flag_icons.setup_flags(path)
+    flag = flag_icons.flag_by_code("fr")
+    assert flag_icons.flag_by_name("France") is flag
+    assert not flag.flag_4x3.exists()
+    assert isinstance(svg_drawing(flag.flag_4x3), Drawing)
+    assert isinstance(svg_drawing(flag.flag_1x1), Drawing)
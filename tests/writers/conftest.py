@@ -1,16 +1,22 @@
 """PyTest Fixtures."""
 
 from collections.abc import Iterator
+import io
+import random
 
+from PIL import Image
+from PIL import ImageDraw
 import pytest
 
 from tests.writers import DATA_PATH
 from tests.writers import OUT_PATH
 from tests.writers import TXT_PATH
+from travelpost.writers import map
 from travelpost.writers.pdf.libs import country_shapes
 from travelpost.writers.pdf.libs import emoji
 from travelpost.writers.pdf.libs import flag_icons
 from travelpost.writers.pdf.libs import fontawesome as fa
+from travelpost.writers.pdf.libs.reportlab.libs import image_cache
 
 
 def pytest_addoption(parser: pytest.Parser):
@@ -118,4 +124,35 @@ def setup_fa_icons(mock_mode: str) -> int:
 @pytest.fixture(scope="package", autouse=True)
 def temp_dir() -> Iterator[None]:
     OUT_PATH.mkdir(parents=True, exist_ok=True)
+    image_cache.path = OUT_PATH / ".images"
     yield
+    image_cache.path = None
+
+
+@pytest.fixture(scope="package")
+def tile_cache(tmp_path_factory: pytest.TempPathFactory) -> map.TileCache:
+    """Offline cache of (identical) tiles covering Europe up to zoom 8."""
+    cache = map.TileCache(
+        tmp_path_factory.mktemp("tiles"), map.Map.TILES, offline=True
+    )
+    # Navy with random "roads", the detail of map tiles
+    rng = random.Random(0)
+    img = Image.new("RGB", (256, 256), "navy")
+    draw = ImageDraw.Draw(img)
+    for _ in range(8):
+        draw.line(
+            [(rng.randrange(256), rng.randrange(256)) for _ in range(4)],
+            fill=rng.choice(("khaki", "silver", "seagreen")),
+            width=rng.randrange(1, 4),
+        )
+    with io.BytesIO() as f:
+        img.save(f, format="PNG")
+        tile = f.getvalue()
+    for z, x, y in map.tile_cache.iter_tiles(
+        map.Bounds(lat_min=40.0, lon_min=-10.0, lat_max=60.0, lon_max=20.0),
+        map.Map.ZOOM_MIN,
+        8,
+    ):
+        cache.tile_path(z, x, y).parent.mkdir(exist_ok=True, parents=True)
+        cache.tile_path(z, x, y).write_bytes(tile)
+    return cache
@@ -0,0 +1,76 @@
+"""Drawing Test."""
+
+from collections.abc import Iterator
+import os
+import pathlib
+from typing import Any
+
+import pytest
+from reportlab.graphics.shapes import Group
+from reportlab.graphics.shapes import Shape
+from reportlab.lib import colors
+
+from travelpost.writers.pdf.libs.reportlab.libs import drawing
+from travelpost.writers.pdf.libs.reportlab.libs import svg_drawing
+from travelpost.writers.pdf.libs.reportlab.libs import update_drawing_attributes
+
+
+def iter_shapes(node: Shape) -> Iterator[Shape]:
+    yield node
+    if isinstance(node, Group):
+        for child in node.contents:
+            yield from iter_shapes(child)
+
+
+def fill_colors(node: Shape) -> set[str]:
+    return {
+        s.fillColor.hexval()
+        for s in iter_shapes(node)
+        if getattr(s, "fillColor", None) is not None
+    }
+
+
+def test_svg_drawing(
+    tmp_path: pathlib.Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    path = tmp_path / "flag.svg"
+    path.write_text(
+        '<svg xmlns="http://www.w3.org/2000/svg" viewBox="0 0 3 2">'
+        '<rect width="1" height="2" fill="#000091"/>'
+        '<rect x="1" width="1" height="2" fill="#ffffff"/>'
+        '<rect x="2" width="1" height="2" fill="#e1000f"/>'
+        "</svg>",
+        encoding="utf-8",
+    )
+
+    parsed = []
+    svg2rlg = drawing.svg2rlg
+
+    def count_svg2rlg(path: str) -> Any:
+        parsed.append(path)
+        return svg2rlg(path)
+
+    monkeypatch.setattr(drawing, "svg2rlg", count_svg2rlg)
+
+    d1 = svg_drawing(path)
+    d2 = svg_drawing(path)
+    assert len(parsed) == 1
+    assert d1 is not d2
+    assert len(fill_colors(d1)) == 3
+
+    # Changes do not leak into the cache or other copies
+    update_drawing_attributes(d1, fillColor=colors.black)
+    assert fill_colors(d1) == {colors.black.hexval()}
+    assert fill_colors(d2) == fill_colors(svg_drawing(path))
+    assert len(fill_colors(d2)) == 3
+
+    d3 = svg_drawing(path, color_converter=lambda c: colors.red)
+    assert fill_colors(d3) == {colors.red.hexval()}
+    assert len(fill_colors(svg_drawing(path))) == 3
+    assert len(parsed) == 1
+
+    # Parsed again once modified
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1))
+    svg_drawing(path)
+    assert len(parsed) == 2
@@ -2,9 +2,12 @@
 
 import pathlib
 
+from PIL import Image
 import pytest
+from reportlab.pdfgen.canvas import Canvas
 
 from travelpost.writers.pdf.libs import emoji
+from travelpost.writers.pdf.libs.reportlab.platypus import Paragraph
 
 TEST_EMOJI: int = 0x1F600
 
@@ -59,3 +62,65 @@ def test_replace_emoji(text: str, em_codes: list[str], font_size: int) -> None:
             f'<img height="{font_size!s:s}" src="{p!s:s}" '
             f'valign="text-bottom" width="{font_size!s:s}"/>'
         ) in new_text
+
+
+def test_replace_emoji_missing(
+    tmp_path: pathlib.Path,
+    monkeypatch: pytest.MonkeyPatch,
+    caplog: pytest.LogCaptureFixture,
+) -> None:
+    missing = "\U0001f992"  # Giraffe
+    monkeypatch.delitem(emoji.EMOJI, missing, raising=False)
+    emoji.replace_emoji.cache_clear()
+    emoji._log_missing_emoji.cache_clear()
+
+    text = f"Hello {missing:s} {chr(TEST_EMOJI):s} world"
+    new_text = emoji.replace_emoji(text, font_size=12)
+    assert missing in new_text
+    assert chr(TEST_EMOJI) not in new_text
+    emoji.replace_emoji(f"Bye {missing:s}", font_size=12)
+    assert len(caplog.records) == 1
+    assert repr(missing) in caplog.records[0].getMessage()
+
+    # Without emoji library
+    monkeypatch.setattr(emoji, "EMOJI", {})
+    monkeypatch.setattr(emoji, "PATH", tmp_path / "lib" / "emoji")
+    emoji.replace_emoji.cache_clear()
+    assert emoji.replace_emoji(text, font_size=12) == text
+    emoji.replace_emoji.cache_clear()
+
+
+def test_emoji_paragraph(
+    tmp_path: pathlib.Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    png = tmp_path / "emoji.png"
+    Image.new("RGBA", (16, 16), (255, 200, 0, 128)).save(png)
+    monkeypatch.setitem(emoji.EMOJI, chr(TEST_EMOJI), png)
+    emoji.replace_emoji.cache_clear()
+
+    sizes = []
+    for count in (1, 4):
+        text = "text " + " ".join(chr(TEST_EMOJI) for _ in range(count))
+        markup = emoji.replace_emoji(text, font_size=12)
+        # Cached per text and font size
+        assert emoji.replace_emoji(text, font_size=12) is markup
+
+        paragraphs = [Paragraph(markup), Paragraph(markup)]
+        images = {
+            id(f.cbDefn.image)
+            for p in paragraphs
+            for f in p.frags
+            if hasattr(f, "cbDefn")
+        }
+        assert len(images) == 1
+
+        filepath = tmp_path / f"{count:d}.pdf"
+        canvas = Canvas(str(filepath))
+        for i, p in enumerate(paragraphs):
+            p.wrapOn(canvas, 200, 100)
+            p.drawOn(canvas, 0, 100 * i)
+        canvas.save()
+        sizes.append(filepath.read_bytes().count(b"/Subtype /Image"))
+    # Embedded once per document
+    assert sizes[0] == sizes[1] > 0
+    emoji.replace_emoji.cache_clear()
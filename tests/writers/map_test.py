@@ -1,10 +1,14 @@
 """PS Tests."""
 
 import pathlib
+import types
 from typing import Any
 
 from PIL import Image
+import geopandas as gpd
+import numpy as np
 import pytest
+import requests
 
 from tests.writers import IMG_PATH
 from tests.writers import OUT_PATH
@@ -15,6 +19,7 @@ def create_map(
     bounds: map.Bounds | None = None,
     show_only_flight_icons: bool = False,
     styles: map.Styles | None = None,
+    tiles: str | None = None,
 ) -> map.Map:
     return map.Map(
         points=[
@@ -40,6 +45,7 @@ def create_map(
         bounds=bounds,
         show_only_flight_icons=show_only_flight_icons,
         styles=styles,
+        tiles=tiles,
     )
 
 
@@ -184,3 +190,389 @@ def test_print_map_png(i: int, kwargs: dict[str, Any]) -> None:
         kwargs.get("height_pt", 210 * map.units.mm), m.DPI
     )
     assert abs(dpi - 300) <= 1  # rounding error bof png
+
+
+class FakeDriver:
+    def __init__(self) -> None:
+        self.quitted = False
+
+    def quit(self) -> None:
+        self.quitted = True
+
+
+class FakeMap:
+    def __init__(self) -> None:
+        self.driver = None
+
+    def to_png(self, png_out: str, pool: map.BrowserPool) -> None:
+        with pool.driver() as driver:
+            assert not driver.quitted
+            self.driver = driver
+
+
+def test_browser_pool() -> None:
+    drivers = []
+
+    def driver_factory() -> FakeDriver:
+        drivers.append(FakeDriver())
+        return drivers[-1]
+
+    maps = [FakeMap() for _ in range(10)]
+    with map.BrowserPool(size=2, driver_factory=driver_factory) as pool:
+        pool.render((m, f"map_{i:d}.png") for i, m in enumerate(maps))
+        assert 1 <= len(drivers) <= 2
+        assert {id(m.driver) for m in maps} <= {id(d) for d in drivers}
+
+        with pool.driver() as driver:
+            assert driver in drivers
+    assert all(d.quitted for d in drivers)
+
+    with pytest.raises(RuntimeError, match="closed"), pool.driver():
+        pass
+
+
+@pytest.mark.parametrize("cls", [map.Map, map.PrintMap])
+def test_browser_pool_png(cls: type[map.Map]) -> None:
+    maps = [
+        create_map() if cls is map.Map else create_print_map() for _ in range(3)
+    ]
+    png_paths = [
+        OUT_PATH / f"{cls.__name__.lower():s}_pool_{i:d}.png"
+        for i in range(len(maps))
+    ]
+    with map.BrowserPool(size=2) as pool:
+        pool.render(zip(maps, png_paths, strict=True))
+    for png_path in png_paths:
+        w, h, _ = read_png_info(png_path)
+        assert w > 0
+        assert h > 0
+
+
+def test_tile_cache(tmp_path: pathlib.Path) -> None:
+    assert map.tile_cache.tile_xy(0.0, 0.0, 0) == (0, 0)
+    assert map.tile_cache.tile_xy(52.520008, 13.404954, 10) == (550, 335)
+    bounds = map.Bounds(lat_min=48.0, lon_min=2.0, lat_max=53.0, lon_max=14.0)
+    tiles = list(map.tile_cache.iter_tiles(bounds, 2, 6))
+    assert len(tiles) == map.tile_cache.count_tiles(bounds, 2, 6)
+    assert (6, 34, 21) in tiles
+
+    cache = map.TileCache(tmp_path, map.Map.TILES, offline=True)
+    cache.tile_path(6, 34, 21).parent.mkdir(parents=True)
+    cache.tile_path(6, 34, 21).write_bytes(b"\x89PNG tile")
+    assert cache.get(6, 34, 21) == b"\x89PNG tile"
+    with pytest.raises(KeyError, match="missing tile"):
+        cache.get(6, 34, 22)
+    assert cache.prefetch(bounds, 2, 6) == 0
+    with pytest.raises(ValueError, match="too many tiles"):
+        cache.prefetch(bounds, 2, 17)
+
+
+def test_tile_cache_prefetch(
+    tmp_path: pathlib.Path,
+    monkeypatch: pytest.MonkeyPatch,
+    caplog: pytest.LogCaptureFixture,
+) -> None:
+    bounds = map.Bounds(lat_min=48.0, lon_min=2.0, lat_max=53.0, lon_max=14.0)
+    count = map.tile_cache.count_tiles(bounds, 2, 6)
+
+    def get(self: requests.Session, url: str, **kwargs: Any) -> Any:
+        # Every third tile fails
+        if sum(int(v) for v in url.split("/")[-3:]) % 3 == 0:
+            raise requests.ConnectionError(url)
+        resp = requests.Response()
+        resp.status_code = 200
+        resp._content = b"\x89PNG tile"
+        return resp
+
+    monkeypatch.setattr(requests.Session, "get", get)
+    cache = map.TileCache(tmp_path, "https://tiles.test/{z}/{x}/{y}")
+    failed = sum(
+        sum(t) % 3 == 0 for t in map.tile_cache.iter_tiles(bounds, 2, 6)
+    )
+    assert 0 < failed < count
+
+    # The failures do not stop the prefetch
+    assert cache.prefetch(bounds, 2, 6) == count - failed
+    assert f"Could not prefetch {failed:d} of {count:d} tiles" in caplog.text
+    assert cache.prefetch(bounds, 2, 6) == 0
+
+
+def test_tile_server(tmp_path: pathlib.Path) -> None:
+    cache = map.TileCache(tmp_path, map.Map.TILES, offline=True)
+    cache.tile_path(1, 0, 1).parent.mkdir(parents=True)
+    cache.tile_path(1, 0, 1).write_bytes(b"\x89PNG tile")
+
+    with map.TileServer(cache) as server:
+        url = server.url
+        assert url.startswith("http://127.0.0.1:")
+        resp = requests.get(url.format(z=1, x=0, y=1), timeout=5.0)
+        assert resp.status_code == 200
+        assert resp.headers["Content-Type"] == "image/png"
+        assert resp.content == b"\x89PNG tile"
+        resp = requests.get(url.format(z=1, x=1, y=1), timeout=5.0)
+        assert resp.status_code == 404
+
+        m = create_map(tiles=url)
+        assert url in m.map.get_root().render()
+
+    with pytest.raises(RuntimeError, match="not running"):
+        _ = server.url
+
+
+def test_simplify() -> None:
+    # Dense, slightly noisy line from Paris to Berlin
+    locations = [
+        (48.864716 + 3.655292 * t + 1e-5 * (i % 2), 2.349014 + 11.05594 * t)
+        for i, t in enumerate(x / 999 for x in range(1000))
+    ]
+    simplified = map.simplify.simplify(locations, zoom=6)
+    assert 2 <= len(simplified) < 10
+    assert simplified[0] == pytest.approx(locations[0])
+    assert simplified[-1] == pytest.approx(locations[-1])
+    assert len(map.simplify.simplify(locations, zoom=25)) > 10
+
+    bounds = map.Bounds(lat_min=48.0, lon_min=2.0, lat_max=53.0, lon_max=14.0)
+    assert 6 < map.simplify.fit_zoom(bounds, (1920, 1080)) < 8
+
+
+def test_map_simplify() -> None:
+    m = map.Map(
+        points=[
+            map.Point(lat=48.0 + i / 1000, lon=2.0 + i / 100, transport="car")
+            for i in range(1000)
+        ],
+        posts=[],
+        simplify_tolerance=0.5,
+    )
+    html = m.map.get_root().render()
+    assert html.count("L.Travel.segment(") == 1
+    assert "L.Travel.levelOfDetail" not in html
+
+    # A larger map keeps more points of the route
+    m.viewport = (4 * 1920, 4 * 1080)
+    large_html = m.map.get_root().render()
+    assert large_html.count("L.Travel.segment(") == 1
+    assert len(large_html) > len(html)
+
+    m = map.Map(
+        points=m._points,
+        posts=[],
+        simplify_tolerance=0.5,
+        lod=True,
+    )
+    html = m.map.get_root().render()
+    assert "L.Travel.levelOfDetail" in html
+    assert html.count("L.Travel.segment(") == len(
+        range(map.Map.ZOOM_MIN, map.Map.ZOOM_MAX + 1, map.Map.LOD_ZOOM_STEP)
+    )
+
+
+def test_map_points() -> None:
+    m = create_map()
+    assert m._split_segments() == [
+        (
+            "flight",
+            [
+                (48.864716, 13.404954),
+                (52.520008, 13.404954),
+                (48.864716, 2.349014),
+            ],
+        ),
+        ("car", [(48.864716, 2.349014), (51.509865, -0.118092)]),
+    ]
+    assert m.bounds == map.Bounds(
+        lat_min=48.864716,
+        lon_min=-0.118092,
+        lat_max=52.520008,
+        lon_max=13.404954,
+    )
+
+    # A million points
+    n = 1_000_000
+    rng = np.random.default_rng(0)
+    lat_lon = rng.uniform((-60.0, -90.0), (15.0, -30.0), size=(n, 2))
+    points = map.Points(
+        lat_lon=lat_lon, transport=np.repeat(["car", "flight"], n // 2)
+    )
+    bounds = map.Bounds(
+        lat_min=-56.0, lon_min=-81.5, lat_max=12.5, lon_max=-34.5
+    )
+    clipped = points.clip(bounds)
+    assert 0 < len(clipped) < n
+    assert bounds.contains(clipped[0].lat, clipped[0].lon)
+    m = map.Map(clipped, [])
+    assert m._points is clipped
+    assert bounds.contains(m.bounds.lat_min, m.bounds.lon_min)
+    assert bounds.contains(m.bounds.lat_max, m.bounds.lon_max)
+    assert [t for t, _ in m._split_segments()] == ["car", "flight"]
+
+    # GeoDataFrame of the readers (x: lon, y: lat)
+    gdf = gpd.GeoDataFrame(
+        {"transport": ["car", None, None]},
+        geometry=gpd.points_from_xy([2.0, 3.0, 4.0], [48.0, 49.0, 50.0]),
+        crs="EPSG:4326",
+    )
+    m = map.Map(gdf, [])
+    assert list(m._points) == [
+        map.Point(lat=48.0, lon=2.0, transport="car"),
+        map.Point(lat=49.0, lon=3.0, transport="unknown"),
+        map.Point(lat=50.0, lon=4.0, transport="unknown"),
+    ]
+    assert m.bounds == map.Bounds(
+        lat_min=48.0, lon_min=2.0, lat_max=50.0, lon_max=4.0
+    )
+
+
+@pytest.mark.parametrize("cls", [map.Map, map.PrintMap])
+def test_raster_map_png(cls: type[map.Map], tile_cache: map.TileCache) -> None:
+    m = create_map() if cls is map.Map else create_print_map()
+    png_path = OUT_PATH / f"raster_{cls.__name__.lower():s}.png"
+    m.to_png(png_path, tile_cache=tile_cache)
+    w, h, dpi = read_png_info(png_path)
+    assert (w, h) == ((3508, 2480) if cls is map.PrintMap else (1920, 1080))
+    assert abs(dpi - 300) <= 1  # rounding error bof png
+
+    with Image.open(png_path) as img:
+        colors = {c for _, c in img.getcolors(maxcolors=w * h)}
+        assert (0, 0, 128) in colors  # tiles
+        assert (255, 255, 255) in colors  # route
+
+    m = create_map()
+    img = m.to_image(tile_cache, width=800, height=600)
+    assert img.size == (800, 600)
+
+
+def test_raster_map_marker_draft(
+    tile_cache: map.TileCache, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    # Marker photos are reduced before any conversion decodes them in full
+    convert = Image.Image.convert
+    converted = []
+
+    def spy_convert(self: Image.Image, *args: Any, **kwargs: Any) -> Any:
+        converted.append(self.format)
+        return convert(self, *args, **kwargs)
+
+    monkeypatch.setattr(Image.Image, "convert", spy_convert)
+    create_map().to_image(tile_cache, width=800, height=600)
+    assert "JPEG" not in converted
+
+
+def test_render_mini_maps(
+    tmp_path: pathlib.Path,
+    tile_cache: map.TileCache,
+) -> None:
+    posts = [
+        map.Post(name="Berlin", lat=52.520008, lon=13.404954),
+        map.Post(name="Paris", lat=48.864716, lon=2.349014),
+        map.Post(name="Rome", lat=41.902782, lon=12.496366),
+    ]
+    specs = [
+        map.MiniMapSpec(
+            out=tmp_path / f"mini_map_{i:d}.png",
+            post=post,
+            points=(
+                []
+                if i == 0
+                else [
+                    map.Point(lat=p.lat, lon=p.lon, transport="car")
+                    for p in (posts[i - 1], post)
+                ]
+            ),
+        )
+        for i, post in enumerate(posts)
+    ]
+    specs.append(
+        map.MiniMapSpec(
+            out=tmp_path / "missing" / "mini_map.png",
+            post=posts[0],
+        )
+    )
+    assert map.render_mini_maps(specs, tile_cache=tile_cache) == [
+        spec.out for spec in specs[:3]
+    ]
+    for spec in specs[:3]:
+        w, h, dpi = read_png_info(spec.out)
+        assert (w, h) == (945, 591)
+        assert abs(dpi - 300) <= 1  # rounding error bof png
+
+    html = map.MiniMap.from_spec(specs[1]).map.get_root().render()
+    assert "L.Travel.segments(" in html
+    assert "house" not in html
+    assert map.render_mini_maps([]) == []
+
+
+def test_polyline() -> None:
+    locations = [(38.5, -120.2), (40.7, -120.95), (43.252, -126.453)]
+    encoded = map.polyline.encode(locations)
+    assert encoded == "_p~iF~ps|U_ulLnnqC_mqNvxq`@"
+    assert map.polyline.decode(encoded) == locations
+    assert map.polyline.encode([]) == ""
+
+
+def test_map_encode_segments() -> None:
+    points = [
+        map.Point(
+            lat=48.0 + i / 1000,
+            lon=2.0 + i / 100,
+            transport="flight" if i < 500 else "car",
+        )
+        for i in range(1000)
+    ]
+    html = map.Map(points, []).map.get_root().render()
+    assert html.count("L.Travel.segment(") == 2
+
+    m = map.Map(points, [], encode_segments=True)
+    encoded_html = m.map.get_root().render()
+    assert "L.Travel.segment(" not in encoded_html
+    assert encoded_html.count("L.Travel.segments(") == 1
+    assert '[["flight", 501], ["car", 500]]' in encoded_html
+    assert len(encoded_html) < len(html)
+
+
+class FakeRenderDriver(FakeDriver):
+    def __init__(self) -> None:
+        super().__init__()
+        self.scripts = []
+        self.screenshot_as_png = b"\x89PNG map"
+        self.timeouts = types.SimpleNamespace(script=30.0)
+
+    def execute_script(self, script: str, *args: Any) -> list[int]:
+        return list(args)
+
+    def execute_async_script(self, script: str) -> bool:
+        self.scripts.append(script)
+        return True
+
+    def find_element(self, by: str, value: str) -> "FakeRenderDriver":
+        return self
+
+    def get(self, url: str) -> None:
+        pass
+
+    def set_script_timeout(self, timeout: float) -> None:
+        self.timeouts.script = timeout
+
+    def set_window_size(self, width: int, height: int) -> None:
+        pass
+
+
+def test_to_png_ready(caplog: pytest.LogCaptureFixture) -> None:
+    driver = FakeRenderDriver()
+    with caplog.at_level("INFO", logger=map.png.__name__):
+        png = map.png.to_png(create_map().map, driver=driver, size=(800, 600))
+    assert png == b"\x89PNG map"
+    assert driver.scripts == [map.png.READY_SCRIPT]
+    assert not driver.quitted
+    assert driver.timeouts.script == 30.0
+    (record,) = (r for r in caplog.records if hasattr(r, "timings"))
+    assert set(record.timings) == {
+        "render_html",
+        "page_load",
+        "tile_wait",
+        "screenshot",
+    }
+    assert "L.Travel.whenTilesReady" in map.png.READY_SCRIPT
+
+    with pytest.warns(DeprecationWarning, match="poll_frequency"):
+        map.png.to_png(create_map().map, 0.5, driver=driver, size=(800, 600))
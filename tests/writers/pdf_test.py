@@ -1,11 +1,40 @@
 """PDF Tests."""
 
+import base64
+from collections.abc import Iterator
 import datetime as dt
+import logging
+import pathlib
+import re
+import subprocess
+import sys
+import threading
+from typing import Any
+import weakref
+import zlib
+
+from PIL import Image
+import numpy as np
+import pytest
+from reportlab.lib.units import cm
+from reportlab.pdfgen.canvas import Canvas
 
 from tests.writers import IMG_COVER_PATH
+from tests.writers import IMG_PATH
 from tests.writers import MAP_PATH
 from tests.writers import OUT_PATH
+from travelpost.writers import map
 from travelpost.writers.pdf import Book
+from travelpost.writers.pdf import PostSpec
+from travelpost.writers.pdf import header_footer
+from travelpost.writers.pdf.flowables import paragraphs
+from travelpost.writers.pdf.libs.reportlab.libs import image
+from travelpost.writers.pdf.libs.reportlab.libs import image_cache
+from travelpost.writers.pdf.libs.reportlab.libs.pdf import SIZE_CATEGORIES
+from travelpost.writers.pdf.libs.reportlab.platypus import DocTemplate
+from travelpost.writers.pdf.libs.reportlab.platypus import ImageFlowable
+from travelpost.writers.pdf.libs.reportlab.platypus import doc_template
+from travelpost.writers.pdf.post.flowables.photo_grid import justify_rows
 
 
 def test_page_template_id() -> None:
@@ -22,6 +51,48 @@ def test_page_template_id() -> None:
             assert "frame" in frame.id
 
 
+def test_pdf_import_time() -> None:
+    stub = pathlib.Path(paragraphs.__file__).with_suffix(".pyi")
+    mtime_ns = stub.stat().st_mtime_ns
+    code = (
+        "import travelpost.writers.pdf\n"
+        "from travelpost.writers.pdf import styles, table_styles\n"
+        "assert styles._create_stylesheet.cache_info().currsize == 0\n"
+        "assert table_styles._create_table_stylesheet.cache_info().currsize "
+        "== 0\n"
+    )
+    result = subprocess.run(
+        [
+            sys.executable,
+            "-X",
+            "importtime",
+            "-W",
+            "error::UserWarning",
+            "-c",
+            code,
+        ],
+        capture_output=True,
+        check=True,
+        text=True,
+    )
+    assert stub.stat().st_mtime_ns == mtime_ns
+
+    # import time: self [us] | cumulative [us] | imported package
+    times = {
+        name.strip(): int(cumulative)
+        for _, cumulative, name in (
+            line.removeprefix("import time:").split("|")
+            for line in result.stderr.splitlines()
+            if line.startswith("import time:") and "[us]" not in line
+        )
+    }
+    styles_time = sum(
+        times[f"travelpost.writers.pdf.{m:s}"]
+        for m in ("styles", "table_styles", "flowables.paragraphs")
+    )
+    assert styles_time < 50_000
+
+
 def test_pdf(example_text: str) -> None:
     start_date = dt.date(2025, 1, 14)
     end_date = dt.date(2025, 8, 25)
@@ -77,6 +148,7 @@ def test_pdf(example_text: str) -> None:
         text=example_text,
         weather_condition="sunny",
         weather_temperature=22.0,
+        map_path=MAP_PATH,
     )
     book.add_index()
     book.add_back_cover(
@@ -85,3 +157,593 @@ def test_pdf(example_text: str) -> None:
     )
     book.save()
     assert filepath.exists()
+
+
+def iter_pdf_streams(path: pathlib.Path) -> Iterator[tuple[bytes, bytes]]:
+    """Yields the `(dictionary, decoded data)` of the streams of a PDF."""
+    data = path.read_bytes()
+    for m in re.finditer(
+        rb"\d+ 0 obj((?:(?!endobj).)*?)stream\r?\n(.*?)endstream", data, re.S
+    ):
+        header = m[1]
+        # Binary streams may end with whitespace
+        length = re.search(rb"/Length (\d+)\b", header)
+        body = m[2][: int(length[1])] if length is not None else m[2].strip()
+        if b"/ASCII85Decode" in header:
+            body = base64.a85decode(body.removesuffix(b"~>"))
+        if b"/FlateDecode" in header:
+            body = zlib.decompress(body)
+        yield header, body
+
+
+def test_pdf_vector_map(
+    tile_cache: map.TileCache, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    # Alternating flights & drives, every flight is marked with a plane
+    m = map.PrintMap(
+        points=[
+            map.Point(
+                lat=42.0 + i / 2,
+                lon=-8.0 + i,
+                transport="flight" if (i // 3) % 2 == 0 else "car",
+            )
+            for i in range(24)
+        ],
+        posts=[
+            map.Post(name="Berlin", lat=52.520008, lon=13.404954),
+            map.Post(name="Paris", lat=48.9, lon=2.3, image_path=IMG_PATH),
+        ],
+    )
+    renderer = m.renderer(tile_cache, width=1754, height=1240)
+    render_tiles = renderer.render_tiles
+    tile_renders = []
+
+    def count_render_tiles() -> Image.Image:
+        tile_renders.append(1)
+        return render_tiles()
+
+    renderer.render_tiles = count_render_tiles
+
+    # Marker photos are reduced before any conversion decodes them in full
+    convert = Image.Image.convert
+    converted = []
+
+    def spy_convert(self: Image.Image, *args: Any, **kwargs: Any) -> Any:
+        converted.append(self.format)
+        return convert(self, *args, **kwargs)
+
+    monkeypatch.setattr(Image.Image, "convert", spy_convert)
+
+    filepath = OUT_PATH / "TestBookVectorMap.pdf"
+    book = Book(filepath, "John Doe", title="Travel Post")
+    book.add_table_of_contents(num_columns=1)
+    book.add_map(map_renderer=renderer)
+    book.save()
+
+    # Tiles are rendered once for all build passes
+    assert len(tile_renders) == 1
+    assert "JPEG" not in converted
+
+    streams = list(iter_pdf_streams(filepath))
+    images = [h for h, _ in streams if b"/Subtype /Image" in h]
+    assert len(images) == 2  # tiles & post image
+    # Route as paths, icons as forms defined once & drawn per marker
+    (content,) = (d for _, d in streams if b" Do" in d and b" l" in d)
+    assert content.count(b" l\n") == 8  # one path per segment
+    planes = re.findall(rb"/FormXob\.(map_icon_plane_\w+) Do", content)
+    assert len(planes) == 4
+    assert len(set(planes)) == 1
+    forms = [h for h, _ in streams if b"/Subtype /Form" in h]
+    assert len(forms) == len(set(re.findall(rb"/FormXob\.(\w+) Do", content)))
+
+    png_path = OUT_PATH / "TestBookVectorMap.png"
+    m.to_png(
+        png_path,
+        width_pt=297 * map.units.mm / 2,
+        height_pt=210 * map.units.mm / 2,
+        tile_cache=tile_cache,
+    )
+    raster_filepath = OUT_PATH / "TestBookRasterMap.pdf"
+    book = Book(raster_filepath, "John Doe", title="Travel Post")
+    book.add_table_of_contents(num_columns=1)
+    book.add_map(map_path=png_path)
+    book.save()
+    assert filepath.stat().st_size < raster_filepath.stat().st_size
+
+
+def image_sizes(path: pathlib.Path) -> list[tuple[int, int]]:
+    return [
+        (
+            int(re.search(rb"/Width (\d+)", h)[1]),
+            int(re.search(rb"/Height (\d+)", h)[1]),
+        )
+        for h, _ in iter_pdf_streams(path)
+        if b"/Subtype /Image" in h
+    ]
+
+
+def test_pdf_image_dpi(tmp_path: pathlib.Path) -> None:
+    # 24 MP photo as map
+    img_path = tmp_path / "photo.jpg"
+    rng = np.random.default_rng(0)
+    Image.fromarray(
+        rng.integers(0, 256, size=(4000, 6000, 3), dtype=np.uint8)
+    ).save(img_path)
+
+    for image_dpi in (None, 150):
+        book = Book(
+            tmp_path / f"{image_dpi!s:s}.pdf",
+            "John Doe",
+            title="Travel Post",
+            image_dpi=image_dpi,
+        )
+        book.add_map(map_path=img_path)
+        book.save()
+
+    assert image_sizes(tmp_path / "None.pdf") == [(6000, 4000)]
+    # Cropped to the page (cover)
+    ((width, height),) = image_sizes(tmp_path / "150.pdf")
+    page_width, page_height = Book.DEFAULT_PAGESIZE
+    assert width == pytest.approx(page_width / 72 * 150, abs=1)
+    assert height == pytest.approx(page_height / 72 * 150, abs=1)
+    assert (tmp_path / "150.pdf").stat().st_size < (
+        tmp_path / "None.pdf"
+    ).stat().st_size / 10
+
+    # Contained in 10 x 10 cm
+    filepath = tmp_path / "contain.pdf"
+    canvas = Canvas(str(filepath))
+    flowable = ImageFlowable(img_path, fit="contain", dpi=300)
+    flowable.wrapOn(canvas, 10 * cm, 10 * cm)
+    flowable.drawOn(canvas, 0, 0)
+    canvas.save()
+    ((width, height),) = image_sizes(filepath)
+    assert width == pytest.approx(10 / 2.54 * 300, abs=1)
+    assert height == pytest.approx(10 / 2.54 * 300 * 4000 / 6000, abs=1)
+
+
+def test_pdf_image_cache(
+    tmp_path: pathlib.Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setattr(image_cache, "path", tmp_path / ".images")
+    prepared = []
+    prepare_image = image.prepare_image
+
+    def count_prepare_image(*args: Any, **kwargs: Any) -> None:
+        prepared.append(args[0])
+        prepare_image(*args, **kwargs)
+
+    monkeypatch.setattr(image, "prepare_image", count_prepare_image)
+
+    for i, image_dpi in enumerate((150, 150, 300, None)):
+        book = Book(
+            tmp_path / f"{i:d}.pdf",
+            "John Doe",
+            title="Travel Post",
+            image_dpi=image_dpi,
+        )
+        book.add_table_of_contents(num_columns=1)
+        book.add_map(map_path=MAP_PATH)
+        book.save()
+    # Once for all passes & builds of the same size
+    assert prepared == [MAP_PATH] * 3
+    assert len(list((tmp_path / ".images").glob("*.jpg"))) == 3
+
+
+def test_justify_rows() -> None:
+    aspect_ratios = [1.5, 0.75, 1.0, 1.5, 1.5, 2.0, 0.75, 1.5, 1.0]
+    rows = justify_rows(aspect_ratios, 500, 100, gap=5, max_height=150)
+
+    assert rows[0].start == 0
+    assert rows[-1].end == len(aspect_ratios)
+    assert all(a.end == b.start for a, b in zip(rows, rows[1:], strict=False))
+    # Every row (but the last) fills the width
+    for row in rows[:-1]:
+        ratios = aspect_ratios[row.start : row.end]
+        width = sum(ratios) * row.height + 5 * (len(ratios) - 1)
+        assert width == pytest.approx(500)
+        assert 50 < row.height < 150
+    assert rows[-1].height <= 100
+
+    # Single portrait photo
+    assert justify_rows([0.5], 500, 100, max_height=150) == ((0, 1, 100),)
+    assert justify_rows([0.6, 4.0], 100, 100, max_height=150) == (
+        (0, 1, 150),
+        (1, 2, 25),
+    )
+
+
+def test_pdf_photo_grid(
+    tmp_path: pathlib.Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setattr(image_cache, "path", tmp_path / ".images")
+    rng = np.random.default_rng(0)
+    photos = []
+    for i in range(40):
+        width, height = rng.choice([(600, 400), (400, 600), (500, 500)])
+        photos.append(tmp_path / f"photo_{i:d}.jpg")
+        Image.fromarray(
+            rng.integers(0, 256, size=(height, width, 3), dtype=np.uint8)
+        ).save(photos[-1])
+
+    read = []
+    read_jpeg_info = image.read_jpeg_info
+
+    def count_read_jpeg_info(*args: Any, **kwargs: Any) -> Any:
+        read.append(args[0])
+        return read_jpeg_info(*args, **kwargs)
+
+    monkeypatch.setattr(image, "read_jpeg_info", count_read_jpeg_info)
+
+    book = Book(
+        tmp_path / "book.pdf", "John Doe", title="Travel Post", image_dpi=72
+    )
+    book.add_table_of_contents(num_columns=1)
+    book.add_post(
+        datetime=dt.datetime(2025, 4, 1, hour=10),
+        start_date=dt.date(2025, 1, 14),
+        end_date=dt.date(2025, 8, 25),
+        location=(13.404954, 52.520008),
+        country_code="de",
+        title="Post",
+        text="Text",
+        images=photos,
+    )
+    book.save()
+
+    # Laid out over several pages, the headers are read once for all passes
+    assert sorted(read) == sorted(photos)
+    assert len(image_sizes(tmp_path / "book.pdf")) >= len(photos)
+    pages = int(
+        re.search(rb"/Count (\d+) /Kids", (tmp_path / "book.pdf").read_bytes())[
+            1
+        ]
+    )
+    assert pages >= 4
+
+
+def test_pdf_optimize(
+    tmp_path: pathlib.Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setattr(image_cache, "path", tmp_path / ".images")
+    # The same photo from another file
+    back_cover_path = tmp_path / "back_cover.jpg"
+    back_cover_path.write_bytes(IMG_COVER_PATH.read_bytes())
+
+    books = {}
+    for optimize in (False, True):
+        books[optimize] = book = Book(
+            tmp_path / f"{optimize!s:s}.pdf",
+            "John Doe",
+            title="Travel Post",
+            image_dpi=150,
+            optimize=optimize,
+        )
+        book.add_front_cover(
+            dt.date(2025, 1, 14), dt.date(2025, 8, 25), IMG_COVER_PATH
+        )
+        book.add_table_of_contents(num_columns=1)
+        book.add_summary(
+            country_codes=["gb", "fr", "de"],
+            description="Traveled through Europe",
+            end_date=dt.date(2025, 8, 25),
+            start_date=dt.date(2025, 1, 14),
+            peaks={"Peak 1 - France": 882},
+            photo_count=123,
+            post_count=2,
+            total_distance=12345.6,
+        )
+        book.add_back_cover(back_cover_path, "https://example.com/travel/blog")
+        book.save()
+
+    assert books[False].size_report is None
+    streams = {
+        optimize: list(iter_pdf_streams(tmp_path / f"{optimize!s:s}.pdf"))
+        for optimize in (False, True)
+    }
+    # The photo is embedded once, binary instead of ASCII85-encoded
+    images = {
+        optimize: [b for h, b in streams[optimize] if b"/Subtype /Image" in h]
+        for optimize in (False, True)
+    }
+    assert len(images[False]) == 1
+    assert images[True] == images[False]
+    data = (tmp_path / "True.pdf").read_bytes()
+    assert b"/ASCII85Decode" not in data
+
+    # Cross-reference stream and object streams
+    assert data.startswith(b"%PDF-1.5")
+    ((xref_header, xref),) = [
+        (h, b) for h, b in streams[True] if b"/Type /XRef" in h
+    ]
+    width = int(re.search(rb"/W \[1 (\d+) 2\]", xref_header)[1])
+    entries = [xref[i : i + width + 3] for i in range(0, len(xref), width + 3)]
+    assert len(entries) == int(re.search(rb"/Size (\d+)", xref_header)[1])
+    for num, entry in enumerate(entries):
+        if entry[0] == 1:
+            offset = int.from_bytes(entry[1 : width + 1], "big")
+            assert data[offset:].startswith(b"%d 0 obj" % num)
+    assert sum(entry[0] == 2 for entry in entries) > 0
+
+    report = books[True].size_report
+    assert tuple(report) == SIZE_CATEGORIES
+    assert sum(report.values()) == len(data)
+    assert max(report, key=report.get) == "images"
+    assert report["forms"] > 0
+    assert len(data) < 0.85 * (tmp_path / "False.pdf").stat().st_size
+
+
+def test_pdf_image_cache_path(
+    tmp_path: pathlib.Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setattr(image_cache, "path", None)
+    photos = tmp_path / "photos"
+    photos.mkdir()
+    photo = photos / "map.jpg"
+    photo.write_bytes(MAP_PATH.read_bytes())
+
+    # The photo folders are not written to
+    book = Book(
+        tmp_path / "out" / "book.pdf",
+        "John Doe",
+        title="Travel Post",
+        image_dpi=72,
+    )
+    book.add_map(map_path=photo)
+    book.save()
+    assert list(photos.iterdir()) == [photo]
+    assert len(list((tmp_path / "out" / ".images").glob("*.jpg"))) == 1
+
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path / "cache"))
+    assert image.ImageCache().directory(photo) == (
+        tmp_path / "cache" / "travelpost" / "images"
+    )
+    # Opt-in
+    cache = image.ImageCache(tmp_path / "images", next_to_sources=True)
+    assert cache.directory(photo) == photos / ".images"
+
+
+def test_pdf_header_footer_cache(
+    tmp_path: pathlib.Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    footers = []
+
+    class CountingFooter(header_footer.PageLabelFooter):
+        def __init__(self, text: str) -> None:
+            footers.append(text)
+            super().__init__(text=text)
+
+    monkeypatch.setattr(header_footer, "PageLabelFooter", CountingFooter)
+
+    headers = []
+    wrap_header = header_footer.HeaderMixin._wrap_header.__func__
+
+    def count_wrap_header(cls: type, *args: Any) -> Any:
+        headers.append(args)
+        return wrap_header(cls, *args)
+
+    monkeypatch.setattr(
+        header_footer.HeaderMixin,
+        "_wrap_header",
+        classmethod(count_wrap_header),
+    )
+
+    def build(name: str) -> int:
+        book = Book(tmp_path / name, "John Doe", title="Travel Post")
+        book.add_table_of_contents(num_columns=1)
+        book.add_summary(
+            country_codes=["gb", "fr", "de"],
+            description="Traveled through Europe",
+            end_date=dt.date(2025, 8, 25),
+            start_date=dt.date(2025, 1, 14),
+            peaks={"Peak 1 - France": 882},
+            photo_count=123,
+            post_count=2,
+            total_distance=12345.6,
+        )
+        book.save()
+        return book._doc.page
+
+    # Created once per page label and heading, reused in the next passes
+    pages = build("book.pdf")
+    assert 0 < len(footers) == len(set(footers)) <= pages
+    assert 0 < len(headers) == len(set(headers)) < len(footers)
+
+    # Scoped to the document
+    build("book_2.pdf")
+    assert len(footers) == 2 * len(set(footers))
+
+
+def test_pdf_layout_passes(
+    tmp_path: pathlib.Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    draws = []
+    draw = ImageFlowable.draw
+
+    def count_draw(self: ImageFlowable) -> None:
+        draws.append(self)
+        draw(self)
+
+    monkeypatch.setattr(ImageFlowable, "draw", count_draw)
+
+    counts = {}
+    for layout_passes in (True, False):
+        draws.clear()
+        book = Book(
+            tmp_path / f"{layout_passes!s:s}.pdf",
+            "John Doe",
+            title="Travel Post",
+            layout_passes=layout_passes,
+        )
+        book.add_table_of_contents(num_columns=1)
+        book.add_map(map_path=MAP_PATH)
+        book.save()
+        counts[layout_passes] = len(draws)
+
+    # Drawn in the final pass only (the table of contents needs 2+ passes)
+    assert counts[True] == 1
+    assert counts[False] > 1
+    assert image_sizes(tmp_path / "True.pdf") == image_sizes(
+        tmp_path / "False.pdf"
+    )
+
+    # Rendered in one pass without indexing flowables
+    passes = []
+    build_pass = DocTemplate._build_pass
+
+    def count_build_pass(self: DocTemplate, *args: Any, **kwargs: Any) -> None:
+        passes.append(self.layout_only)
+        build_pass(self, *args, **kwargs)
+
+    monkeypatch.setattr(DocTemplate, "_build_pass", count_build_pass)
+    draws.clear()
+    book = Book(tmp_path / "map.pdf", "John Doe", title="Travel Post")
+    book.add_map(map_path=MAP_PATH)
+    book.save()
+    assert passes == [False]
+    assert len(draws) == 1
+    assert image_sizes(tmp_path / "map.pdf") == image_sizes(
+        tmp_path / "False.pdf"
+    )
+
+
+def test_pdf_workers(
+    example_text: str,
+    tmp_path: pathlib.Path,
+    caplog: pytest.LogCaptureFixture,
+) -> None:
+    caplog.set_level(logging.INFO, logger=doc_template.__name__)
+    start_date = dt.date(2025, 1, 14)
+    end_date = dt.date(2025, 8, 25)
+
+    for workers in (1, 3):
+        book = Book(
+            tmp_path / f"{workers:d}.pdf",
+            "John Doe",
+            title="Travel Post",
+            workers=workers,
+        )
+        book.add_front_cover(start_date, end_date, IMG_COVER_PATH)
+        book.add_table_of_contents(num_columns=1)
+        book.add_map(map_path=MAP_PATH)
+        for i in range(2):
+            book.add_post(
+                dt.datetime(2025, 4 + i, 23, hour=10),
+                start_date,
+                end_date,
+                (13.404954, 52.520008),
+                "de",
+                f"Post {i:d}",
+                text=example_text,
+                map_path=MAP_PATH,
+            )
+        book.add_index()
+        book.add_back_cover(IMG_COVER_PATH, "https://example.com/travel/blog")
+        book.save()
+
+    # Merged from 3 parts, with the same pages, links, outlines and resources
+    assert re.search(r"Rendering \d+ pages in 3 parts", caplog.text)
+    sequential = (tmp_path / "1.pdf").read_bytes()
+    merged = (tmp_path / "3.pdf").read_bytes()
+    for pattern in (rb"/Count (\d+) /Kids", rb"/PageLabels", rb"/Outlines"):
+        assert re.findall(pattern, sequential) == re.findall(pattern, merged)
+    assert sequential.count(b"/Link") == merged.count(b"/Link")
+    assert {b for _, b in iter_pdf_streams(tmp_path / "1.pdf")} == {
+        b for _, b in iter_pdf_streams(tmp_path / "3.pdf")
+    }
+    # Shared fonts & images are written once
+    assert len(merged) < len(sequential) * 1.05
+
+
+def test_pdf_workers_no_fork(
+    tmp_path: pathlib.Path,
+    monkeypatch: pytest.MonkeyPatch,
+    caplog: pytest.LogCaptureFixture,
+) -> None:
+    def build() -> None:
+        book = Book(
+            tmp_path / "book.pdf", "John Doe", title="Travel Post", workers=3
+        )
+        book.add_table_of_contents(num_columns=1)
+        book.add_map(map_path=MAP_PATH)
+        book.save()
+
+    monkeypatch.setattr(sys, "platform", "darwin")
+    build()
+    assert "Cannot fork processes on 'darwin'" in caplog.text
+    monkeypatch.undo()
+
+    stop = threading.Event()
+    thread = threading.Thread(target=stop.wait)
+    thread.start()
+    try:
+        build()
+    finally:
+        stop.set()
+        thread.join()
+    assert "running threads" in caplog.text
+    assert "Rendering" not in caplog.text
+
+
+def test_pdf_streamed_posts(
+    example_text: str,
+    tmp_path: pathlib.Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    start_date = dt.date(2025, 1, 14)
+    end_date = dt.date(2025, 8, 25)
+    posts = [
+        PostSpec(
+            datetime=dt.datetime(2025, 4, 1 + i, hour=10),
+            start_date=start_date,
+            end_date=end_date,
+            location=(13.404954, 52.520008),
+            country_code="de",
+            title=f"Post {i:d}",
+            text=example_text,
+        )
+        for i in range(12)
+    ]
+
+    # Only the flowables of the current post (and the one before) are alive
+    alive = weakref.WeakSet()
+    max_alive = 0
+    post_flowables = Book._post_flowables
+
+    def track_post_flowables(post: PostSpec) -> tuple[Any, ...]:
+        nonlocal max_alive
+        flows = post_flowables(post)
+        alive.update(flows)
+        max_alive = max(max_alive, len(alive))
+        return flows
+
+    monkeypatch.setattr(
+        Book, "_post_flowables", staticmethod(track_post_flowables)
+    )
+
+    for streamed in (False, True):
+        book = Book(
+            tmp_path / f"{streamed!s:s}.pdf", "John Doe", title="Travel Post"
+        )
+        book.add_table_of_contents(num_columns=1)
+        if streamed:
+            max_alive = 0
+            book.add_posts(iter(posts))
+        else:
+            for post in posts:
+                book.add_post(**vars(post))
+            assert len(alive) == sum(
+                len(post_flowables(post)) for post in posts
+            )
+        book.add_index()
+        book.save()
+
+    assert max_alive <= 2 * len(post_flowables(posts[0]))
+    assert re.findall(
+        rb"/Count (\d+) /Kids", (tmp_path / "True.pdf").read_bytes()
+    ) == re.findall(
+        rb"/Count (\d+) /Kids", (tmp_path / "False.pdf").read_bytes()
+    )
+    assert {b for _, b in iter_pdf_streams(tmp_path / "True.pdf")} == {
+        b for _, b in iter_pdf_streams(tmp_path / "False.pdf")
+    }